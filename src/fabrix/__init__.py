@@ -1,25 +1,66 @@
 from collections.abc import Sequence
 from typing import Any, overload
 
+from fabrix.compiler import CompiledExpression, compile_expression
 from fabrix.console import generate_context_output
-from fabrix.context import Context
-from fabrix.evaluate import evaluate
+from fabrix.context import Context, FrozenContext
+from fabrix.evaluate import RowResult, evaluate, evaluate_many
+from fabrix.memo import MemoTable
+from fabrix.profiler import ProfileReport, profile
 from fabrix.schemas import Expression
 from fabrix.version import __version__
 
 __all__: list[str] = [
+    "CompiledExpression",
     "Context",
     "Expression",
+    "FrozenContext",
+    "MemoTable",
+    "ProfileReport",
+    "RowResult",
+    "compile",
     "evaluate",
+    "evaluate_many",
+    "profile",
     "__version__",
 ]
 
 
+def compile(expression: str, optimize: bool = True) -> CompiledExpression:
+    """
+    Compile an expression once for repeated evaluation.
+
+    Parsing and validation happen only here; `CompiledExpression.evaluate`
+    walks the resulting syntax tree against any number of contexts.
+
+    Parameters
+    ----------
+    expression : str
+        The expression to compile.
+    optimize : bool, default True
+        Whether to pre-evaluate constant sub-expressions and share common sub-expressions.
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled expression.
+
+    Raises
+    ------
+    ExpressionSyntaxError
+        If the expression is syntactically invalid.
+    FunctionNotFoundError
+        If the expression calls a function that is not registered.
+    """
+    return compile_expression(expression, optimize=optimize)
+
+
 @overload
 def run(
     *expressions: Expression,
     context: Context | None = ...,
     show_output: bool = ...,
+    trace: bool | None = ...,
 ) -> Any: ...
 
 
@@ -28,6 +69,7 @@ def run(
     *expressions: str,
     context: Context | None = ...,
     show_output: bool = ...,
+    trace: bool | None = ...,
 ) -> Any: ...
 
 
@@ -36,6 +78,7 @@ def run(
     *expressions: str | Expression,
     context: Context | None = ...,
     show_output: bool = ...,
+    trace: bool | None = ...,
 ) -> Any: ...
 
 
@@ -43,6 +86,7 @@ def run(
     *expressions: Expression | str,
     context: Context | None = None,
     show_output: bool = False,
+    trace: bool | None = None,
 ) -> Any:
     """
     Evaluate a sequence of expressions (strings or `Expression` objects).
@@ -63,6 +107,8 @@ def run(
         Evaluation context. If omitted, a fresh `Context()` is created.
     show_output : bool, default False
         If True, prints Rich traces for any expression.
+    trace : bool, optional
+        Whether to record traces. Defaults to `Context.trace`.
 
     Returns
     -------
@@ -92,7 +138,7 @@ def run(
 
     result = None
     for expression in create_expressions(expressions):
-        result = evaluate(expression, context)
+        result = evaluate(expression, context, trace=trace)
         if expression.variable:
             context.set_variable(expression.variable, result)
 
@@ -0,0 +1,115 @@
+"""
+Compile expressions once into a reusable syntax tree.
+"""
+
+from typing import Any
+
+from fabrix.context import Context, FrozenContext
+from fabrix.frame import EvaluationFrame
+from fabrix.memo import MemoTable
+from fabrix.nodes import Node
+from fabrix.optimizer import eliminate_common_subexpressions, fold_constants
+from fabrix.parser import parse
+from fabrix.validations import validate_syntax
+
+
+class CompiledExpression:
+    """
+    An expression parsed once and ready to be evaluated against many contexts.
+
+    Compiled expressions are immutable; all state of an evaluation lives in a
+    per-call `EvaluationFrame`, so they can be evaluated from many threads at once.
+
+    Attributes
+    ----------
+    expression : str
+        The original expression text.
+    root : Node
+        The root node of the syntax tree.
+    slot_count : int
+        Number of common sub-expressions, each evaluated once per evaluation.
+    """
+
+    __slots__ = ("expression", "root", "slot_count")
+
+    def __init__(self, expression: str, root: Node, slot_count: int = 0) -> None:
+        self.expression = expression
+        self.root = root
+        self.slot_count = slot_count
+
+    def evaluate(
+        self,
+        context: Context | FrozenContext | None = None,
+        title: str | None = None,
+        trace: bool | None = None,
+        memo: bool | MemoTable = False,
+    ) -> Any:
+        """
+        Evaluate the compiled expression in a given context.
+
+        Parameters
+        ----------
+        context : Context | FrozenContext, optional
+            The context for evaluation. If omitted, a fresh `Context()` is created.
+        title : str, optional
+            Title of the trace recorded in the context.
+        trace : bool, optional
+            Whether to record a trace. Defaults to `Context.trace`.
+        memo : bool | MemoTable, default False
+            Memoize pure function calls: True uses a table for this evaluation only,
+            a `MemoTable` is shared with other evaluations (e.g. of a batch).
+
+        Returns
+        -------
+        Any
+            The result of evaluation.
+        """
+        context = context or Context()
+        expression_trace = context.add_trace(title, trace=trace)
+        try:
+            memo_table = MemoTable() if memo is True else memo if isinstance(memo, MemoTable) else None
+            return self.root.evaluate(EvaluationFrame(context, expression_trace, memo_table, self.slot_count))
+        except Exception as exc:
+            expression_trace.add_error(label=self.expression, message=str(exc))
+            raise
+        finally:
+            context.close_trace(expression_trace)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # pickled as its text and recompiled on load, so functions are looked up in the loading process
+        return compile_expression, (self.expression,)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.expression!r})"
+
+
+def compile_expression(expression: str, optimize: bool = True) -> CompiledExpression:
+    """
+    Validate and parse an expression into a `CompiledExpression`.
+
+    Parameters
+    ----------
+    expression : str
+        The expression to compile.
+    optimize : bool, default True
+        Whether to pre-evaluate constant sub-expressions and share common
+        sub-expressions (see `fabrix.optimizer`).
+
+    Returns
+    -------
+    CompiledExpression
+        The compiled expression.
+
+    Raises
+    ------
+    ExpressionSyntaxError
+        If the expression is syntactically invalid.
+    FunctionNotFoundError
+        If the expression calls a function that is not registered.
+    """
+    validate_syntax(expression)
+    root = parse(expression)
+    if not optimize:
+        return CompiledExpression(expression, root)
+    root, slot_count = eliminate_common_subexpressions(fold_constants(root))
+    return CompiledExpression(expression, root, slot_count)
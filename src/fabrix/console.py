@@ -6,7 +6,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from fabrix.context import Context
+from fabrix.context import Context, FrozenContext
 
 
 def repr_value(val: Any) -> str:
@@ -48,7 +48,7 @@ def table_from_dict(data: dict[str, Any], with_types: bool) -> Table:
     return table
 
 
-def generate_variable_panel(context: Context) -> Panel:
+def generate_variable_panel(context: Context | FrozenContext) -> Panel:
     table = table_from_dict(context.variables, with_types=True)
     return Panel(
         table,
@@ -58,7 +58,7 @@ def generate_variable_panel(context: Context) -> Panel:
     )
 
 
-def generate_parameters_panel(context: Context) -> Panel:
+def generate_parameters_panel(context: Context | FrozenContext) -> Panel:
     table = table_from_dict(context.pipeline_parameters, with_types=True)
     return Panel(
         table,
@@ -68,7 +68,7 @@ def generate_parameters_panel(context: Context) -> Panel:
     )
 
 
-def generate_scope_panel(context: Context) -> Panel:
+def generate_scope_panel(context: Context | FrozenContext) -> Panel:
     table = table_from_dict(context.pipeline_scope_variables.model_dump(by_alias=True), with_types=False)
     return Panel(
         table,
@@ -78,11 +78,11 @@ def generate_scope_panel(context: Context) -> Panel:
     )
 
 
-def generate_expressions_panel(context: Context) -> Panel:
+def generate_expressions_panel(context: Context | FrozenContext) -> Panel:
     group = Group()
     number_of_traces = len(context._traces_)
     for index, trace in enumerate(context._traces_):
-        group.renderables.append(trace.root)
+        group.renderables.append(trace.render())
 
         if index < number_of_traces - 1:
             group.renderables.append(Text(""))
@@ -95,7 +95,7 @@ def generate_expressions_panel(context: Context) -> Panel:
     )
 
 
-def generate_context_output(context: Context) -> None:
+def generate_context_output(context: Context | FrozenContext) -> None:
     console = Console()
 
     left_panels = Group(
@@ -109,3 +109,6 @@ def generate_context_output(context: Context) -> None:
     group = Group(top_row, bottom_panel)
 
     console.print(group)
+
+    if context.trace_retention == "render":
+        context.clear_traces()
@@ -1,13 +1,20 @@
 import copy
+import os
 import random
+import time
 import uuid
+from collections import ChainMap, deque
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timezone
-from typing import Any, Literal
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field, PrivateAttr
 from rich.text import Text
 from rich.tree import Tree
 
+from fabrix import lazyjson
+
 
 def random_name(prefix="Pipeline") -> str:
     return f"{prefix}_{random.randint(10000, 99999)}"
@@ -104,119 +111,193 @@ class Scope(BaseModel):
         KeyError
             If the alias does not exist.
         """
+        field_name = _SCOPE_ALIASES.get(alias)
+        if field_name is None:
+            raise KeyError(f"Alias {alias!r} not found in {self.__class__.__name__}.")
+        return getattr(self, field_name)
+
+    def by_alias(self) -> dict[str, str | None]:
+        """
+        Return all values keyed by their aliases (e.g. `RunId`).
+
+        Returns
+        -------
+        dict[str, str | None]
+            The values by alias.
+        """
+        return {alias: getattr(self, field_name) for alias, field_name in _SCOPE_ALIASES.items()}
+
+
+# Field names of the scope variables by alias, e.g. "RunId" -> "run_id"
+_SCOPE_ALIASES: dict[str, str] = {field.alias or name: name for name, field in Scope.model_fields.items()}
+
 
-        for field_name, model_field in Scope.model_fields.items():
-            if model_field.alias == alias:
-                return getattr(self, field_name)
-        raise KeyError(f"Alias {alias!r} not found in {self.__class__.__name__}.")
+class TraceNodeKind(StrEnum):
+    ROOT = "root"
+    PARSE = "parse"
+    FUNCTION = "function"
+    VARIABLE = "variable"
+    SCOPE = "scope"
+    PARAMETER = "parameter"
+    ACTIVITY = "activity"
+    ITEM = "item"
+    LITERAL = "literal"
+    ERROR = "error"
+    MESSAGE = "message"
 
 
 class ExpressionTraceback:
-    """Build and render a tree-like traceback of expression parsing and evaluation.
+    """Record a tree-like traceback of expression parsing and evaluation.
 
-    This class uses `rich.tree.Tree` and `rich.text.Text` to build a styled,
-    hierarchical tree representation of an expression evaluation process.
-    Nodes are created for parse steps, functions, variables, parameters,
-    literals, and errors. It can be used to trace evaluation logic in a
-    readable, colored console format.
+    Nodes are recorded in flat, parallel arrays (kind, label, parent index,
+    result reference, span, detail) while the expression is evaluated.
+    The styled `rich.tree.Tree` is only built on demand by `render()` (or
+    the `root` property), so recording stays cheap and traces can be
+    serialized with `to_dict()`.
 
     Attributes
     ----------
     title : str
         Default root title for the tree ("Expression").
-    _root : Tree
-        Root node of the expression tree.
-    _active_node : Tree
-        Currently active node where children will be appended.
-    stack : list[Tree]
-        Stack of active tree nodes for nesting control.
+    kinds : list[TraceNodeKind]
+        Kind of every node. Index 0 is the root node.
+    labels : list[str]
+        Label of every node.
+    parents : list[int]
+        Index of the parent of every node (-1 for the root).
+    results : list[Any]
+        Result of every node, or None if the node has no result.
+    spans : list[tuple[int, int] | None]
+        Source span of every node, if known.
+    details : list[str | None]
+        Additional label text (e.g. the path of an activity lookup).
+    stack : list[int]
+        Stack of active node indices for nesting control.
+    timed : bool
+        Whether start and end times are recorded for every node.
+    starts : list[int]
+        Start time of every node (`time.perf_counter_ns`), only if `timed`.
+    ends : list[int]
+        End time of every node (when it was popped off the stack), only if `timed`.
     """
 
     title: str = "Expression"
+    enabled: bool = True
+    has_error: bool = False
 
-    def __init__(self, title: str | None = None) -> None:
-        """Initialize the expression traceback tree.
+    def __init__(self, title: str | None = None, timed: bool = False) -> None:
+        """Initialize the expression traceback.
 
         Parameters
         ----------
         title : str | None, optional
             Optional title for the root node. Defaults to "Expression".
+        timed : bool, default False
+            If True, record high-resolution start and end times of every node.
         """
-        self._root = Tree(Text(title or self.title, style="bold cyan"))
-        self._active_node = self._root
-        self.stack: list[Tree] = [self._root]
+        self.timed = timed
+        self.starts: list[int] = [time.perf_counter_ns()] if timed else []
+        self.ends: list[int] = [0] if timed else []
+        self.kinds: list[TraceNodeKind] = [TraceNodeKind.ROOT]
+        self.labels: list[str] = [title or self.title]
+        self.parents: list[int] = [-1]
+        self.results: list[Any] = [None]
+        self.spans: list[tuple[int, int] | None] = [None]
+        self.details: list[str | None] = [None]
+        self.stack: list[int] = [0]
+        self._rendered: tuple[int, Tree] | None = None
+
+    def __len__(self) -> int:
+        return len(self.kinds)
 
     @property
     def root(self) -> Tree:
-        """Return the root tree node."""
-        return self._root
+        """Return the rendered root tree node."""
+        return self.render()
 
-    def _get_or_create(self, mode: Literal["get", "create"]) -> Tree:
-        """Get the active node or create a new child node.
+    def _add(
+        self,
+        kind: TraceNodeKind,
+        label: str | Text,
+        result: Any | None = None,
+        span: tuple[int, int] | None = None,
+        detail: str | Text | None = None,
+        push: bool = True,
+    ) -> int:
+        """Record a new node below the active node.
 
         Parameters
         ----------
-        mode : {"get", "create"}
-            If "get", returns the current active node.
-            If "create", creates a new child node and makes it active.
+        kind : TraceNodeKind
+            The node kind.
+        label : str | Text
+            The node label.
+        result : Any | None, optional
+            Result of the node.
+        span : tuple[int, int] | None, optional
+            Source span of the node.
+        detail : str | Text | None, optional
+            Additional label text.
+        push : bool, default True
+            If True, the new node becomes the active node.
 
         Returns
         -------
-        Tree
-            The retrieved or newly created tree node.
+        int
+            The index of the new node.
         """
-        if mode == "get":
-            return self._active_node
+        index = len(self.kinds)
+        self.kinds.append(kind)
+        self.labels.append(str(label))
+        self.parents.append(self.stack[-1])
+        self.results.append(result)
+        self.spans.append(span)
+        self.details.append(None if detail is None else str(detail))
+        if self.timed:
+            now = time.perf_counter_ns()
+            self.starts.append(now)
+            self.ends.append(now)
+        if push:
+            self.stack.append(index)
+        return index
 
-        parent = self.stack[-1]
-        child = parent.add(Text())
-        self.stack.append(child)
-        self._active_node = child
-        return child
+    def pop(self) -> None:
+        """Pop the last node off the stack if not at the root."""
+        if len(self.stack) > 1:
+            index = self.stack.pop()
+            if self.timed:
+                self.ends[index] = time.perf_counter_ns()
 
-    def _set_node_label(
-        self,
-        node: Tree,
-        label: Text,
-        result: Any | None = None,
-        result_style: str | None = None,
-    ) -> None:
-        """Set the label of a tree node, optionally appending a result.
+    def duration(self, index: int) -> int:
+        """Return the duration of a node in nanoseconds (0 if the trace is not timed).
 
         Parameters
         ----------
-        node : Tree
-            The node to set the label for.
-        label : Text
-            The label text.
-        result : Any | None, optional
-            Result value to append to the label.
-        result_style : str | None, optional
-            Style to apply to the result text.
-        """
-        node.label = label
-        if result is not None:
-            node.label = label.append(f" ➜ {result!r}", style=result_style)
+        index : int
+            The node index.
 
-    def pop(self) -> None:
-        """Pop the last node off the stack if not at the root."""
-        if len(self.stack) > 1:
-            self.stack.pop()
-            self._active_node = self.stack[-1]  # <-- keep active node in sync
+        Returns
+        -------
+        int
+            Time between recording the node and popping it off the stack.
+        """
+        if not self.timed:
+            return 0
+        return self.ends[index] - self.starts[index]
 
-    def add_parse_node(self, label: str | Text) -> None:
+    def add_parse_node(self, label: str | Text, span: tuple[int, int] | None = None) -> None:
         """Add a parse step node.
 
         Parameters
         ----------
         label : str | Text
             Label for the parse step.
+        span : tuple[int, int] | None, optional
+            Source span of the parsed expression.
         """
-        label = Text(f"Parse: {label}", style="yellow")
-        node = self._get_or_create("create")
-        self._set_node_label(node, label)
+        self._add(TraceNodeKind.PARSE, label, span=span)
 
-    def add_function_node(self, label: str | Text, result: Any | None = None, node: Tree | None = None) -> Tree:
+    def add_function_node(self, label: str | Text, result: Any | None = None, node: int | None = None) -> int:
         """Add a function node with optional result.
 
         Parameters
@@ -225,17 +306,19 @@ class ExpressionTraceback:
             Function name label.
         result : Any | None, optional
             Result of the function call.
-        node : Tree | None, optional
-            Existing node to use instead of creating one.
+        node : int | None, optional
+            Existing node to update instead of creating one.
 
         Returns
         -------
-        Tree
-            The created or reused function node.
+        int
+            The index of the created or updated function node.
         """
-        label = Text("Function: ", style="magenta").append(Text(f"{label}", style="white"))
-        node = node if node else self._get_or_create("create")
-        self._set_node_label(node, label, result, result_style="green")
+        if node is None:
+            node = self._add(TraceNodeKind.FUNCTION, label, result)
+        else:
+            self.labels[node] = str(label)
+            self.results[node] = result
 
         if result is not None:
             self.pop()
@@ -252,12 +335,7 @@ class ExpressionTraceback:
         result : Any | None, optional
             Evaluated value of the variable.
         """
-        label = (
-            Text("variables('", style="blue").append(Text(f"{label}", style="white")).append(Text("')", style="blue"))
-        )
-        node = self._get_or_create("create")
-        self._set_node_label(node, label, result, result_style="green")
-        self.pop()
+        self._add(TraceNodeKind.VARIABLE, label, result, push=False)
 
     def add_scope_node(self, label: str | Text, result: Any | None = None) -> None:
         """Add a pipeline scope node (e.g., `pipeline().<scope>`).
@@ -269,10 +347,7 @@ class ExpressionTraceback:
         result : Any | None, optional
             Evaluated value of the pipeline scope.
         """
-        label = Text("pipeline().", style="blue").append(Text(f"{label}", style="white"))
-        node = self._get_or_create("create")
-        self._set_node_label(node, label, result, result_style="green")
-        self.pop()
+        self._add(TraceNodeKind.SCOPE, label, result, push=False)
 
     def add_parameter_node(self, label: str | Text, result: Any | None = None) -> None:
         """Add a pipeline parameter node (e.g., `pipeline().parameters.<param>`).
@@ -284,40 +359,80 @@ class ExpressionTraceback:
         result : Any | None, optional
             Evaluated value of the pipeline parameter.
         """
-        label = Text("pipeline().parameters.", style="blue").append(Text(f"{label}", style="white"))
-        node = self._get_or_create("create")
-        self._set_node_label(node, label, result, result_style="green")
-        self.pop()
+        self._add(TraceNodeKind.PARAMETER, label, result, push=False)
 
     def add_activity_node(
-        self, label: str | Text, path: str | Text, result: Any | None = None, node: Tree | None = None
-    ) -> Tree:
-        label = (
-            Text("activity('", style="blue")
-            .append(Text(f"{label}", style="white"))
-            .append(Text("').output", style="blue"))
-            .append(Text(f"{path}", style="white"))
-        )
-        node = node if node else self._get_or_create("create")
-        self._set_node_label(node, label, result, result_style="green")
+        self, label: str | Text, path: str | Text, result: Any | None = None, node: int | None = None
+    ) -> int:
+        """Add an activity output node (e.g., `activity('<name>').output<path>`).
+
+        Parameters
+        ----------
+        label : str | Text
+            Activity name.
+        path : str | Text
+            Path into the activity output.
+        result : Any | None, optional
+            Resolved value of the path.
+        node : int | None, optional
+            Existing node to update instead of creating one.
+
+        Returns
+        -------
+        int
+            The index of the created or updated activity node.
+        """
+        if node is None:
+            node = self._add(TraceNodeKind.ACTIVITY, label, result, detail=path)
+        else:
+            self.labels[node] = str(label)
+            self.details[node] = str(path)
+            self.results[node] = result
+
+        if result is not None:
+            self.pop()
+
+        return node
+
+    def add_item_node(self, path: str | Text, result: Any | None = None, node: int | None = None) -> int:
+        """Add a ForEach item node (e.g., `item()<path>`).
+
+        Parameters
+        ----------
+        path : str | Text
+            Path into the item.
+        result : Any | None, optional
+            Resolved value of the path.
+        node : int | None, optional
+            Existing node to update instead of creating one.
+
+        Returns
+        -------
+        int
+            The index of the created or updated item node.
+        """
+        if node is None:
+            node = self._add(TraceNodeKind.ITEM, "item()", result, detail=path)
+        else:
+            self.details[node] = str(path)
+            self.results[node] = result
 
         if result is not None:
             self.pop()
 
         return node
 
-    def add_literal_node(self, label: str | Text) -> None:
+    def add_literal_node(self, label: str | Text, span: tuple[int, int] | None = None) -> None:
         """Add a literal value node.
 
         Parameters
         ----------
         label : str | Text
             Literal value as text.
+        span : tuple[int, int] | None, optional
+            Source span of the literal.
         """
-        label = Text(f"{label}", style="green")
-        node = self._get_or_create("create")
-        self._set_node_label(node, label)
-        self.pop()
+        self._add(TraceNodeKind.LITERAL, label, span=span, push=False)
 
     def add_error(self, label: str, message: str, span: tuple[int, int] | None = None) -> None:
         """Add an error node to the tree.
@@ -334,39 +449,175 @@ class ExpressionTraceback:
         span : tuple[int, int] | None, optional
             Optional (start, end) indices to highlight the error span.
         """
-        if span:
+        self.has_error = True
+        error_node = self._add(TraceNodeKind.ERROR, label, span=span, push=False)
+        self.stack.append(error_node)
+        self._add(TraceNodeKind.MESSAGE, message, push=False)
+        self.stack.pop()
+        self.pop()
+
+    def render(self) -> Tree:
+        """Build the styled Rich tree of the recorded nodes.
+
+        The tree is cached until new nodes are recorded.
+
+        Returns
+        -------
+        Tree
+            The root node of the rendered tree.
+        """
+        if self._rendered is not None and self._rendered[0] == len(self.kinds):
+            return self._rendered[1]
+
+        trees: list[Tree] = []
+        for index, kind in enumerate(self.kinds):
+            label = self._render_label(index, kind)
+            if index == 0:
+                trees.append(Tree(label))
+            else:
+                trees.append(trees[self.parents[index]].add(label))
+
+        self._rendered = (len(self.kinds), trees[0])
+        return trees[0]
+
+    def _render_label(self, index: int, kind: TraceNodeKind) -> Text:
+        """Build the styled label of a single node."""
+        label = self.labels[index]
+
+        if kind is TraceNodeKind.ROOT:
+            return Text(label, style="bold cyan")
+        if kind is TraceNodeKind.PARSE:
+            return Text(f"Parse: {label}", style="yellow")
+        if kind is TraceNodeKind.LITERAL:
+            return Text(label, style="green")
+        if kind is TraceNodeKind.MESSAGE:
+            return Text(label, style="red")
+        if kind is TraceNodeKind.ERROR:
+            span = self.spans[index]
+            if not span:
+                return Text(label, style="bold red")
             start, end = span
             error_text = Text(label[:start])
             error_text.append(label[start:end], style="bold red")
             error_text.append(label[end:])
+            return error_text
+
+        if kind is TraceNodeKind.FUNCTION:
+            text = Text("Function: ", style="magenta").append(Text(label, style="white"))
+        elif kind is TraceNodeKind.VARIABLE:
+            text = Text("variables('", style="blue").append(Text(label, style="white")).append(Text("')", style="blue"))
+        elif kind is TraceNodeKind.SCOPE:
+            text = Text("pipeline().", style="blue").append(Text(label, style="white"))
+        elif kind is TraceNodeKind.PARAMETER:
+            text = Text("pipeline().parameters.", style="blue").append(Text(label, style="white"))
+        elif kind is TraceNodeKind.ITEM:
+            text = Text("item()", style="blue").append(Text(self.details[index] or "", style="white"))
         else:
-            error_text = Text(label, style="bold red")
-        error_node = self.stack[-1].add(error_text)
-        error_msg_text = Text(message, style="red")
-        error_node.add(error_msg_text)
-        self.pop()
+            text = (
+                Text("activity('", style="blue")
+                .append(Text(label, style="white"))
+                .append(Text("').output", style="blue"))
+                .append(Text(self.details[index] or "", style="white"))
+            )
+
+        result = self.results[index]
+        if result is not None:
+            text.append(f" ➜ {result!r}", style="green")
+        return text
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the trace.
 
+        Results are represented by their `repr()`. Timed traces also contain
+        the duration of every node in nanoseconds.
 
-class Context(BaseModel):
+        Returns
+        -------
+        dict[str, Any]
+            The title and the list of recorded nodes.
+        """
+        return {
+            "title": self.labels[0],
+            "nodes": [
+                {
+                    "kind": str(self.kinds[index]),
+                    "label": self.labels[index],
+                    "parent": self.parents[index],
+                    "result": None if self.results[index] is None else repr(self.results[index]),
+                    "span": self.spans[index],
+                    "detail": self.details[index],
+                    **({"duration_ns": self.duration(index)} if self.timed else {}),
+                }
+                for index in range(len(self.kinds))
+            ],
+        }
+
+
+class NullTraceback(ExpressionTraceback):
+    """A traceback that records nothing.
+
+    Used when tracing is disabled, so evaluation does no work and no
+    allocation for traces. All `add_*` methods are no-ops.
     """
-    Holds evaluation context, including variables, pipeline parameters, pipeline scope variables, and data.
 
-    Attributes
-    ----------
-    variables : dict[str, Any]
-        User variables available via variables('xyz').
-    pipeline_parameters : dict[str, Any]
-        Parameters provided by the pipeline, available via pipeline().parameters.xyz.
-    pipeline_scope_variables : Scope
-        Built-in pipeline-level variables (see below).
+    enabled: bool = False
+
+    def pop(self) -> None:
+        pass
+
+    def add_parse_node(self, label: str | Text, span: tuple[int, int] | None = None) -> None:
+        pass
+
+    def add_function_node(self, label: str | Text, result: Any | None = None, node: int | None = None) -> int:
+        return 0
+
+    def add_variable_node(self, label: str | Text, result: Any | None = None) -> None:
+        pass
+
+    def add_scope_node(self, label: str | Text, result: Any | None = None) -> None:
+        pass
+
+    def add_parameter_node(self, label: str | Text, result: Any | None = None) -> None:
+        pass
+
+    def add_activity_node(
+        self, label: str | Text, path: str | Text, result: Any | None = None, node: int | None = None
+    ) -> int:
+        return 0
+
+    def add_item_node(self, path: str | Text, result: Any | None = None, node: int | None = None) -> int:
+        return 0
+
+    def add_literal_node(self, label: str | Text, span: tuple[int, int] | None = None) -> None:
+        pass
+
+    def add_error(self, label: str, message: str, span: tuple[int, int] | None = None) -> None:
+        pass
+
+
+# Shared instance used whenever tracing is disabled
+NULL_TRACE = NullTraceback()
+
+
+class _ContextBase:
     """
+    Lookups and trace storage shared by `Context` and `FrozenContext`.
 
-    activities: dict[str, Any] = Field(default_factory=dict)
-    variables: dict[str, Any] = Field(default_factory=dict)
-    pipeline_parameters: dict[str, Any] = Field(default_factory=dict)
-    pipeline_scope_variables: Scope = Scope()
+    Subclasses provide the `activities`, `variables`, `pipeline_parameters`,
+    `item`, `trace`, `trace_limit` and `trace_retention` attributes and the
+    `_traces_` deque.
+    """
 
-    _traces_: list[ExpressionTraceback] = PrivateAttr(default_factory=list)
+    if TYPE_CHECKING:
+        activities: dict[str, Any]
+        variables: dict[str, Any]
+        pipeline_parameters: dict[str, Any]
+        item: Any
+        trace: bool
+        trace_limit: int | None
+        trace_retention: Literal["all", "errors", "render"]
+        _traces_: deque[ExpressionTraceback]
+        _active_trace: ExpressionTraceback
 
     def set_activity_output(self, activity_name: str, output: Any) -> None:
         """
@@ -374,6 +625,22 @@ class Context(BaseModel):
         """
         self.activities.setdefault(activity_name, {}).update({"output": output})
 
+    def set_activity_output_from_file(self, activity_name: str, path: str | os.PathLike[str]) -> None:
+        """
+        Store an activity's output from a JSON file without parsing it up front.
+
+        The file is memory-mapped, and only the parts referenced by
+        `activity(...).output` paths are parsed (see `fabrix.lazyjson`).
+
+        Parameters
+        ----------
+        activity_name : str
+            The activity name.
+        path : str | os.PathLike
+            Path of the JSON file holding the output payload.
+        """
+        self.set_activity_output(activity_name, lazyjson.load(path))
+
     def get_activity_output(self, name: str) -> Any:
         """
         Retrieve the `.output` object for a given activity.
@@ -388,38 +655,45 @@ class Context(BaseModel):
 
         return activity.get("output")
 
-    def get_pipeline_scope_variable(
-        self,
-        name: Literal[
-            "DataFactory",
-            "Pipeline",
-            "RunId",
-            "TriggerId",
-            "TriggerName",
-            "TriggerTime",
-            "GroupId",
-            "TriggeredByPipelineName",
-            "TriggeredByPipelineRunId",
-        ]
-        | str,
-    ) -> str:
+    def iter_activity_output(self, name: str, *path: str | int) -> Iterator[Any]:
         """
-        Get a pipeline scope variable by name from the context.
+        Iterate over an array in an activity's output, one element at a time.
+
+        Outputs read with `set_activity_output_from_file` are streamed: elements
+        are parsed as they are consumed and nothing is kept, so rows can be fed into
+        `fabrix.evaluate_many(..., lazy=True)` with flat memory.
 
         Parameters
         ----------
         name : str
-            The pipeline scope variable name.
+            The activity name.
+        *path : str | int
+            Fields and indices leading to the array, e.g. `"value"` for `output.value`.
 
         Returns
         -------
-        Any or None
-            The value if present, else None.
+        Iterator[Any]
+            The elements of the array as plain Python objects.
+
+        Raises
+        ------
+        KeyError
+            If the activity or a field on the path is missing.
+        TypeError
+            If the value at the end of the path is not an array.
         """
-        parameter = self.pipeline_scope_variables.get_by_alias(name)
-        if not parameter:
-            raise AttributeError(f"Invalid pipeline scope variable, got {name}, expected one of: x")
-        return parameter
+        value = self.get_activity_output(name)
+        for segment in path:
+            try:
+                value = value[segment]
+            except (KeyError, IndexError, TypeError):
+                raise KeyError(f"Missing field {segment!r} on activity('{name}').output path.") from None
+
+        if isinstance(value, lazyjson.LazyArray):
+            return value.stream()
+        if isinstance(value, (list, tuple)):
+            return iter(value)
+        raise TypeError(f"activity('{name}').output{''.join(f'[{s!r}]' for s in path)} is not an array.")
 
     def set_variable(self, name: str, value: int | str | bool | float | None) -> None:
         self.variables.setdefault(name, value)
@@ -442,6 +716,24 @@ class Context(BaseModel):
             raise KeyError(f"No variable with name {name} initialized.")
         return self.variables.get(name)
 
+    def get_item(self) -> Any:
+        """
+        Get the current ForEach item.
+
+        Returns
+        -------
+        Any
+            The item bound to the context.
+
+        Raises
+        ------
+        KeyError
+            If no item is bound (outside of a ForEach).
+        """
+        if self.item is None:
+            raise KeyError("No item() available outside of a ForEach iteration.")
+        return self.item
+
     def get_parameter(self, name: str) -> int | str | bool | float | None:
         """
         Get a base pipeline parameter by name from the context.
@@ -460,11 +752,345 @@ class Context(BaseModel):
             raise KeyError(f"No parameters with name {name} initialized.")
         return self.pipeline_parameters.get(name)
 
-    def add_trace(self, title: str | None = None) -> None:
-        trace = ExpressionTraceback(title)
+    def add_trace(self, title: str | None = None, trace: bool | None = None) -> ExpressionTraceback:
+        """
+        Start a new trace for an evaluation.
+
+        The trace is returned to the caller, which owns it until `close_trace`.
+        It also becomes the `active_trace` (the most recently started trace).
+
+        Parameters
+        ----------
+        title : str, optional
+            Title of the trace root node.
+        trace : bool, optional
+            Whether to record the trace. Defaults to `Context.trace`. If disabled,
+            the shared `NULL_TRACE` is returned and nothing is stored.
+
+        Returns
+        -------
+        ExpressionTraceback
+            The new trace.
+        """
+        if not (self.trace if trace is None else trace):
+            self._active_trace = NULL_TRACE
+            return NULL_TRACE
+
+        expression_trace = ExpressionTraceback(title)
+        if self.trace_retention != "errors":
+            self._retain_trace(expression_trace)
+        self._active_trace = expression_trace
+        return expression_trace
+
+    def close_trace(self, trace: ExpressionTraceback | None = None) -> None:
+        """
+        Finish a trace and apply the retention policy.
+
+        With `trace_retention="errors"`, the trace is only kept if an error was recorded.
+
+        Parameters
+        ----------
+        trace : ExpressionTraceback, optional
+            The trace returned by `add_trace`. Defaults to the active trace.
+        """
+        trace = trace or self._active_trace
+        if self.trace_retention == "errors" and trace.enabled and trace.has_error:
+            self._retain_trace(trace)
+
+    def clear_traces(self) -> None:
+        """Drop all stored traces."""
+        self._traces_.clear()
+
+    def _retain_trace(self, trace: ExpressionTraceback) -> None:
+        # a bounded deque drops the oldest trace atomically on append (safe across threads)
+        if self._traces_.maxlen != self.trace_limit:
+            self._traces_ = deque(self._traces_, maxlen=self.trace_limit)
         self._traces_.append(trace)
-        self._active_trace = trace
 
     @property
     def active_trace(self) -> ExpressionTraceback:
         return self._active_trace
+
+
+class Context(_ContextBase, BaseModel):
+    """
+    Holds evaluation context, including variables, pipeline parameters, pipeline scope variables, and data.
+
+    Attributes
+    ----------
+    variables : dict[str, Any]
+        User variables available via variables('xyz').
+    pipeline_parameters : dict[str, Any]
+        Parameters provided by the pipeline, available via pipeline().parameters.xyz.
+    pipeline_scope_variables : Scope
+        Built-in pipeline-level variables (see below).
+    item : Any
+        The current ForEach item, available via item(). None outside of a ForEach.
+    trace : bool
+        Whether evaluations record a trace by default.
+    trace_limit : int | None
+        Keep only the most recent `trace_limit` traces (ring buffer). None keeps all.
+    trace_retention : {"all", "errors", "render"}
+        Which traces are kept: all of them, only those of failed evaluations,
+        or all of them until they were rendered by `generate_context_output`.
+    """
+
+    activities: dict[str, Any] = Field(default_factory=dict)
+    variables: dict[str, Any] = Field(default_factory=dict)
+    pipeline_parameters: dict[str, Any] = Field(default_factory=dict)
+    pipeline_scope_variables: Scope = Scope()
+    item: Any = None
+    trace: bool = True
+    trace_limit: int | None = None
+    trace_retention: Literal["all", "errors", "render"] = "all"
+
+    _traces_: deque[ExpressionTraceback] = PrivateAttr(default_factory=deque)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._traces_ = deque(maxlen=self.trace_limit)
+
+    def get_pipeline_scope_variable(
+        self,
+        name: Literal[
+            "DataFactory",
+            "Pipeline",
+            "RunId",
+            "TriggerId",
+            "TriggerName",
+            "TriggerTime",
+            "GroupId",
+            "TriggeredByPipelineName",
+            "TriggeredByPipelineRunId",
+        ]
+        | str,
+    ) -> str:
+        """
+        Get a pipeline scope variable by name from the context.
+
+        Parameters
+        ----------
+        name : str
+            The pipeline scope variable name.
+
+        Returns
+        -------
+        Any or None
+            The value if present, else None.
+        """
+        parameter = self.pipeline_scope_variables.get_by_alias(name)
+        if not parameter:
+            raise AttributeError(f"Invalid pipeline scope variable, got {name}, expected one of: x")
+        return parameter
+
+    def child(self, item: Any = None, variables: Mapping[str, Any] | None = None) -> "Context":
+        """
+        Derive a context for one iteration (e.g. of a ForEach), layered over this one.
+
+        Creating a child does not copy the parent's data: variables are a
+        `ChainMap` of the child's own variables over the parent's, so variables
+        set on the child are written to its own layer and never reach the parent.
+        Activities and pipeline parameters are shared with the parent, and so
+        is the trace storage.
+
+        Parameters
+        ----------
+        item : Any, optional
+            The item available via item(). Defaults to the parent's item.
+        variables : Mapping[str, Any], optional
+            Variables of the child, shadowing the parent's.
+
+        Returns
+        -------
+        Context
+            The child context.
+        """
+        child = self.model_copy()
+        child.variables = ChainMap(dict(variables) if variables else {}, self.variables)  # type: ignore[assignment]
+        if item is not None:
+            child.item = item
+        return child
+
+    def freeze(self) -> "FrozenContext":
+        """
+        Create a lightweight `FrozenContext` for evaluating many expressions.
+
+        Returns
+        -------
+        FrozenContext
+            A context sharing this context's activities and parameters, with a copy
+            of its variables.
+        """
+        return FrozenContext(
+            activities=self.activities,
+            # copied, so variables set on the frozen context never reach this one
+            variables=dict(self.variables),
+            pipeline_parameters=self.pipeline_parameters,
+            scope=self.pipeline_scope_variables.by_alias(),
+            item=self.item,
+            trace=self.trace,
+            trace_limit=self.trace_limit,
+            trace_retention=self.trace_retention,
+        )
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # traces are per-process debugging state: keep pickles (e.g. for worker processes) small
+        state = super().__getstate__()
+        state["__dict__"] = {key: value for key, value in state["__dict__"].items() if key != "_active_trace"}
+        state["__pydantic_private__"] = {
+            **(state["__pydantic_private__"] or {}),
+            "_traces_": deque(maxlen=self.trace_limit),
+        }
+        return state
+
+
+class FrozenContext(_ContextBase):
+    """
+    A plain (non-pydantic) context for the hot path of evaluation.
+
+    Created with `Context.freeze()`. Nothing is validated: the activities and
+    parameters are those of the original context, the variables a copy of its
+    variables, and the pipeline scope variables are precomputed into a dict
+    keyed by alias.
+    Expressions evaluate exactly as against the original context.
+
+    Attributes
+    ----------
+    activities : dict[str, Any]
+        Activity payloads, available via activity('xyz').output.
+    variables : dict[str, Any]
+        User variables available via variables('xyz').
+    pipeline_parameters : dict[str, Any]
+        Parameters available via pipeline().parameters.xyz.
+    scope : dict[str, str | None]
+        Pipeline scope variables by alias, available via pipeline().xyz.
+    item : Any
+        The current ForEach item, available via item().
+    trace : bool
+        Whether evaluations record a trace by default.
+    trace_limit : int | None
+        Keep only the most recent `trace_limit` traces. None keeps all.
+    trace_retention : {"all", "errors", "render"}
+        Which traces are kept (see `Context`).
+    """
+
+    __slots__ = (
+        "activities",
+        "variables",
+        "pipeline_parameters",
+        "scope",
+        "item",
+        "trace",
+        "trace_limit",
+        "trace_retention",
+        "_traces_",
+        "_active_trace",
+    )
+
+    def __init__(
+        self,
+        activities: dict[str, Any],
+        variables: dict[str, Any],
+        pipeline_parameters: dict[str, Any],
+        scope: dict[str, str | None],
+        item: Any = None,
+        trace: bool = True,
+        trace_limit: int | None = None,
+        trace_retention: Literal["all", "errors", "render"] = "all",
+    ) -> None:
+        self.activities = activities
+        self.variables = variables
+        self.pipeline_parameters = pipeline_parameters
+        self.scope = scope
+        self.item = item
+        self.trace = trace
+        self.trace_limit = trace_limit
+        self.trace_retention = trace_retention
+        self._traces_ = deque(maxlen=trace_limit)
+        self._active_trace = NULL_TRACE
+
+    @property
+    def pipeline_scope_variables(self) -> Scope:
+        """Return the pipeline scope variables as a `Scope` model."""
+        return Scope.model_validate(self.scope)
+
+    def get_pipeline_scope_variable(self, name: str) -> str:
+        """
+        Get a pipeline scope variable by alias.
+
+        Parameters
+        ----------
+        name : str
+            The pipeline scope variable name.
+
+        Returns
+        -------
+        str
+            The value.
+        """
+        try:
+            parameter = self.scope[name]
+        except KeyError:
+            raise KeyError(f"Alias {name!r} not found in Scope.") from None
+        if not parameter:
+            raise AttributeError(f"Invalid pipeline scope variable, got {name}, expected one of: x")
+        return parameter
+
+    def child(self, item: Any = None, variables: Mapping[str, Any] | None = None) -> "FrozenContext":
+        """
+        Derive a context for one iteration, layered over this one (see `Context.child`).
+
+        Parameters
+        ----------
+        item : Any, optional
+            The item available via item(). Defaults to the parent's item.
+        variables : Mapping[str, Any], optional
+            Variables of the child, shadowing the parent's.
+
+        Returns
+        -------
+        FrozenContext
+            The child context.
+        """
+        child = FrozenContext.__new__(FrozenContext)
+        for name in FrozenContext.__slots__:
+            setattr(child, name, getattr(self, name))
+        child.variables = ChainMap(dict(variables) if variables else {}, self.variables)  # type: ignore[assignment]
+        if item is not None:
+            child.item = item
+        return child
+
+    def thaw(self) -> Context:
+        """
+        Convert back into a validated `Context`.
+
+        Returns
+        -------
+        Context
+            A context with the same data.
+        """
+        return Context(
+            activities=self.activities,
+            variables=dict(self.variables),
+            pipeline_parameters=self.pipeline_parameters,
+            pipeline_scope_variables=self.pipeline_scope_variables,
+            item=self.item,
+            trace=self.trace,
+            trace_limit=self.trace_limit,
+            trace_retention=self.trace_retention,
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # traces are per-process debugging state and are not pickled
+        return FrozenContext, (
+            self.activities,
+            self.variables,
+            self.pipeline_parameters,
+            self.scope,
+            self.item,
+            self.trace,
+            self.trace_limit,
+            self.trace_retention,
+        )
+
+    def __repr__(self) -> str:
+        return f"FrozenContext(variables={list(self.variables)}, activities={list(self.activities)})"
@@ -0,0 +1,290 @@
+"""
+.NET date and time format strings.
+
+ADF / Fabric expressions format timestamps with .NET custom format strings
+(e.g. `yyyy-MM-ddTHH:mm:ss.fffZ`) or single-letter standard format strings
+(e.g. `o`). `compile_format` translates such a format string once into a
+`str.format` template plus a few value getters, and caches the result, so
+formatting a timestamp is a single `str.format` call. The invariant culture
+is used for names and separators.
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+DateTimeFormatter = Callable[[datetime], str]
+
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Standard format strings of the invariant culture, as custom format strings
+_STANDARD_FORMATS = {
+    "d": "MM/dd/yyyy",
+    "D": "dddd, dd MMMM yyyy",
+    "f": "dddd, dd MMMM yyyy HH:mm",
+    "F": "dddd, dd MMMM yyyy HH:mm:ss",
+    "g": "MM/dd/yyyy HH:mm",
+    "G": "MM/dd/yyyy HH:mm:ss",
+    "m": "MMMM dd",
+    "M": "MMMM dd",
+    "o": "yyyy'-'MM'-'dd'T'HH':'mm':'ss'.'fffffffK",
+    "O": "yyyy'-'MM'-'dd'T'HH':'mm':'ss'.'fffffffK",
+    "r": "ddd, dd MMM yyyy HH':'mm':'ss 'GMT'",
+    "R": "ddd, dd MMM yyyy HH':'mm':'ss 'GMT'",
+    "s": "yyyy'-'MM'-'dd'T'HH':'mm':'ss",
+    "t": "HH:mm",
+    "T": "HH:mm:ss",
+    "u": "yyyy'-'MM'-'dd HH':'mm':'ss'Z'",
+    "y": "yyyy MMMM",
+    "Y": "yyyy MMMM",
+}
+
+# Standard formats that convert the timestamp to UTC first
+_UTC_FORMATS = frozenset("rRu")
+
+_ZERO = timedelta(0)
+
+
+def format_datetime(value: datetime, fmt: str) -> str:
+    """
+    Format a datetime with a .NET format string, or a strftime pattern if it contains `%`.
+
+    Unlike .NET, a `%` always selects strftime, so `%` never marks a single .NET
+    custom specifier: `"%d"` is the zero-padded day and `"%m"` the month, as in
+    any other strftime pattern.
+
+    Parameters
+    ----------
+    value : datetime
+        The timestamp.
+    fmt : str
+        A .NET standard or custom format string, or a strftime pattern.
+
+    Returns
+    -------
+    str
+        The formatted timestamp.
+
+    Examples
+    --------
+    >>> format_datetime(datetime(2024, 3, 5, 7, 8, 9, 123456, tzinfo=timezone.utc), "yyyy-MM-ddTHH:mm:ss.fffK")
+    '2024-03-05T07:08:09.123Z'
+    >>> format_datetime(datetime(2024, 3, 5), "%d.%m.%Y")
+    '05.03.2024'
+    >>> format_datetime(datetime(2024, 3, 5), "%d")
+    '05'
+    """
+    if "%" in fmt:
+        return value.strftime(fmt)
+    return compile_format(fmt)(value)
+
+
+@lru_cache(maxsize=256)
+def compile_format(fmt: str) -> DateTimeFormatter:
+    """
+    Compile a .NET standard or custom date and time format string (cached).
+
+    Parameters
+    ----------
+    fmt : str
+        The format string, e.g. `"yyyy-MM-dd"` or `"o"`.
+
+    Returns
+    -------
+    Callable[[datetime], str]
+        A function formatting a datetime.
+
+    Raises
+    ------
+    ValueError
+        If the format string is invalid (e.g. more than seven `f`).
+    """
+    to_utc = len(fmt) == 1 and fmt in _UTC_FORMATS
+    if len(fmt) == 1:
+        if fmt not in _STANDARD_FORMATS:
+            raise ValueError(f"Invalid standard date and time format string: {fmt!r}.")
+        fmt = _STANDARD_FORMATS[fmt]
+
+    template, getters = _translate(fmt)
+    render = template.format
+
+    if not getters:
+        formatter: DateTimeFormatter = render
+    elif len(getters) == 1:
+        (getter,) = getters
+        formatter = lambda value: render(value, getter(value))  # noqa: E731
+    else:
+        formatter = lambda value: render(value, *[getter(value) for getter in getters])  # noqa: E731
+
+    if to_utc:
+        return lambda value: formatter(value.astimezone(timezone.utc) if value.tzinfo else value)
+    return formatter
+
+
+def _translate(fmt: str) -> tuple[str, list[Callable[[datetime], str]]]:
+    """
+    Translate a custom format string into a `str.format` template.
+
+    The datetime is the first positional argument; values that are not plain
+    attributes are computed by the returned getters and passed after it.
+    """
+    parts: list[str] = []
+    getters: list[Callable[[datetime], str]] = []
+
+    def computed(getter: Callable[[datetime], str]) -> str:
+        getters.append(getter)
+        return f"{{{len(getters)}}}"
+
+    index, length = 0, len(fmt)
+    while index < length:
+        char = fmt[index]
+        if char in "'\"":
+            end = fmt.find(char, index + 1)
+            if end < 0:
+                raise ValueError(f"Unterminated quoted string in format {fmt!r}.")
+            parts.append(_literal(fmt[index + 1 : end]))
+            index = end + 1
+            continue
+        if char == "%":
+            # marks a single custom specifier, e.g. "%d"
+            index += 1
+            continue
+        if char == "\\":
+            if index + 1 >= length:
+                raise ValueError(f"Invalid escape at the end of format {fmt!r}.")
+            parts.append(_literal(fmt[index + 1]))
+            index += 2
+            continue
+
+        count = 1
+        while index + count < length and fmt[index + count] == char:
+            count += 1
+        index += count
+
+        if char == "y":
+            if count == 1:
+                parts.append(computed(lambda value: str(value.year % 100)))
+            elif count == 2:
+                parts.append(computed(lambda value: f"{value.year % 100:02d}"))
+            else:
+                parts.append(f"{{0.year:0{count}d}}")
+        elif char == "M":
+            if count <= 2:
+                parts.append("{0.month}" if count == 1 else "{0.month:02d}")
+            else:
+                names = _MONTH_NAMES if count > 3 else tuple(name[:3] for name in _MONTH_NAMES)
+                parts.append(computed(_month_name(names)))
+        elif char == "d":
+            if count <= 2:
+                parts.append("{0.day}" if count == 1 else "{0.day:02d}")
+            else:
+                names = _DAY_NAMES if count > 3 else tuple(name[:3] for name in _DAY_NAMES)
+                parts.append(computed(_day_name(names)))
+        elif char in "Hms":
+            attribute = {"H": "hour", "m": "minute", "s": "second"}[char]
+            parts.append(f"{{0.{attribute}}}" if count == 1 else f"{{0.{attribute}:02d}}")
+        elif char == "h":
+            spec = "" if count == 1 else "02d"
+            parts.append(computed(_hour12(spec)))
+        elif char in "fF":
+            if count > 7:
+                raise ValueError(f"Too many fraction specifiers {char * count!r} in format {fmt!r}.")
+            if char == "F" and parts and parts[-1].endswith("."):
+                # like .NET, the separator is dropped together with an all-zero fraction
+                parts[-1] = parts[-1][:-1]
+                parts.append(computed(_trimmed_fraction_of(count, ".")))
+            elif char == "F":
+                parts.append(computed(_trimmed_fraction_of(count, "")))
+            else:
+                parts.append(computed(_fraction_of(count)))
+        elif char == "t":
+            parts.append(computed(_designator(count)))
+        elif char == "g":
+            parts.append("A.D.")
+        elif char == "K":
+            parts.append(computed(_kind_offset) * count)
+        elif char == "z":
+            parts.append(computed(_offset_of(count)))
+        else:
+            parts.append(_literal(char * count))
+
+    return "".join(parts), getters
+
+
+def _month_name(names: tuple[str, ...]) -> DateTimeFormatter:
+    return lambda value: names[value.month - 1]
+
+
+def _day_name(names: tuple[str, ...]) -> DateTimeFormatter:
+    return lambda value: names[value.weekday()]
+
+
+def _hour12(spec: str) -> DateTimeFormatter:
+    return lambda value: format(value.hour % 12 or 12, spec)
+
+
+def _designator(count: int) -> DateTimeFormatter:
+    length = min(count, 2)
+    return lambda value: ("AM" if value.hour < 12 else "PM")[:length]
+
+
+def _fraction_of(digits: int) -> DateTimeFormatter:
+    return lambda value: _fraction(value, digits)
+
+
+def _trimmed_fraction_of(digits: int, separator: str) -> DateTimeFormatter:
+    return lambda value: _trimmed_fraction(value, digits, separator)
+
+
+def _offset_of(count: int) -> DateTimeFormatter:
+    return lambda value: _offset(value, count)
+
+
+def _literal(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _fraction(value: datetime, digits: int) -> str:
+    if digits <= 6:
+        return f"{value.microsecond // 10 ** (6 - digits):0{digits}d}"
+    return f"{value.microsecond:06d}" + "0" * (digits - 6)
+
+
+def _trimmed_fraction(value: datetime, digits: int, separator: str) -> str:
+    fraction = _fraction(value, digits).rstrip("0")
+    return separator + fraction if fraction else ""
+
+
+def _kind_offset(value: datetime) -> str:
+    offset = value.utcoffset()
+    if offset is None:
+        return ""
+    if offset == _ZERO:
+        return "Z"
+    return _offset(value, 3)
+
+
+def _offset(value: datetime, count: int) -> str:
+    offset = value.utcoffset() or _ZERO
+    sign = "-" if offset < _ZERO else "+"
+    minutes = abs(offset) // timedelta(minutes=1)
+    hours, minutes = divmod(minutes, 60)
+    if count == 1:
+        return f"{sign}{hours}"
+    if count == 2:
+        return f"{sign}{hours:02d}"
+    return f"{sign}{hours:02d}:{minutes:02d}"
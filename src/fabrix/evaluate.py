@@ -2,36 +2,201 @@
 Main expression evaluator for the fabric_expression_builder package.
 """
 
-import re
-from typing import Any
-
+import math
+import threading
+from collections import ChainMap, OrderedDict, deque
+from collections.abc import Iterable, Iterator, Mapping, Sized
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Literal, NamedTuple
+
+from fabrix.compiler import CompiledExpression, compile_expression
 from fabrix.console import generate_context_output
-from fabrix.context import Context
+from fabrix.context import Context, FrozenContext
+from fabrix.memo import MemoTable
 from fabrix.exceptions import ExpressionSyntaxError, FunctionNotFoundError
-from fabrix.functions import *  # noqa: F403
 from fabrix.registry import registry
-from fabrix.schemas import Expression, Flags
-from fabrix.utils import as_float, as_int, clean_expression
-from fabrix.validations import validate_function, validate_syntax
+from fabrix.schemas import Expression
+from fabrix.vectorize import vector_plan
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `ExpressionCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int | None
+    max_bytes: int | None
+
+
+class ExpressionCache:
+    """
+    Thread-safe LRU cache mapping raw expression text to its compiled form.
+
+    The size of an entry is approximated by the length of its expression text.
+    The cache is cleared automatically when functions are (re-)registered, as
+    compiled expressions bind the registered functions at compile time.
+
+    Parameters
+    ----------
+    max_entries : int | None, default 4096
+        Maximum number of cached expressions. None means unbounded.
+    max_bytes : int | None, default None
+        Maximum total size of the cached expression texts. None means unbounded.
+    """
+
+    def __init__(self, max_entries: int | None = 4096, max_bytes: int | None = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CompiledExpression] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._registry_version = registry.version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, expression: str) -> CompiledExpression:
+        """
+        Return the compiled expression, compiling and caching it on a miss.
+
+        Parameters
+        ----------
+        expression : str
+            The raw expression text.
+
+        Returns
+        -------
+        CompiledExpression
+            The compiled expression.
+
+        Raises
+        ------
+        ExpressionSyntaxError
+            If the expression is syntactically invalid (errors are not cached).
+        FunctionNotFoundError
+            If the expression calls a function that is not registered.
+        """
+        with self._lock:
+            if self._registry_version != registry.version:
+                self._clear()
+                self._registry_version = registry.version
+            compiled = self._entries.get(expression)
+            if compiled is not None:
+                self._entries.move_to_end(expression)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = compile_expression(expression)
+
+        with self._lock:
+            if expression not in self._entries:
+                self._entries[expression] = compiled
+                self._bytes += len(expression)
+                self._evict()
+        return compiled
+
+    def configure(self, max_entries: int | None = 4096, max_bytes: int | None = None) -> None:
+        """
+        Change the limits of the cache, evicting entries if necessary.
+
+        Parameters
+        ----------
+        max_entries : int | None, default 4096
+            Maximum number of cached expressions. None means unbounded.
+        max_bytes : int | None, default None
+            Maximum total size of the cached expression texts. None means unbounded.
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            Hits, misses, evictions, current size and limits.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            expression, _ = self._entries.popitem(last=False)
+            self._bytes -= len(expression)
+            self.evictions += 1
+
+
+# Process-wide cache used by `evaluate`
+expression_cache = ExpressionCache()
+
+# Number of rows evaluated at once by vectorized function variants
+_VECTOR_BLOCK_SIZE = 4096
 
 
 def evaluate(
     expression: Expression | str,
-    context: Context | None = None,
+    context: Context | FrozenContext | None = None,
     show_output: bool = False,
     raise_errors: bool = True,
+    trace: bool | None = None,
+    memo: bool | MemoTable = False,
 ) -> str | int | float | bool | Any | None:
     """
     Evaluate an expression string in a given context, optionally tracing the steps.
 
+    The compiled form of the expression is looked up in (or added to) the
+    process-wide `expression_cache`, so repeated expressions are parsed only once.
+
     Parameters
     ----------
-    expression : str
+    expression : str | Expression
         The expression to evaluate.
-    context : Context
-        The context for evaluation.
-    trace : TraceContext, optional
-        If provided, records the evaluation steps.
+    context : Context | FrozenContext, optional
+        The context for evaluation. If omitted, a fresh `Context()` is created.
+    show_output : bool, default False
+        If True, prints the Rich traces of the context.
+    raise_errors : bool, default True
+        If False, syntax errors are only recorded in the trace and None is returned.
+        Errors raised during evaluation are recorded in the trace and always propagate.
+    trace : bool, optional
+        Whether to record a trace of the evaluation. Defaults to `Context.trace`.
+        Without a trace, no Rich objects are built during evaluation.
+    memo : bool | MemoTable, default False
+        Memoize pure function calls within the evaluation (True), or in a shared `MemoTable`.
 
     Returns
     -------
@@ -39,48 +204,31 @@ def evaluate(
         The result of evaluation.
     """
     if isinstance(expression, str):
-        expression = Expression(expression=expression)
+        expr, name, variable = expression, None, None
+    else:
+        expr, name, variable = expression.expression, expression.name, expression.variable
 
     title = "Expression"
-    if expression.name:
-        title = f"Expression: {expression.name}"
+    if name:
+        title = f"Expression: {name}"
 
     context = context or Context()
-    context.add_trace(title)
-
-    expr = expression.expression
 
     try:
-        validate_syntax(expr)
-    except ExpressionSyntaxError as exc:
-        context.active_trace.add_parse_node(expr)
-        context.active_trace.add_error(label=expr, message=str(exc), span=None)
+        compiled = expression_cache.get(expr)
+    except (ExpressionSyntaxError, FunctionNotFoundError) as exc:
+        expression_trace = context.add_trace(title, trace=trace)
+        expression_trace.add_parse_node(expr)
+        expression_trace.add_error(label=expr, message=str(exc), span=exc.span)
+        context.close_trace(expression_trace)
         if raise_errors:
             raise exc from exc
         return None
 
-    if not isinstance(expr, str):
-        return expr
-
-    if "@@" in expr:
-        return expr.replace("@@", "@")
-
-    if "@{" in expr:
+    result = compiled.evaluate(context, title=title, trace=trace, memo=memo)
 
-        def replace_inner_expression(match) -> str:
-            inner_expr = match.group(1).strip()
-            result = str(_eval(inner_expr, context, raise_errors))
-            return result
-
-        return re.sub(r"@{([^}]+)}", replace_inner_expression, expr)
-
-    if expr.startswith("@"):
-        expr = expr[1:]
-
-    result = _eval(expr, context, raise_errors)
-
-    if expression.variable:
-        context.set_variable(expression.variable, result)
+    if variable:
+        context.set_variable(variable, result)
 
     if show_output:
         generate_context_output(context)
@@ -88,293 +236,278 @@ def evaluate(
     return result
 
 
-def _eval(
-    expr: str,
-    context: Context,
-    raise_errors: bool,
-) -> Any:
-    expr = clean_expression(expr)
-
-    # ----------- Literal/other -----------
-    result = _evaluate_literal(expr, context)
-    if result is not Flags.NO_MATCH:
-        return result
-
-    context.active_trace.add_parse_node(expr)
-
-    # --- Pipeline parameter ---
-    result = _evaluate_pipeline_parameter(expr, context)
-    if result is not Flags.NO_MATCH:
-        context.active_trace.pop()
-        return result
-
-    # --- Pipeline scope variable ---
-    result = _evaluate_pipeline_scope_parameter(expr, context)
-    if result is not Flags.NO_MATCH:
-        context.active_trace.pop()
-        return result
-
-    # --- Variable ---
-    result = _evaluate_variable(expr, context)
-    if result is not Flags.NO_MATCH:
-        context.active_trace.pop()
-        return result
-
-    # --- Activity ---
-    result = _evaluate_activity(expr, context, raise_errors)
-    if result is not Flags.NO_MATCH:
-        context.active_trace.pop()
-        return result
-
-    # ----------- Function call -----------
-    result = _evaluate_function(expr, context, raise_errors)
-    if result is not Flags.NO_MATCH:
-        return result
-
-    context.active_trace.pop()
-    return expr
-
-
-def _evaluate_pipeline_parameter(
-    expression: str,
-    context: Context,
-) -> Any:
-    param_match = re.match(r"pipeline\(\)\.parameters\.([a-zA-Z_][a-zA-Z0-9_]*)", expression)
-
-    if not param_match:
-        return Flags.NO_MATCH
-
-    key = param_match.group(1)
-    result = context.get_parameter(key)
-    context.active_trace.add_parameter_node(key, result=result)
-    return result
-
-
-def _evaluate_pipeline_scope_parameter(
-    expression: str,
-    context: Context,
-) -> Any:
-    scope_match = re.match(r"pipeline\(\)\.([a-zA-Z_][a-zA-Z0-9_]*)", expression)
-    if not scope_match:
-        return Flags.NO_MATCH
-
-    key = scope_match.group(1)
-    result = context.get_pipeline_scope_variable(key)
-    context.active_trace.add_scope_node(key, result=result)
-    return result
+class RowResult(NamedTuple):
+    """
+    Result of evaluating an expression for one row of `evaluate_many`.
 
+    Attributes
+    ----------
+    position : int
+        Position of the row in the input.
+    value : Any
+        The evaluated value (None if evaluation failed).
+    error : Exception | None
+        The exception raised while evaluating the row, if any.
+    """
 
-def _evaluate_variable(
-    expression: str,
-    context: Context,
-) -> Any:
-    var_match = re.match(r"variables\(['\"](.+?)['\"]\)", expression)
-    if not var_match:
-        return Flags.NO_MATCH
+    position: int
+    value: Any
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the row was evaluated without error."""
+        return self.error is None
+
+
+def evaluate_many(
+    expression: CompiledExpression | str,
+    contexts_or_rows: Iterable[Context | FrozenContext | Any],
+    context: Context | FrozenContext | None = None,
+    bind: Literal["item", "variables"] = "item",
+    trace: bool | None = False,
+    raise_errors: bool = False,
+    lazy: bool = False,
+    workers: int | None = None,
+    executor: Literal["process", "thread"] = "process",
+    chunksize: int | None = None,
+    memo: bool | MemoTable = False,
+    vectorize: bool = True,
+) -> list[RowResult] | Iterator[RowResult]:
+    """
+    Evaluate one expression for many contexts or rows (e.g. the items of a ForEach).
 
-    key = var_match.group(1)
-    result = context.get_variable(key)
-    context.active_trace.add_variable_node(key, result=result)
-    return result
+    The expression is compiled once. Each element of `contexts_or_rows` is either
+    a `Context`, used as is, or a row bound to `context`: as `item()` by default,
+    or merged into the variables with `bind="variables"` (rows must be mappings).
+    `context` itself is not modified, but traces of bound rows are stored in it.
 
+    With `workers`, rows are evaluated in chunks by a pool of processes (or threads).
+    The compiled expression and `context` are sent once per worker; results keep the
+    input order. Traces recorded in worker processes are not sent back.
 
-def _evaluate_activity(
-    expression: str,
-    context: Context,
-    raise_errors: bool,
-) -> Any:
-    activity_pattern = re.compile(
-        r"^activity\(\s*'(?P<activity>(?:[^']|'{2})*)'\s*\)\.output(?P<path>.*)$", re.IGNORECASE
-    )
-    segment_pattern = re.compile(r"(?:\.([A-Za-z_][A-Za-z0-9_]*)|\[\s*(.*?)\s*\])", re.VERBOSE)
-    activity_match = activity_pattern.match(expression)
-    if not activity_match:
-        return Flags.NO_MATCH
-
-    activity_name = activity_match.group("activity")
-    path = activity_match.group("path")
-    output = context.get_activity_output(activity_name)
-    node = context.active_trace.add_activity_node(activity_name, path=path)
-
-    path_segments: list[str] = []
-    for segment in segment_pattern.finditer(path):
-        field = segment.group(1)
-        inner = (segment.group(2) or "").strip()
-        if field:
-            try:
-                if isinstance(output, dict):
-                    output = output.get(field)
-                else:
-                    output = getattr(output, field)
-                if output is None:
-                    raise
-            except Exception as e:
-                raise KeyError(f"Missing field '{field}' on activity('{activity_name}').output path.") from e
-            path_segments.append(field)
-        else:
-            field = _eval(inner, context, raise_errors)
-            try:
-                if isinstance(output, (list, tuple)):
-                    output = output[int(field)]
-                elif isinstance(output, dict):
-                    output = output.get(field)
-                if output is None:
-                    raise
-            except Exception as e:
-                raise KeyError(f"Invalid index/field [{field!r}] on activity('{activity_name}').output path.") from e
-            path_segments.append(f"[{str(field)}]")
-
-    activity_path = f".{'.'.join(path_segments)}"
-    context.active_trace.add_activity_node(activity_name, path=activity_path, result=output, node=node)
-    context.active_trace.pop()
-    return output
-
-
-def _evaluate_function(
-    expression: str,
-    context: Context,
-    raise_errors: bool,
-) -> Any:
-    """
-    Evaluates a function with the given name and arguments in the provided context.
+    Without tracing, expressions whose outermost call has a vectorized variant
+    (e.g. `formatDateTime(addDays(item(), 1), 'yyyy-MM-dd')`, with NumPy installed)
+    are evaluated column-wise, in blocks of rows (see `fabrix.vectorize`). A block
+    that the vectorized variants cannot handle is evaluated row by row.
 
     Parameters
     ----------
-    func_name : str
-        The name of the function to evaluate.
-    args : list[str]
-        The arguments to pass to the function.
-    context : Context
-        The evaluation context.
+    expression : CompiledExpression | str
+        The expression to evaluate.
+    contexts_or_rows : Iterable[Context | Any]
+        Contexts or rows to evaluate the expression for.
+    context : Context | FrozenContext, optional
+        The base context rows are bound to. If omitted, a fresh `Context()` is created.
+    bind : {"item", "variables"}, default "item"
+        How rows are exposed to the expression.
+    trace : bool | None, default False
+        Whether to record a trace per row. None defers to `Context.trace`.
+    raise_errors : bool, default False
+        If True, the first failing row raises. Otherwise errors are captured per row.
+    lazy : bool, default False
+        If True, return a generator instead of a list.
+    workers : int, optional
+        Number of parallel workers. If omitted, rows are evaluated in the calling thread.
+    executor : {"process", "thread"}, default "process"
+        The kind of worker pool used with `workers`.
+    chunksize : int, optional
+        Number of rows sent to a worker at once. Defaults to splitting sized inputs
+        into four chunks per worker, and to 1000 rows otherwise.
+    memo : bool | MemoTable, default False
+        Memoize pure function calls across the batch: True uses one table for all
+        rows (one per chunk with `workers`), a `MemoTable` is used as given.
+    vectorize : bool, default True
+        Whether to use vectorized function variants when possible.
 
     Returns
     -------
-    Any
-        The result of the function evaluation.
+    list[RowResult] | Iterator[RowResult]
+        One result per row, in input order.
+
+    Raises
+    ------
+    ExpressionSyntaxError
+        If the expression is syntactically invalid (raised before any row is evaluated).
+    FunctionNotFoundError
+        If the expression calls a function that is not registered.
     """
-    func_match = re.match(r"([a-zA-Z_][a-zA-Z0-9_]*)\((.*)\)", expression)
-    if not func_match:
-        return Flags.NO_MATCH
+    compiled = expression if isinstance(expression, CompiledExpression) else expression_cache.get(expression)
+    context = context or Context()
 
-    func_name, args_str = func_match.groups()
+    if executor not in ("process", "thread"):
+        raise ValueError(f"Unknown executor {executor!r}, expected 'process' or 'thread'.")
+
+    if workers is None:
+        results = _evaluate_rows(compiled, contexts_or_rows, context, bind, trace, raise_errors, memo, vectorize)
+    else:
+        if chunksize is None:
+            size = len(contexts_or_rows) if isinstance(contexts_or_rows, Sized) else 0
+            chunksize = max(1, math.ceil(size / (workers * 4))) if size else 1000
+        results = _evaluate_rows_parallel(
+            compiled,
+            contexts_or_rows,
+            context,
+            bind,
+            trace,
+            raise_errors,
+            memo,
+            vectorize,
+            workers,
+            executor,
+            chunksize,
+        )
+    return results if lazy else list(results)
+
+
+def _evaluate_rows(
+    compiled: CompiledExpression,
+    contexts_or_rows: Iterable[Context | FrozenContext | Any],
+    context: Context | FrozenContext,
+    bind: Literal["item", "variables"],
+    trace: bool | None,
+    raise_errors: bool,
+    memo: bool | MemoTable,
+    vectorize: bool = True,
+) -> Iterator[RowResult]:
+    plan = vector_plan(compiled) if vectorize and trace is False else None
+    if plan is None:
+        yield from _evaluate_rows_one_by_one(compiled, contexts_or_rows, context, bind, trace, raise_errors, memo)
+        return
 
-    node = context.active_trace.add_function_node(func_name)
+    for start, block in _chunks(contexts_or_rows, _VECTOR_BLOCK_SIZE):
+        try:
+            values = plan.evaluate(_bind_rows(block, context, bind))
+        except Exception:
+            # failing rows and values the vectorized variants do not handle (e.g. timestamps
+            # with an offset) are left to the scalar functions, which also capture the errors
+            for result in _evaluate_rows_one_by_one(compiled, block, context, bind, trace, raise_errors, memo):
+                yield result._replace(position=start + result.position)
+        else:
+            for index, value in enumerate(values, start):
+                yield RowResult(index, value)
 
-    try:
-        validate_function(func_name)
-    except FunctionNotFoundError as exc:
-        context.active_trace.add_error(expression, str(exc), span=exc.span)
-        if raise_errors:
-            raise exc from exc
-        return
 
-    args = _parse_args(args_str)
-    resolved_args = [_eval(arg, context, raise_errors) for arg in args]
+def _evaluate_rows_one_by_one(
+    compiled: CompiledExpression,
+    contexts_or_rows: Iterable[Context | FrozenContext | Any],
+    context: Context | FrozenContext,
+    bind: Literal["item", "variables"],
+    trace: bool | None,
+    raise_errors: bool,
+    memo: bool | MemoTable,
+) -> Iterator[RowResult]:
+    memo_table = MemoTable() if memo is True else memo
+
+    for index, target in enumerate(_bind_rows(contexts_or_rows, context, bind)):
+        try:
+            value = compiled.evaluate(target, trace=trace, memo=memo_table)
+        except Exception as exc:
+            if raise_errors:
+                raise
+            yield RowResult(index, None, exc)
+        else:
+            yield RowResult(index, value)
+
+
+def _bind_rows(
+    contexts_or_rows: Iterable[Context | FrozenContext | Any],
+    context: Context | FrozenContext,
+    bind: Literal["item", "variables"],
+) -> Iterator[Context | FrozenContext]:
+    """Yield the context of each row; bound rows reuse one context, valid until the next row."""
+    # rows are bound to one working child, so the base context is left untouched
+    row_context = context.child()
+    variables = context.variables
+
+    for row in contexts_or_rows:
+        if isinstance(row, (Context, FrozenContext)):
+            yield row
+        elif bind == "variables":
+            if not isinstance(row, Mapping):
+                raise TypeError(f"Rows bound as variables must be mappings, got {type(row).__name__}.")
+            row_context.variables = ChainMap(dict(row), variables)  # type: ignore[assignment]
+            yield row_context
+        else:
+            row_context.item = row
+            yield row_context
 
-    fn = registry.get(func_name)
 
-    result = fn(*resolved_args)
+class _BatchState(NamedTuple):
+    """What every worker needs to evaluate chunks of a batch."""
 
-    context.active_trace.add_function_node(func_name, result=result, node=node)
-    context.active_trace.pop()
-    return result
+    compiled: CompiledExpression
+    context: Context | FrozenContext
+    bind: Literal["item", "variables"]
+    trace: bool | None
+    memo: bool | MemoTable
+    vectorize: bool
 
 
-def _parse_args(args_str: str) -> list[str]:
-    """
-    Naively splits the arguments string for top-level commas (improve as needed).
+# State of a worker process, set once per process by `_init_worker`
+_worker_state: _BatchState | None = None
 
-    Parameters
-    ----------
-    args_str : str
-        Arguments string inside a function call.
 
-    Returns
-    -------
-    list[str]
-        List of argument substrings.
-    """
-    # Simple split; improve for nested functions, strings, etc.
-    args = []
-    depth = 0
-    current = ""
-    in_str = False
-    str_char = ""
-    for c in args_str:
-        if in_str:
-            if c == str_char:
-                in_str = False
-            current += c
-        elif c in {"'", '"'}:
-            in_str = True
-            str_char = c
-            current += c
-        elif c == "(":
-            depth += 1
-            current += c
-        elif c == ")":
-            depth -= 1
-            current += c
-        elif c == "," and depth == 0:
-            args.append(current.strip())
-            current = ""
-        else:
-            current += c
-    if current.strip():
-        args.append(current.strip())
-    return args
+def _init_worker(state: _BatchState) -> None:
+    global _worker_state
+    _worker_state = state
 
 
-def _evaluate_literal(expression: str, context: Context) -> Any:
-    """
-    Resolves a literal, variable, or parameter from the context.
-    Improve with full Data Factory/Fabric syntax later.
+def _evaluate_chunk(chunk: tuple[int, list[Any]], state: _BatchState | None = None) -> list[RowResult]:
+    compiled, context, bind, trace, memo, vectorize = state or _worker_state  # type: ignore[misc]
+    start, rows = chunk
+    return [
+        result._replace(position=start + result.position)
+        for result in _evaluate_rows(compiled, rows, context, bind, trace, False, memo, vectorize)
+    ]
 
-    Parameters
-    ----------
-    expression : str
-        The expression or value string.
-    context : Context
-        The evaluation context.
 
-    Returns
-    -------
-    Any
-        The resolved value, or expression if not found.
-    """
-    mode: Flags = Flags.NO_MATCH
-    result: Any = None
-    expression = expression.strip()
-
-    if result is None:
-        literal_match = re.match(r"^'(?P<literal>(.*?))'$", expression)
-        if literal_match:
-            result = re.sub(r"'+", "'", literal_match.group(1))
-            mode = Flags.LITERAL_MATCH
-
-    if result is None:
-        if expression.lower() in ("true", "false"):
-            result = expression.lower() == "true"
-            mode = Flags.BOOLEAN_MATCH
-
-    if result is None:
-        num_pat = r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?"
-        num_match = re.fullmatch(num_pat, expression)
-        if num_match:
-            # if it contains '.' or 'e/E', prefer float
-            if any(c in expression for c in (".", "e", "E")):
-                result = as_float(expression)
-            else:
-                result = as_int(expression)
-            mode = Flags.NUMBER_MATCH
-
-    if result is None:
-        if expression.lower() == "null":
-            result = None
-            mode = Flags.NULL_MATCH
-
-    if mode is Flags.NO_MATCH:
-        return Flags.NO_MATCH
-
-    context.active_trace.add_literal_node(expression)
-    return result
+def _chunks(
+    contexts_or_rows: Iterable[Context | FrozenContext | Any], chunksize: int
+) -> Iterator[tuple[int, list[Any]]]:
+    iterator = iter(contexts_or_rows)
+    start = 0
+    while chunk := list(islice(iterator, chunksize)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _evaluate_rows_parallel(
+    compiled: CompiledExpression,
+    contexts_or_rows: Iterable[Context | FrozenContext | Any],
+    context: Context | FrozenContext,
+    bind: Literal["item", "variables"],
+    trace: bool | None,
+    raise_errors: bool,
+    memo: bool | MemoTable,
+    vectorize: bool,
+    workers: int,
+    executor: Literal["process", "thread"],
+    chunksize: int,
+) -> Iterator[RowResult]:
+    state = _BatchState(compiled, context, bind, trace, memo, vectorize)
+    pool: Executor
+    if executor == "process":
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(state,))
+        evaluate_chunk = _evaluate_chunk
+    else:
+        pool = ThreadPoolExecutor(workers)
+        evaluate_chunk = partial(_evaluate_chunk, state=state)
+
+    with pool:
+        # at most two chunks per worker are in flight, so streamed rows are
+        # read as they are consumed instead of all being submitted up front
+        pending: deque[Future[list[RowResult]]] = deque()
+        for chunk in _chunks(contexts_or_rows, chunksize):
+            pending.append(pool.submit(evaluate_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from _chunk_results(pending.popleft(), raise_errors)
+        while pending:
+            yield from _chunk_results(pending.popleft(), raise_errors)
+
+
+def _chunk_results(future: Future[list[RowResult]], raise_errors: bool) -> Iterator[RowResult]:
+    for result in future.result():
+        if raise_errors and result.error is not None:
+            raise result.error
+        yield result
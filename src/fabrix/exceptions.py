@@ -34,4 +34,21 @@ class FunctionNotFoundError(BaseExpressionError):
 
 
 class ExpressionSyntaxError(BaseExpressionError):
-    """User-friendly syntax error for Fabric/ADF expressions."""
+    """
+    User-friendly syntax error for Fabric/ADF expressions.
+
+    Parameters
+    ----------
+    message : str
+        The error message.
+    span : tuple[int, int], optional
+        The (start, end) offsets of the offending part of the expression.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        span: tuple[int, int] | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.span = span
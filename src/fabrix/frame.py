@@ -0,0 +1,46 @@
+"""
+Per-call evaluation state.
+
+Everything that changes while an expression is evaluated lives in an
+`EvaluationFrame` created for that single call. The `Context` is only read,
+so one context can be shared by many threads or asyncio tasks.
+"""
+
+from typing import Any
+
+from fabrix.context import Context, ExpressionTraceback, FrozenContext
+from fabrix.memo import MemoTable
+
+# Marks a common sub-expression slot that was not evaluated yet
+UNSET = object()
+
+
+class EvaluationFrame:
+    """
+    State of a single evaluation, passed down the syntax tree.
+
+    Attributes
+    ----------
+    context : Context | FrozenContext
+        The (read-only) evaluation context.
+    trace : ExpressionTraceback
+        The trace receiving the evaluation steps of this call.
+    memo : MemoTable | None
+        The table memoizing pure function calls, if enabled.
+    slots : list[Any]
+        Values of the common sub-expressions of the evaluated expression (`UNSET` until evaluated).
+    """
+
+    __slots__ = ("context", "trace", "memo", "slots")
+
+    def __init__(
+        self,
+        context: Context | FrozenContext,
+        trace: ExpressionTraceback,
+        memo: MemoTable | None = None,
+        slot_count: int = 0,
+    ) -> None:
+        self.context = context
+        self.trace = trace
+        self.memo = memo
+        self.slots: list[Any] = [UNSET] * slot_count
@@ -4,6 +4,7 @@ from fabrix.functions import dates as DateFunctions
 from fabrix.functions import logical as LogicalFunctions
 from fabrix.functions import maths as MathFunctions
 from fabrix.functions import strings as StringFunctions
+from fabrix.functions import vectorized as VectorizedFunctions
 
 __all__ = [
     "CollectionFunction",
@@ -12,4 +13,5 @@ __all__ = [
     "LogicalFunctions",
     "MathFunctions",
     "StringFunctions",
+    "VectorizedFunctions",
 ]
@@ -7,7 +7,7 @@ from typing import Any
 from fabrix.registry import registry
 
 
-@registry.register("contains")
+@registry.register("contains", pure=True)
 def contains(collection: str | dict | list, value: str) -> bool:
     """
     Check whether a collection contains a value.
@@ -31,7 +31,7 @@ def contains(collection: str | dict | list, value: str) -> bool:
     return value in collection
 
 
-@registry.register("empty")
+@registry.register("empty", pure=True)
 def empty(value: Any) -> bool:
     """
     Check whether a collection is empty.
@@ -55,7 +55,7 @@ def empty(value: Any) -> bool:
     return False
 
 
-@registry.register("first")
+@registry.register("first", pure=True)
 def first(value: Any) -> Any:
     """
     Return the first item from a collection or string.
@@ -77,7 +77,7 @@ def first(value: Any) -> Any:
     return value[0]
 
 
-@registry.register("last")
+@registry.register("last", pure=True)
 def last(value: Any) -> Any:
     """
     Return the last item from a collection or string.
@@ -99,7 +99,7 @@ def last(value: Any) -> Any:
     return value[-1]
 
 
-@registry.register("length")
+@registry.register("length", pure=True)
 def length(value: Any) -> int:
     """
     Return the number of items in a collection or string.
@@ -121,7 +121,7 @@ def length(value: Any) -> int:
     return len(value)
 
 
-@registry.register("skip")
+@registry.register("skip", pure=True)
 def skip(value: Any, count: int) -> Any:
     """
     Return all items after skipping a specified number.
@@ -145,7 +145,7 @@ def skip(value: Any, count: int) -> Any:
     return value[count:]
 
 
-@registry.register("take")
+@registry.register("take", pure=True)
 def take(value: Any, count: int) -> Any:
     """
     Return the first N items from a collection or string.
@@ -169,7 +169,7 @@ def take(value: Any, count: int) -> Any:
     return value[:count]
 
 
-@registry.register("union")
+@registry.register("union", pure=True)
 def union(collection1: Any, collection2: Any) -> list:
     """
     Return a union of two collections.
@@ -191,7 +191,7 @@ def union(collection1: Any, collection2: Any) -> list:
     return list(set(collection1) | set(collection2))
 
 
-@registry.register("intersection")
+@registry.register("intersection", pure=True)
 def intersection(collection1: Any, collection2: Any) -> list:
     """
     Return an intersection of two collections.
@@ -213,7 +213,7 @@ def intersection(collection1: Any, collection2: Any) -> list:
     return list(set(collection1) & set(collection2))
 
 
-@registry.register("distinct")
+@registry.register("distinct", pure=True)
 def distinct(value: Any) -> list:
     """
     Return a list of distinct elements from a collection or string.
@@ -233,7 +233,7 @@ def distinct(value: Any) -> list:
     return list(dict.fromkeys(value))
 
 
-@registry.register("join")
+@registry.register("join", pure=True)
 def join(value: Any, delimiter: str = ",") -> str:
     """
     Join a collection of items into a string, separated by delimiter.
@@ -7,11 +7,11 @@ import urllib.parse
 import xml.etree.ElementTree as ET
 from typing import Any
 
-from fabrix.registry import registry
+from fabrix.registry import force, registry
 from fabrix.utils import as_bool, as_float, as_int, as_string
 
 
-@registry.register("array")
+@registry.register("array", pure=True)
 def array(value: Any) -> list[Any]:
     """
     Return an array from a single specified input.
@@ -29,7 +29,7 @@ def array(value: Any) -> list[Any]:
     return [value]
 
 
-@registry.register("base64")
+@registry.register("base64", pure=True)
 def base64_func(value: str) -> str:
     """
     Return the base64-encoded version for a string.
@@ -47,7 +47,7 @@ def base64_func(value: str) -> str:
     return base64.b64encode(str(value).encode("utf-8")).decode("utf-8")
 
 
-@registry.register("base64ToBinary")
+@registry.register("base64ToBinary", pure=True)
 def base64_to_binary(value: str) -> bytes:
     """
     Return the binary version for a base64-encoded string.
@@ -65,7 +65,7 @@ def base64_to_binary(value: str) -> bytes:
     return base64.b64decode(value)
 
 
-@registry.register("base64ToString")
+@registry.register("base64ToString", pure=True)
 def base64_to_string(value: str) -> str:
     """
     Return the string version for a base64-encoded string.
@@ -83,7 +83,7 @@ def base64_to_string(value: str) -> str:
     return base64.b64decode(value).decode("utf-8")
 
 
-@registry.register("binary")
+@registry.register("binary", pure=True)
 def binary(value: Any) -> bytes:
     """
     Return the binary version for an input value.
@@ -103,7 +103,7 @@ def binary(value: Any) -> bytes:
     return str(value).encode("utf-8")
 
 
-@registry.register("bool")
+@registry.register("bool", pure=True)
 def bool_func(value: Any) -> bool:
     """
     Return the Boolean version for an input value.
@@ -121,11 +121,13 @@ def bool_func(value: Any) -> bool:
     return as_bool(value)
 
 
-@registry.register("coalesce")
+@registry.register("coalesce", lazy=True, pure=True)
 def coalesce(*args: Any) -> Any:
     """
     Return the first non-null value from one or more parameters.
 
+    Parameters after the first non-null value are not evaluated.
+
     Parameters
     ----------
     *args : Any
@@ -137,12 +139,13 @@ def coalesce(*args: Any) -> Any:
         The first non-null argument, or None if all are null.
     """
     for arg in args:
-        if arg is not None:
-            return arg
+        value = force(arg)
+        if value is not None:
+            return value
     return None
 
 
-@registry.register("createArray")
+@registry.register("createArray", pure=True)
 def create_array(*args: Any) -> list[Any]:
     """
     Return an array from multiple inputs.
@@ -160,7 +163,7 @@ def create_array(*args: Any) -> list[Any]:
     return list(args)
 
 
-@registry.register("dataUri")
+@registry.register("dataUri", pure=True)
 def data_uri(value: Any) -> str:
     """
     Return the data URI for an input value.
@@ -180,7 +183,7 @@ def data_uri(value: Any) -> str:
     return f"data:text/plain;base64,{b64}"
 
 
-@registry.register("dataUriToBinary")
+@registry.register("dataUriToBinary", pure=True)
 def data_uri_to_binary(value: str) -> bytes:
     """
     Return the binary version for a data URI.
@@ -202,7 +205,7 @@ def data_uri_to_binary(value: str) -> bytes:
     return base64.b64decode(b64)
 
 
-@registry.register("dataUriToString")
+@registry.register("dataUriToString", pure=True)
 def data_uri_to_string(value: str) -> str:
     """
     Return the string version for a data URI.
@@ -220,7 +223,7 @@ def data_uri_to_string(value: str) -> str:
     return data_uri_to_binary(value).decode("utf-8")
 
 
-@registry.register("decodeBase64")
+@registry.register("decodeBase64", pure=True)
 def decode_base64(value: str) -> str:
     """
     Return the string version for a base64-encoded string.
@@ -238,7 +241,7 @@ def decode_base64(value: str) -> str:
     return base64.b64decode(value).decode("utf-8")
 
 
-@registry.register("decodeDataUri")
+@registry.register("decodeDataUri", pure=True)
 def decode_data_uri(value: str) -> bytes:
     """
     Return the binary version for a data URI.
@@ -256,7 +259,7 @@ def decode_data_uri(value: str) -> bytes:
     return data_uri_to_binary(value)
 
 
-@registry.register("decodeUriComponent")
+@registry.register("decodeUriComponent", pure=True)
 def decode_uri_component(value: str) -> str:
     """
     Return a string that replaces escape characters with decoded versions.
@@ -274,7 +277,7 @@ def decode_uri_component(value: str) -> str:
     return urllib.parse.unquote(str(value))
 
 
-@registry.register("encodeUriComponent")
+@registry.register("encodeUriComponent", pure=True)
 def encode_uri_component(value: str) -> str:
     """
     Return a string that replaces URL-unsafe characters with escape characters.
@@ -292,7 +295,7 @@ def encode_uri_component(value: str) -> str:
     return urllib.parse.quote(str(value), safe="")
 
 
-@registry.register("float")
+@registry.register("float", pure=True)
 def float_func(value: Any) -> float:
     """
     Return a floating point number for an input value.
@@ -310,7 +313,7 @@ def float_func(value: Any) -> float:
     return as_float(value)
 
 
-@registry.register("int")
+@registry.register("int", pure=True)
 def int_func(value: Any) -> int:
     """
     Return the integer version for a string.
@@ -329,7 +332,7 @@ def int_func(value: Any) -> int:
     return as_int(value)
 
 
-@registry.register("string")
+@registry.register("string", pure=True)
 def string_func(value: Any) -> str:
     """
     Return the string version for an input value.
@@ -347,7 +350,7 @@ def string_func(value: Any) -> str:
     return as_string(value)
 
 
-@registry.register("uriComponent")
+@registry.register("uriComponent", pure=True)
 def uri_component(value: str) -> str:
     """
     Return the URI-encoded version for an input value by replacing URL-unsafe characters with escape characters.
@@ -365,7 +368,7 @@ def uri_component(value: str) -> str:
     return urllib.parse.quote(str(value), safe="")
 
 
-@registry.register("uriComponentToBinary")
+@registry.register("uriComponentToBinary", pure=True)
 def uri_component_to_binary(value: str) -> bytes:
     """
     Return the binary version for a URI-encoded string.
@@ -383,7 +386,7 @@ def uri_component_to_binary(value: str) -> bytes:
     return urllib.parse.unquote_to_bytes(str(value))
 
 
-@registry.register("uriComponentToString")
+@registry.register("uriComponentToString", pure=True)
 def uri_component_to_string(value: str) -> str:
     """
     Return the string version for a URI-encoded string.
@@ -401,7 +404,7 @@ def uri_component_to_string(value: str) -> str:
     return urllib.parse.unquote(str(value))
 
 
-@registry.register("xml")
+@registry.register("xml", pure=True)
 def xml_func(value: str) -> ET.Element:
     """
     Return the XML version for a string.
@@ -419,7 +422,7 @@ def xml_func(value: str) -> ET.Element:
     return ET.fromstring(str(value))
 
 
-@registry.register("xpath")
+@registry.register("xpath", pure=True)
 def xpath(xml_value: Any, xpath_expr: str) -> list[Any]:
     """
     Check XML for nodes or values that match an XPath expression, and return the matching nodes or values.
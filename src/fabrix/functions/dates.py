@@ -2,17 +2,74 @@
 Implements date and time functions for Fabric expressions.
 """
 
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 from typing import Any, Literal
 
 import pytz
 from dateutil.relativedelta import relativedelta
 
+from fabrix.datetime_format import format_datetime
 from fabrix.registry import registry
+from fabrix.timezones import get_timezone
 from fabrix.utils import as_datetime, validate_timestamp_unit
 
+_TICKS_EPOCH = datetime(1, 1, 1, tzinfo=pytz.UTC)
 
-@registry.register("addDays")
+# Fixed-length units are added as a timedelta, which is much cheaper than a relativedelta
+_UNIT_DELTAS = {
+    "days": timedelta(days=1),
+    "hours": timedelta(hours=1),
+    "minutes": timedelta(minutes=1),
+    "seconds": timedelta(seconds=1),
+}
+
+
+def _delta(interval: int, unit: str) -> timedelta | relativedelta:
+    """Return `interval` units as a timedelta, or a relativedelta for months and years."""
+    unit = validate_timestamp_unit(unit)
+    step = _UNIT_DELTAS.get(unit)
+    if step is not None:
+        return step * interval
+    params: dict[str, Any] = {unit: interval}
+    return relativedelta(**params)
+
+
+def shift_timestamps(
+    timestamps: Iterable[Any],
+    interval: int,
+    unit: Literal["years", "months", "days", "hours", "minutes", "seconds"] | str,
+) -> list[str]:
+    """
+    Add the same number of time units to many timestamps at once.
+
+    The interval is computed once for the whole batch, e.g. to generate the
+    windows of a backfill. Use a negative interval to subtract.
+
+    Parameters
+    ----------
+    timestamps : Iterable[Any]
+        Input datetimes or ISO strings.
+    interval : int
+        Number of units to add.
+    unit : str
+        The time unit (years, months, days, hours, minutes or seconds).
+
+    Returns
+    -------
+    list[str]
+        ISO formatted strings, in input order.
+
+    Examples
+    --------
+    >>> shift_timestamps(["2024-01-01T00:00:00", "2024-01-31T00:00:00"], 1, "months")
+    ['2024-02-01T00:00:00+00:00', '2024-02-29T00:00:00+00:00']
+    """
+    delta = _delta(interval, unit)
+    return [(as_datetime(timestamp) + delta).isoformat() for timestamp in timestamps]
+
+
+@registry.register("addDays", pure=True)
 def add_days(timestamp: str, days: str) -> str:
     """
     Add a number of days to a timestamp.
@@ -30,37 +87,37 @@ def add_days(timestamp: str, days: str) -> str:
         ISO formatted string.
     """
     d = as_datetime(timestamp)
-    return (d + relativedelta(days=int(days))).isoformat()
+    return (d + timedelta(days=int(days))).isoformat()
 
 
-@registry.register("addHours")
+@registry.register("addHours", pure=True)
 def add_hours(timestamp: str, hours: str) -> str:
     """
     Add a number of hours to a timestamp.
     """
     d = as_datetime(timestamp)
-    return (d + relativedelta(hours=int(hours))).isoformat()
+    return (d + timedelta(hours=int(hours))).isoformat()
 
 
-@registry.register("addMinutes")
+@registry.register("addMinutes", pure=True)
 def add_minutes(timestamp: str, minutes: str) -> str:
     """
     Add a number of minutes to a timestamp.
     """
     d = as_datetime(timestamp)
-    return (d + relativedelta(minutes=int(minutes))).isoformat()
+    return (d + timedelta(minutes=int(minutes))).isoformat()
 
 
-@registry.register("addSeconds")
+@registry.register("addSeconds", pure=True)
 def add_seconds(timestamp: str, seconds: str) -> str:
     """
     Add a number of seconds to a timestamp.
     """
     d = as_datetime(timestamp)
-    return (d + relativedelta(seconds=int(seconds))).isoformat()
+    return (d + timedelta(seconds=int(seconds))).isoformat()
 
 
-@registry.register("addToTime")
+@registry.register("addToTime", pure=True)
 def add_to_time(
     timestamp: str,
     interval: int,
@@ -69,43 +126,38 @@ def add_to_time(
     """
     Add a number of time units to a timestamp.
     """
-    unit = validate_timestamp_unit(unit)
-
     d = as_datetime(timestamp)
-    params: dict[str, Any] = {unit: interval}
+    return (d + _delta(interval, unit)).isoformat()
 
-    delta = relativedelta(**params)
-    return (d + delta).isoformat()
 
-
-@registry.register("convertFromUtc")
+@registry.register("convertFromUtc", pure=True)
 def convert_from_utc(timestamp: str, timezone: str) -> str:
     """
     Convert a timestamp from UTC to the target time zone.
     """
     d = as_datetime(timestamp)
-    return d.astimezone(pytz.timezone(timezone)).isoformat()
+    return d.astimezone(get_timezone(timezone)).isoformat()
 
 
-@registry.register("convertTimeZone")
+@registry.register("convertTimeZone", pure=True)
 def convert_time_zone(timestamp: str, from_tz: str, to_tz: str) -> str:
     """
     Convert a timestamp from the source time zone to the target time zone.
     """
     d = as_datetime(timestamp, from_tz)
-    return d.astimezone(pytz.timezone(to_tz)).isoformat()
+    return d.astimezone(get_timezone(to_tz)).isoformat()
 
 
-@registry.register("convertToUtc")
+@registry.register("convertToUtc", pure=True)
 def convert_to_utc(timestamp: Any, from_tz: str) -> str:
     """
     Convert a timestamp from the source time zone to UTC.
     """
     d = as_datetime(timestamp, from_tz)
-    return d.astimezone(pytz.timezone("UTC")).isoformat()
+    return d.astimezone(pytz.UTC).isoformat()
 
 
-@registry.register("dayOfMonth")
+@registry.register("dayOfMonth", pure=True)
 def day_of_month(timestamp: Any) -> int:
     """
     Return the day of the month component from a timestamp.
@@ -114,7 +166,7 @@ def day_of_month(timestamp: Any) -> int:
     return d.day
 
 
-@registry.register("dayOfWeek")
+@registry.register("dayOfWeek", pure=True)
 def day_of_week(timestamp: Any) -> int:
     """
     Return the day of the week component from a timestamp (Monday=0, Sunday=6).
@@ -123,7 +175,7 @@ def day_of_week(timestamp: Any) -> int:
     return d.weekday()
 
 
-@registry.register("dayOfYear")
+@registry.register("dayOfYear", pure=True)
 def day_of_year(timestamp: Any) -> int:
     """
     Return the day of the year component from a timestamp.
@@ -132,16 +184,19 @@ def day_of_year(timestamp: Any) -> int:
     return d.timetuple().tm_yday
 
 
-@registry.register("formatDateTime")
+@registry.register("formatDateTime", pure=True)
 def format_date_time(timestamp: Any, fmt: str = "%Y-%m-%dT%H:%M:%S") -> str:
     """
     Return the timestamp as a string in optional format.
+
+    The format is a .NET standard or custom format string (e.g. `'o'` or
+    `'yyyy-MM-ddTHH:mm:ss.fffZ'`), or a strftime pattern if it contains `%`.
     """
     d = as_datetime(timestamp)
-    return d.strftime(fmt)
+    return format_datetime(d, fmt)
 
 
-@registry.register("getFutureTime")
+@registry.register("getFutureTime", pure=False)
 def get_future_time(
     interval: int,
     unit: Literal["years", "months", "days", "hours", "minutes", "seconds"] | str,
@@ -150,17 +205,14 @@ def get_future_time(
     """
     Return the current timestamp plus the specified time units.
     """
-    unit = validate_timestamp_unit(unit)
-
-    now = datetime.now(pytz.timezone("UTC"))
-    params: dict[str, Any] = {unit: interval}
-    delta = relativedelta(**params)
+    now = datetime.now(pytz.UTC)
+    delta = _delta(interval, unit)
 
     timestamp = now + delta
-    return timestamp.strftime(format_str)
+    return format_datetime(timestamp, format_str)
 
 
-@registry.register("getPastTime")
+@registry.register("getPastTime", pure=False)
 def get_past_time(
     interval: int,
     unit: Literal["years", "months", "days", "hours", "minutes", "seconds"] | str,
@@ -169,17 +221,14 @@ def get_past_time(
     """
     Return the current timestamp minus the specified time units.
     """
-    unit = validate_timestamp_unit(unit)
-
-    now = datetime.now(pytz.timezone("UTC"))
-    params: dict[str, Any] = {unit: interval}
-    delta = relativedelta(**params)
+    now = datetime.now(pytz.UTC)
+    delta = _delta(interval, unit)
 
     timestamp = now - delta
-    return timestamp.strftime(format_str)
+    return format_datetime(timestamp, format_str)
 
 
-@registry.register("startOfDay")
+@registry.register("startOfDay", pure=True)
 def start_of_day(timestamp: Any) -> str:
     """
     Return the start of the day for a timestamp.
@@ -188,7 +237,7 @@ def start_of_day(timestamp: Any) -> str:
     return d.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
 
 
-@registry.register("startOfHour")
+@registry.register("startOfHour", pure=True)
 def start_of_hour(timestamp: Any) -> str:
     """
     Return the start of the hour for a timestamp.
@@ -197,7 +246,7 @@ def start_of_hour(timestamp: Any) -> str:
     return d.replace(minute=0, second=0, microsecond=0).isoformat()
 
 
-@registry.register("startOfMonth")
+@registry.register("startOfMonth", pure=True)
 def start_of_month(timestamp: Any) -> str:
     """
     Return the start of the month for a timestamp.
@@ -206,7 +255,7 @@ def start_of_month(timestamp: Any) -> str:
     return d.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
 
 
-@registry.register("subtractFromTime")
+@registry.register("subtractFromTime", pure=True)
 def subtract_from_time(
     timestamp: str,
     interval: int,
@@ -215,30 +264,23 @@ def subtract_from_time(
     """
     Subtract a number of time units from a timestamp.
     """
-    unit = validate_timestamp_unit(unit)
-
     d = as_datetime(timestamp)
-    params: dict[str, Any] = {unit: interval}
-
-    delta = relativedelta(**params)
-    return (d - delta).isoformat()
+    return (d - _delta(interval, unit)).isoformat()
 
 
-@registry.register("ticks")
+@registry.register("ticks", pure=True)
 def ticks(timestamp: Any) -> int:
     """
     Return the ticks property value for a specified timestamp.
     """
     d = as_datetime(timestamp)
-    # .NET ticks: 1 tick = 100ns since 0001-01-01T00:00:00
-    epoch = datetime(1, 1, 1, tzinfo=pytz.timezone("UTC"))
-    delta = d - epoch
-    return int(delta.total_seconds() * 10**7)
+    # .NET ticks: 1 tick = 100ns since 0001-01-01T00:00:00, computed in integers to stay exact
+    return (d - _TICKS_EPOCH) // timedelta(microseconds=1) * 10
 
 
-@registry.register("utcNow")
+@registry.register("utcNow", pure=False)
 def utc_now() -> str:
     """
     Return the current timestamp as a string.
     """
-    return datetime.now(pytz.timezone("UTC")).isoformat()
+    return datetime.now(pytz.UTC).isoformat()
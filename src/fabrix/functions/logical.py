@@ -4,15 +4,17 @@ Implements logical and comparison functions for Fabric expressions.
 
 from typing import Any
 
-from fabrix.registry import registry
+from fabrix.registry import force, registry
 from fabrix.utils import as_bool, as_float
 
 
-@registry.register("and")
+@registry.register("and", lazy=True, pure=True)
 def and_func(expression_1: bool, expression_2: bool) -> bool:
     """
     Check whether all expressions are true.
 
+    The second expression is only evaluated if the first one is true.
+
     Parameters
     ----------
     expression_1 : bool
@@ -25,10 +27,10 @@ def and_func(expression_1: bool, expression_2: bool) -> bool:
     bool
         True if all arguments are true, else False.
     """
-    return all(as_bool(arg) for arg in (expression_1, expression_2))
+    return as_bool(force(expression_1)) and as_bool(force(expression_2))
 
 
-@registry.register("equals")
+@registry.register("equals", pure=True)
 def equals(a: Any, b: Any) -> bool:
     """
     Check whether both values are equivalent.
@@ -48,7 +50,7 @@ def equals(a: Any, b: Any) -> bool:
     return a == b
 
 
-@registry.register("greater")
+@registry.register("greater", pure=True)
 def greater(a: Any, b: Any) -> bool:
     """
     Check whether the first value is greater than the second value.
@@ -68,7 +70,7 @@ def greater(a: Any, b: Any) -> bool:
     return as_float(a) > as_float(b)
 
 
-@registry.register("greaterOrEquals")
+@registry.register("greaterOrEquals", pure=True)
 def greater_or_equals(expression_1: bool, expression_2: bool) -> bool:
     """
     Check whether the first value is greater than or equal to the second value.
@@ -88,11 +90,13 @@ def greater_or_equals(expression_1: bool, expression_2: bool) -> bool:
     return as_float(expression_1) >= as_float(expression_2)
 
 
-@registry.register("if")
+@registry.register("if", lazy=True, pure=True)
 def if_func(condition: Any, if_true: Any, if_false: Any) -> Any:
     """
     Check whether an expression is true or false. Based on the result, return a specified value.
 
+    Only the returned value is evaluated.
+
     Parameters
     ----------
     condition : Any
@@ -107,10 +111,10 @@ def if_func(condition: Any, if_true: Any, if_false: Any) -> Any:
     any
         if_true if condition is true, else if_false.
     """
-    return if_true if as_bool(condition) else if_false
+    return force(if_true) if as_bool(force(condition)) else force(if_false)
 
 
-@registry.register("less")
+@registry.register("less", pure=True)
 def less(a: Any, b: Any) -> bool:
     """
     Check whether the first value is less than the second value.
@@ -130,7 +134,7 @@ def less(a: Any, b: Any) -> bool:
     return float(a) < float(b)
 
 
-@registry.register("lessOrEquals")
+@registry.register("lessOrEquals", pure=True)
 def less_or_equals(a: Any, b: Any) -> bool:
     """
     Check whether the first value is less than or equal to the second value.
@@ -150,7 +154,7 @@ def less_or_equals(a: Any, b: Any) -> bool:
     return as_float(a) <= as_float(b)
 
 
-@registry.register("not")
+@registry.register("not", pure=True)
 def not_func(value: Any) -> bool:
     """
     Check whether an expression is false.
@@ -168,11 +172,13 @@ def not_func(value: Any) -> bool:
     return not as_bool(value)
 
 
-@registry.register("or")
+@registry.register("or", lazy=True, pure=True)
 def or_func(expression_1: bool, expression_2: bool) -> bool:
     """
     Check whether at least one expression is true.
 
+    The second expression is only evaluated if the first one is false.
+
     Parameters
     ----------
     expression_1 : bool
@@ -185,4 +191,4 @@ def or_func(expression_1: bool, expression_2: bool) -> bool:
     bool
         True if any argument is true, else False.
     """
-    return any(as_bool(arg) for arg in (expression_1, expression_2))
+    return as_bool(force(expression_1)) or as_bool(force(expression_2))
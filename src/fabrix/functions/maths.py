@@ -8,7 +8,7 @@ from typing import Any
 from fabrix.registry import registry
 
 
-@registry.register("add")
+@registry.register("add", pure=True)
 def add(
     *args: Any,
 ) -> float:
@@ -28,7 +28,7 @@ def add(
     return sum(float(arg) for arg in args)
 
 
-@registry.register("sub")
+@registry.register("sub", pure=True)
 def sub(
     a: Any,
     b: Any,
@@ -52,7 +52,7 @@ def sub(
     return result
 
 
-@registry.register("mul")
+@registry.register("mul", pure=True)
 def mul(
     *args: Any,
 ) -> float:
@@ -75,7 +75,7 @@ def mul(
     return result
 
 
-@registry.register("div")
+@registry.register("div", pure=True)
 def div(
     numerator: Any,
     denominator: Any,
@@ -98,7 +98,7 @@ def div(
     return float(numerator) / float(denominator)
 
 
-@registry.register("mod")
+@registry.register("mod", pure=True)
 def mod(
     a: Any,
     b: Any,
@@ -121,7 +121,7 @@ def mod(
     return float(a) % float(b)
 
 
-@registry.register("max")
+@registry.register("max", pure=True)
 def max_func(
     *args: Any,
 ) -> float:
@@ -141,7 +141,7 @@ def max_func(
     return max(float(arg) for arg in args)
 
 
-@registry.register("min")
+@registry.register("min", pure=True)
 def min_func(
     *args: Any,
 ) -> float:
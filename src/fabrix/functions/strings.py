@@ -9,7 +9,7 @@ from fabrix.registry import registry
 from fabrix.utils import as_int, as_string
 
 
-@registry.register("concat")
+@registry.register("concat", pure=True)
 def concat(*args: Any) -> str:
     """
     Combine two or more strings, and return the combined string.
@@ -27,7 +27,7 @@ def concat(*args: Any) -> str:
     return "".join(as_string(arg) for arg in args)
 
 
-@registry.register("endsWith")
+@registry.register("endsWith", pure=True)
 def ends_with(
     string: str,
     suffix: str,
@@ -50,7 +50,7 @@ def ends_with(
     return str(string).endswith(str(suffix))
 
 
-@registry.register("guid")
+@registry.register("guid", pure=False)
 def guid() -> str:
     """
     Generate a globally unique identifier (GUID) as a string.
@@ -66,7 +66,7 @@ def guid() -> str:
     return as_string(uuid.uuid4())
 
 
-@registry.register("indexOf")
+@registry.register("indexOf", pure=True)
 def index_of(string: str, substring: str) -> int:
     """
     Return the starting position for a substring.
@@ -87,7 +87,7 @@ def index_of(string: str, substring: str) -> int:
     return index if index >= 0 else 0
 
 
-@registry.register("lastIndexOf")
+@registry.register("lastIndexOf", pure=True)
 def last_index_of(string: str, substring: str) -> int:
     """
     Return the starting position for the last occurrence of a substring.
@@ -108,7 +108,7 @@ def last_index_of(string: str, substring: str) -> int:
     return index if index >= 0 else 0
 
 
-@registry.register("replace")
+@registry.register("replace", pure=True)
 def replace(string: str, old: str, new: str) -> str:
     """
     Replace a substring with the specified string, and return the updated string.
@@ -130,7 +130,7 @@ def replace(string: str, old: str, new: str) -> str:
     return as_string(string).replace(as_string(old), as_string(new))
 
 
-@registry.register("split")
+@registry.register("split", pure=True)
 def split(
     string: str,
     delimiter: str | None = ",",
@@ -153,7 +153,7 @@ def split(
     return as_string(string).split(delimiter if delimiter is not None else ",")
 
 
-@registry.register("startsWith")
+@registry.register("startsWith", pure=True)
 def starts_with(string: str, prefix: str) -> bool:
     """
     Check whether a string starts with a specific substring.
@@ -173,7 +173,7 @@ def starts_with(string: str, prefix: str) -> bool:
     return as_string(string).startswith(as_string(prefix))
 
 
-@registry.register("substring")
+@registry.register("substring", pure=True)
 def substring(
     string: str,
     start: int,
@@ -209,7 +209,7 @@ def substring(
     return s[start : start + length]
 
 
-@registry.register("toLower")
+@registry.register("toLower", pure=True)
 def to_lower(string: str) -> str:
     """
     Return a string in lowercase format.
@@ -227,7 +227,7 @@ def to_lower(string: str) -> str:
     return as_string(string).lower()
 
 
-@registry.register("toUpper")
+@registry.register("toUpper", pure=True)
 def to_upper(string: str) -> str:
     """
     Return a string in uppercase format.
@@ -245,7 +245,7 @@ def to_upper(string: str) -> str:
     return as_string(string).upper()
 
 
-@registry.register("trim")
+@registry.register("trim", pure=True)
 def trim(string: str) -> str:
     """
     Remove leading and trailing whitespace from a string, and return the updated string.
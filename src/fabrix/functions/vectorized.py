@@ -0,0 +1,281 @@
+"""
+Vectorized variants of date and time functions over NumPy `datetime64` arrays.
+
+Each variant takes one array (or sequence) per argument, scalars are broadcast,
+and is registered with `registry.vectorize` next to the scalar function, so
+`evaluate_many` uses it automatically (see `fabrix.vectorize`). Timestamps are
+`datetime64[us]` arrays of UTC times; other offsets cannot be represented, so
+the variants raise a `ValueError` for them and the batch falls back to the
+scalar functions.
+
+The variants are only registered if NumPy is installed (`pip install fabrix[numpy]`).
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Literal
+
+import pytz
+
+from fabrix.datetime_format import compile_format
+from fabrix.registry import registry
+from fabrix.utils import as_datetime, validate_timestamp_unit
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None  # type: ignore[assignment]
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Microseconds from 0001-01-01 (the .NET ticks epoch) to 1970-01-01 (the datetime64 epoch)
+_EPOCH_MICROSECONDS = (_UNIX_EPOCH - datetime(1, 1, 1)) // _MICROSECOND
+
+_UNIT_CODES = {"days": "D", "hours": "h", "minutes": "m", "seconds": "s"}
+
+# Formats equal to `numpy.datetime_as_string` with the given unit
+_ISO_FORMATS: dict[str, Literal["D", "s"]] = {
+    "%Y-%m-%dT%H:%M:%S": "s",
+    "yyyy-MM-ddTHH:mm:ss": "s",
+    "s": "s",
+    "%Y-%m-%d": "D",
+    "yyyy-MM-dd": "D",
+}
+
+_ZERO = timedelta(0)
+
+
+def _vectorize(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register the decorated function as the vectorized variant of `name`, if NumPy is installed."""
+    if np is None:  # pragma: no cover - numpy is an optional extra
+        return lambda fn: fn
+    return registry.vectorize(name)  # type: ignore[no-any-return]
+
+
+def as_datetime64(timestamps: Any) -> Any:
+    """
+    Convert timestamps to an array of UTC times.
+
+    Parameters
+    ----------
+    timestamps : Any
+        A `datetime64` array, or one or many datetimes or ISO strings.
+
+    Returns
+    -------
+    numpy.ndarray
+        The timestamps as `datetime64[us]`.
+
+    Raises
+    ------
+    ValueError
+        If a timestamp cannot be parsed or is not in UTC.
+    """
+    array = np.asarray(timestamps)
+    if array.dtype.kind == "M":
+        return array.astype("datetime64[us]")
+    microseconds = np.fromiter(map(_utc_microseconds, array.ravel().tolist()), dtype=np.int64, count=array.size)
+    return microseconds.view("datetime64[us]").reshape(array.shape)
+
+
+@lru_cache(maxsize=4096)
+def _utc_microseconds(timestamp: Any) -> int:
+    """Parse a timestamp to microseconds since 1970-01-01 UTC (cached)."""
+    value = as_datetime(timestamp)
+    if value.utcoffset() != _ZERO:
+        raise ValueError(f"Timestamp {timestamp!r} is not in UTC.")
+    return (value.replace(tzinfo=None) - _UNIX_EPOCH) // _MICROSECOND
+
+
+def _integers(values: Any) -> Any:
+    """Convert values to an int64 array, like `int()` does for scalars."""
+    array = np.asarray(values)
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64)
+    return np.array([int(value) for value in array.ravel().tolist()], dtype=np.int64).reshape(array.shape)
+
+
+def _same(values: Any, name: str) -> Any:
+    """Return the value of an argument that must be the same for all rows."""
+    if isinstance(values, str):
+        return values
+    first, *others = values
+    if any(value != first for value in others):
+        raise ValueError(f"The {name} must be the same for all rows.")
+    return first
+
+
+def _add_months(timestamps: Any, months: Any) -> Any:
+    """Add calendar months, clipping the day to the end of the month like `relativedelta`."""
+    days = timestamps.astype("datetime64[D]")
+    month = days.astype("datetime64[M]")
+    target = month + months
+    start = target.astype("datetime64[D]")
+    month_length = (target + 1).astype("datetime64[D]") - start
+    day = np.minimum(days - month.astype("datetime64[D]"), month_length - 1)
+    return start + day + (timestamps - days)
+
+
+@_vectorize("addDays")
+def add_days(timestamps: Any, days: Any) -> Any:
+    """
+    Add a number of days to many timestamps.
+
+    Parameters
+    ----------
+    timestamps : Any
+        Input timestamps (see `as_datetime64`).
+    days : Any
+        Number of days to add, per row or for all rows.
+
+    Returns
+    -------
+    numpy.ndarray
+        The shifted timestamps as `datetime64[us]`.
+    """
+    return as_datetime64(timestamps) + _integers(days).astype("timedelta64[D]")
+
+
+@_vectorize("addToTime")
+def add_to_time(timestamps: Any, interval: Any, unit: Any) -> Any:
+    """
+    Add a number of time units to many timestamps.
+
+    Parameters
+    ----------
+    timestamps : Any
+        Input timestamps (see `as_datetime64`).
+    interval : Any
+        Integer number of units to add, per row or for all rows.
+    unit : Any
+        The time unit (years, months, days, hours, minutes or seconds), the same for all rows.
+
+    Returns
+    -------
+    numpy.ndarray
+        The shifted timestamps as `datetime64[us]`.
+
+    Raises
+    ------
+    TypeError
+        If the intervals are not integers.
+    ValueError
+        If the unit is invalid or differs between rows.
+    """
+    unit = validate_timestamp_unit(_same(unit, "unit"))
+    intervals = np.asarray(interval)
+    if intervals.dtype.kind not in "iu":
+        raise TypeError("The intervals must be integers.")
+    timestamps = as_datetime64(timestamps)
+    if unit in _UNIT_CODES:
+        return timestamps + intervals.astype(f"timedelta64[{_UNIT_CODES[unit]}]")
+    return _add_months(timestamps, intervals * 12 if unit == "years" else intervals)
+
+
+@_vectorize("startOfDay")
+def start_of_day(timestamps: Any) -> Any:
+    """
+    Return the start of the day for many timestamps.
+
+    Parameters
+    ----------
+    timestamps : Any
+        Input timestamps (see `as_datetime64`).
+
+    Returns
+    -------
+    numpy.ndarray
+        Midnight of each day as `datetime64[us]`.
+    """
+    return as_datetime64(timestamps).astype("datetime64[D]").astype("datetime64[us]")
+
+
+@_vectorize("startOfMonth")
+def start_of_month(timestamps: Any) -> Any:
+    """
+    Return the start of the month for many timestamps.
+
+    Parameters
+    ----------
+    timestamps : Any
+        Input timestamps (see `as_datetime64`).
+
+    Returns
+    -------
+    numpy.ndarray
+        Midnight of the first day of each month as `datetime64[us]`.
+    """
+    return as_datetime64(timestamps).astype("datetime64[M]").astype("datetime64[us]")
+
+
+@_vectorize("dayOfWeek")
+def day_of_week(timestamps: Any) -> Any:
+    """
+    Return the day of the week for many timestamps (Monday=0, Sunday=6).
+
+    Parameters
+    ----------
+    timestamps : Any
+        Input timestamps (see `as_datetime64`).
+
+    Returns
+    -------
+    numpy.ndarray
+        The weekdays as int64.
+    """
+    # 1970-01-01, day 0 of datetime64, was a Thursday
+    return (as_datetime64(timestamps).astype("datetime64[D]").astype(np.int64) + 3) % 7
+
+
+@_vectorize("ticks")
+def ticks(timestamps: Any) -> Any:
+    """
+    Return the .NET ticks (100ns since 0001-01-01) of many timestamps.
+
+    Parameters
+    ----------
+    timestamps : Any
+        Input timestamps (see `as_datetime64`).
+
+    Returns
+    -------
+    numpy.ndarray
+        The ticks as int64.
+    """
+    return (as_datetime64(timestamps).astype(np.int64) + _EPOCH_MICROSECONDS) * 10
+
+
+@_vectorize("formatDateTime")
+def format_date_time(timestamps: Any, fmt: Any = "%Y-%m-%dT%H:%M:%S") -> Any:
+    """
+    Format many timestamps with the same format string.
+
+    ISO formats (e.g. `'yyyy-MM-dd'`) are formatted by NumPy, others with the
+    compiled .NET format string (or strftime pattern) of `formatDateTime`.
+
+    Parameters
+    ----------
+    timestamps : Any
+        Input timestamps (see `as_datetime64`).
+    fmt : Any, default "%Y-%m-%dT%H:%M:%S"
+        The format string, the same for all rows.
+
+    Returns
+    -------
+    numpy.ndarray
+        The formatted strings.
+
+    Raises
+    ------
+    ValueError
+        If the format string is invalid or differs between rows.
+    """
+    fmt = _same(fmt, "format")
+    timestamps = as_datetime64(timestamps)
+    if fmt in _ISO_FORMATS:
+        return np.datetime_as_string(timestamps, unit=_ISO_FORMATS[fmt])
+    formatter = (lambda value: value.strftime(fmt)) if "%" in fmt else compile_format(fmt)
+    values = [formatter(value.replace(tzinfo=pytz.UTC)) for value in timestamps.astype(object).ravel().tolist()]
+    return np.array(values, dtype=object).reshape(timestamps.shape)
@@ -0,0 +1,361 @@
+"""
+Lazily parsed, memory-mapped JSON documents.
+
+Large activity outputs (Lookup, GetMetadata, Web) can be hundreds of
+megabytes of JSON. `JsonSource` memory-maps such a file, and the views
+`LazyObject` / `LazyArray` only scan the structure of the containers that are
+actually accessed: keys are decoded, values are skipped over until they are
+requested. Scalars are decoded on access, nested containers become views
+again, and everything that was looked up is cached.
+"""
+
+import json
+import mmap
+import os
+import re
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+_WHITESPACE = re.compile(rb"\s*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*+"', re.DOTALL)
+# runs of anything but brackets (strings included), followed by the next bracket.
+# Possessive, so truncated documents fail in linear time instead of backtracking.
+_STRUCTURE = re.compile(rb'(?:[^"\[\]{}]++|"(?:[^"\\]|\\.)*+")*+([\[\]{}])', re.DOTALL)
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+
+_QUOTE, _COMMA, _COLON = ord('"'), ord(","), ord(":")
+_OPEN_OBJECT, _CLOSE_OBJECT = ord("{"), ord("}")
+_OPEN_ARRAY, _CLOSE_ARRAY = ord("["), ord("]")
+
+
+class JsonSource:
+    """
+    A memory-mapped JSON file.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the JSON file.
+
+    Attributes
+    ----------
+    path : str
+        Path of the JSON file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                raise ValueError(f"JSON file {self.path!r} is empty.")
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def root(self) -> Any:
+        """Return the top-level value (a view for objects and arrays)."""
+        buffer = self.buffer
+        end = len(buffer)
+        while end > 0 and buffer[end - 1] in b" \t\r\n":
+            end -= 1
+        # the root spans the whole file, so it is not scanned to find its end
+        return _value(self, _skip_whitespace(buffer, 0), end)
+
+    def close(self) -> None:
+        """Unmap the file. Views of the source must not be used afterwards."""
+        self.buffer.close()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # pickled by path, so worker processes map the file themselves
+        return JsonSource, (self.path,)
+
+    def __repr__(self) -> str:
+        return f"JsonSource({self.path!r})"
+
+
+class LazyJson:
+    """
+    Base class of the lazy views of a JSON container.
+
+    Attributes
+    ----------
+    source : JsonSource
+        The file the container is read from.
+    start : int
+        Offset of the opening bracket.
+    """
+
+    __slots__ = ("source", "start", "_end", "_cursor", "_materialized")
+
+    # the closing bracket of the container, set by the subclasses
+    _close: int
+
+    def __init__(self, source: JsonSource, start: int, end: int | None = None) -> None:
+        self.source = source
+        self.start = start
+        self._end = end
+        # (offset, pending): the next unscanned member, None once fully scanned.
+        # If pending, the offset is the start of the last scanned value, which is
+        # skipped only when scanning resumes. One tuple, so threads never see a torn cursor.
+        self._cursor: tuple[int | None, bool] = (_skip_whitespace(source.buffer, start + 1), False)
+        self._materialized: Any = None
+
+    @property
+    def end(self) -> int:
+        """Return the offset after the closing bracket (found on first use)."""
+        if self._end is None:
+            self._end = _skip_value(self.source.buffer, self.start)
+        return self._end
+
+    def materialize(self) -> Any:
+        """
+        Parse the whole container into plain Python objects (cached).
+
+        Returns
+        -------
+        Any
+            The parsed dict or list.
+        """
+        if self._materialized is None:
+            self._materialized = json.loads(self.source.buffer[self.start : self.end])
+        return self._materialized
+
+    def _resume(self) -> int | None:
+        """Return the offset of the next unscanned member."""
+        position, pending = self._cursor
+        if position is not None and pending:
+            position = _next(self.source.buffer, _skip_value(self.source.buffer, position), self._close)
+        return position
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.source, self.start)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source.path!r}, offset={self.start})"
+
+
+class LazyObject(LazyJson, Mapping[str, Any]):
+    """
+    A read-only mapping view of a JSON object.
+
+    The members are scanned on first access: keys are decoded, values are only
+    skipped over. Like `json`, the last of duplicate keys wins.
+    """
+
+    __slots__ = ("_starts", "_values")
+
+    _close = _CLOSE_OBJECT
+
+    def __init__(self, source: JsonSource, start: int, end: int | None = None) -> None:
+        super().__init__(source, start, end)
+        self._starts: dict[str, int] = {}
+        self._values: dict[str, Any] = {}
+
+    def _scan(self) -> None:
+        """Scan all remaining members."""
+        buffer, starts = self.source.buffer, self._starts
+        position = self._resume()
+        while position is not None:
+            member, value_start = _read_key(buffer, position)
+            if member is None:
+                break
+            # a later duplicate overrides the earlier one, as in `json.loads`
+            starts[member] = value_start
+            position = _next(buffer, _skip_value(buffer, value_start), _CLOSE_OBJECT)
+        self._cursor = (None, False)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if self._cursor[0] is not None:
+            self._scan()
+        value = self._values[key] = _value(self.source, self._starts[key])
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        self._scan()
+        return iter(self._starts)
+
+    def __len__(self) -> int:
+        self._scan()
+        return len(self._starts)
+
+
+class LazyArray(LazyJson, Sequence[Any]):
+    """
+    A read-only sequence view of a JSON array.
+
+    Indexing scans the array up to the requested element and keeps the element
+    offsets and the parsed element (cached). Iterating streams the elements and
+    keeps nothing, so arrays of any size can be consumed with flat memory.
+    """
+
+    __slots__ = ("_starts", "_values")
+
+    _close = _CLOSE_ARRAY
+
+    def __init__(self, source: JsonSource, start: int, end: int | None = None) -> None:
+        super().__init__(source, start, end)
+        self._starts: list[int] = []
+        # parsed elements by offset, so negative and positive indexes share an entry
+        self._values: dict[int, Any] = {}
+
+    def _scan(self, count: int | None = None) -> None:
+        """Scan elements until `count` are known, or all if `count` is None."""
+        buffer, starts = self.source.buffer, self._starts
+        position = self._resume()
+        if position is not None and buffer[position] == _CLOSE_ARRAY:
+            position = None
+        while position is not None:
+            starts.append(position)
+            if count is not None and len(starts) >= count:
+                self._cursor = (position, True)
+                return
+            position = _next(buffer, _skip_value(buffer, position), _CLOSE_ARRAY)
+        self._cursor = (position, False)
+
+    def __getitem__(self, index: int) -> Any:  # type: ignore[override]
+        starts = self._starts
+        if self._cursor[0] is not None and (index < 0 or index >= len(starts)):
+            self._scan(None if index < 0 else index + 1)
+        start = starts[index]
+        try:
+            return self._values[start]
+        except KeyError:
+            pass
+        value = self._values[start] = _value(self.source, start)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        source = self.source
+        return (_value(source, start, end) for start, end in _elements(source.buffer, self.start))
+
+    def stream(self) -> Iterator[Any]:
+        """
+        Parse the elements one at a time into plain Python objects.
+
+        Nothing is kept, so memory stays flat however large the array is.
+
+        Yields
+        ------
+        Any
+            The parsed elements, in order.
+        """
+        buffer = self.source.buffer
+        for start, end in _elements(buffer, self.start):
+            yield json.loads(buffer[start:end])
+
+    def __len__(self) -> int:
+        self._scan()
+        return len(self._starts)
+
+
+def load(path: str | os.PathLike[str]) -> Any:
+    """
+    Memory-map a JSON file and return a lazy view of its top-level value.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the JSON file.
+
+    Returns
+    -------
+    Any
+        A `LazyObject` or `LazyArray` for containers, the decoded value otherwise.
+    """
+    return JsonSource(path).root
+
+
+def materialize(value: Any) -> Any:
+    """
+    Return plain Python objects for a lazy view, or the value itself otherwise.
+
+    Parameters
+    ----------
+    value : Any
+        A `LazyJson` view or any other value.
+
+    Returns
+    -------
+    Any
+        The parsed value.
+    """
+    return value.materialize() if isinstance(value, LazyJson) else value
+
+
+def _value(source: JsonSource, start: int, end: int | None = None) -> Any:
+    first = source.buffer[start]
+    if first == _OPEN_OBJECT:
+        return LazyObject(source, start, end)
+    if first == _OPEN_ARRAY:
+        return LazyArray(source, start, end)
+    return json.loads(source.buffer[start : end or _skip_value(source.buffer, start)])
+
+
+def _skip_whitespace(buffer: Any, position: int) -> int:
+    """Return the offset of the next non-whitespace byte, which must exist."""
+    position = _WHITESPACE.match(buffer, position).end()  # type: ignore[union-attr]
+    if position >= len(buffer):
+        raise ValueError(f"Unexpected end of JSON at offset {position}.")
+    return position
+
+
+def _skip_value(buffer: Any, position: int) -> int:
+    """Return the offset after the JSON value starting at `position`."""
+    first = buffer[position]
+    if first == _QUOTE:
+        return _match(_STRING, buffer, position)
+    if first not in (_OPEN_OBJECT, _OPEN_ARRAY):
+        return _match(_SCALAR, buffer, position)
+
+    depth = 0
+    while True:
+        match = _STRUCTURE.match(buffer, position)
+        if match is None:
+            raise ValueError(f"Unterminated JSON container at offset {position}.")
+        position = match.end()
+        depth += 1 if buffer[position - 1] in (_OPEN_OBJECT, _OPEN_ARRAY) else -1
+        if depth == 0:
+            return position
+
+
+def _match(pattern: re.Pattern[bytes], buffer: Any, position: int) -> int:
+    match = pattern.match(buffer, position)
+    if match is None:
+        raise ValueError(f"Invalid JSON at offset {position}.")
+    return match.end()
+
+
+def _elements(buffer: Any, start: int) -> Iterator[tuple[int, int]]:
+    """Yield the spans of the elements of the array starting at `start`."""
+    position: int | None = _skip_whitespace(buffer, start + 1)
+    if buffer[position] == _CLOSE_ARRAY:
+        return
+    while position is not None:
+        end = _skip_value(buffer, position)
+        yield position, end
+        position = _next(buffer, end, _CLOSE_ARRAY)
+
+
+def _read_key(buffer: Any, position: int) -> tuple[str | None, int]:
+    """Read the member key at `position`; return it and the start of its value (None if `}`)."""
+    if buffer[position] == _CLOSE_OBJECT:
+        return None, position
+    key_end = _match(_STRING, buffer, position)
+    key = json.loads(buffer[position:key_end])
+    position = _skip_whitespace(buffer, key_end)
+    if buffer[position] != _COLON:
+        raise ValueError(f"Expected ':' at offset {position}.")
+    return key, _skip_whitespace(buffer, position + 1)
+
+
+def _next(buffer: Any, value_end: int, close: int) -> int | None:
+    """Return the offset of the member after `value_end`, or None at the closing bracket."""
+    position = _skip_whitespace(buffer, value_end)
+    if buffer[position] == close:
+        return None
+    if buffer[position] != _COMMA:
+        raise ValueError(f"Expected ',' or {chr(close)!r} at offset {position}.")
+    return _skip_whitespace(buffer, position + 1)
@@ -0,0 +1,188 @@
+"""
+Single-pass tokenizer for Fabric/ADF expressions.
+
+The lexer understands both forms of an expression:
+
+- expression mode, `@<expression>`
+- template mode, `text @{<expression>} text` (with `@@` as an escaped `@`)
+
+and produces a flat list of tokens carrying their source spans. Characters
+that are not part of the expression grammar are emitted as `RAW` tokens, so
+the parser can keep unrecognized text verbatim.
+"""
+
+import re
+from enum import StrEnum
+from typing import NamedTuple
+
+from fabrix.exceptions import ExpressionSyntaxError
+
+
+class TokenKind(StrEnum):
+    AT = "at"
+    TEXT = "text"
+    INTERPOLATION_START = "interpolation_start"
+    INTERPOLATION_END = "interpolation_end"
+    IDENTIFIER = "identifier"
+    STRING = "string"
+    NUMBER = "number"
+    LPAREN = "("
+    RPAREN = ")"
+    LBRACKET = "["
+    RBRACKET = "]"
+    COMMA = ","
+    DOT = "."
+    QUESTION = "?"
+    RAW = "raw"
+    END = "end"
+
+
+class Token(NamedTuple):
+    """
+    A single token of an expression.
+
+    Attributes
+    ----------
+    kind : TokenKind
+        The token kind.
+    value : str
+        The token value. For strings the unescaped content, for text the literal text.
+    start : int
+        Start offset in the source (inclusive).
+    end : int
+        End offset in the source (exclusive).
+    """
+
+    kind: TokenKind
+    value: str
+    start: int
+    end: int
+
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<whitespace>(?:\s|\\[nr])+)
+    |(?P<string>'(?:[^']|'')*')
+    |(?P<number>[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<identifier>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<punctuation>[()\[\],.?}])
+    |(?P<raw>.)
+    """,
+    re.VERBOSE,
+)
+
+_PUNCTUATION: dict[str, TokenKind] = {
+    "(": TokenKind.LPAREN,
+    ")": TokenKind.RPAREN,
+    "[": TokenKind.LBRACKET,
+    "]": TokenKind.RBRACKET,
+    ",": TokenKind.COMMA,
+    ".": TokenKind.DOT,
+    "?": TokenKind.QUESTION,
+    "}": TokenKind.INTERPOLATION_END,
+}
+
+
+def tokenize(source: str) -> list[Token]:
+    """
+    Split an expression into tokens in one linear pass.
+
+    Parameters
+    ----------
+    source : str
+        The full expression, including the leading '@' or '@{...}' interpolations.
+
+    Returns
+    -------
+    list[Token]
+        The tokens, always terminated by a `TokenKind.END` token.
+
+    Raises
+    ------
+    ExpressionSyntaxError
+        If the expression contains an unterminated string or interpolation.
+    """
+    tokens: list[Token] = []
+    length = len(source)
+
+    if source.startswith("@") and not source.startswith(("@@", "@{")):
+        tokens.append(Token(TokenKind.AT, "@", 0, 1))
+        _scan_expression(source, 1, tokens, interpolation=False)
+    else:
+        position = 0
+        while position < length:
+            index = source.find("@", position)
+            if index == -1:
+                tokens.append(Token(TokenKind.TEXT, source[position:], position, length))
+                break
+
+            follower = source[index + 1 : index + 2]
+            if follower == "@":
+                if index > position:
+                    tokens.append(Token(TokenKind.TEXT, source[position:index], position, index))
+                tokens.append(Token(TokenKind.TEXT, "@", index, index + 2))
+                position = index + 2
+            elif follower == "{":
+                if index > position:
+                    tokens.append(Token(TokenKind.TEXT, source[position:index], position, index))
+                tokens.append(Token(TokenKind.INTERPOLATION_START, "@{", index, index + 2))
+                position = _scan_expression(source, index + 2, tokens, interpolation=True)
+            else:
+                tokens.append(Token(TokenKind.TEXT, source[position : index + 1], position, index + 1))
+                position = index + 1
+
+    tokens.append(Token(TokenKind.END, "", length, length))
+    return tokens
+
+
+def _scan_expression(source: str, position: int, tokens: list[Token], interpolation: bool) -> int:
+    """
+    Tokenize an expression body starting at `position`.
+
+    Parameters
+    ----------
+    source : str
+        The full expression.
+    position : int
+        Offset to start scanning at.
+    tokens : list[Token]
+        Token list to append to.
+    interpolation : bool
+        If True, scanning stops after the closing '}' of an interpolation.
+
+    Returns
+    -------
+    int
+        The offset after the last consumed character.
+    """
+    length = len(source)
+    while position < length:
+        match = _TOKEN_PATTERN.match(source, position)
+        assert match is not None  # the raw group matches any character
+
+        kind = match.lastgroup
+        start, end = match.span()
+        if kind == "string":
+            tokens.append(Token(TokenKind.STRING, source[start + 1 : end - 1].replace("''", "'"), start, end))
+        elif kind == "number":
+            tokens.append(Token(TokenKind.NUMBER, match.group(), start, end))
+        elif kind == "identifier":
+            tokens.append(Token(TokenKind.IDENTIFIER, match.group(), start, end))
+        elif kind == "punctuation":
+            token_kind = _PUNCTUATION[match.group()]
+            if token_kind is TokenKind.INTERPOLATION_END:
+                if not interpolation:
+                    token_kind = TokenKind.RAW
+                else:
+                    tokens.append(Token(token_kind, "}", start, end))
+                    return end
+            tokens.append(Token(token_kind, match.group(), start, end))
+        elif kind == "raw":
+            if match.group() == "'":
+                raise ExpressionSyntaxError(f"Unterminated string literal at position {start}.", span=(start, length))
+            tokens.append(Token(TokenKind.RAW, match.group(), start, end))
+        position = end
+
+    if interpolation:
+        raise ExpressionSyntaxError("Interpolation '@{' not closed with '}'.", span=(position, position))
+    return position
@@ -0,0 +1,109 @@
+"""
+Memoization of pure function calls.
+
+A `MemoTable` maps a function and its resolved argument values to the result,
+so repeated calls like `formatDateTime(pipeline().TriggerTime, 'yyyy')` are
+computed once. Only functions registered as pure are memoized, and only
+immutable results are stored, so rows never share a mutable result.
+"""
+
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Hashable, NamedTuple
+
+# Results that may be shared between calls (and folded into compiled expressions)
+IMMUTABLE_TYPES = (str, int, float, bool, type(None), date, datetime, time, timedelta)
+
+
+class MemoInfo(NamedTuple):
+    """Statistics of a `MemoTable`."""
+
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int | None
+
+
+class MemoTable:
+    """
+    Table of pure function results keyed on (function, argument values).
+
+    Use one table per evaluation, or share one across a batch of evaluations
+    (also between threads). Calls with unhashable arguments (lists, dicts) and
+    mutable results are not memoized.
+
+    Parameters
+    ----------
+    max_entries : int | None, default 1024
+        Maximum number of stored results. The oldest entries are evicted first.
+        None means unbounded.
+    """
+
+    def __init__(self, max_entries: int | None = 1024) -> None:
+        self.max_entries = max_entries
+        self._results: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def call(self, function: Callable[..., Any], args: list[Any]) -> Any:
+        """
+        Return the result of `function(*args)`, computing it only on a miss.
+
+        Parameters
+        ----------
+        function : Callable
+            A pure function.
+        args : list[Any]
+            The resolved argument values.
+
+        Returns
+        -------
+        Any
+            The (possibly memoized) result.
+        """
+        # the argument types are part of the key, as e.g. 1, 1.0 and True are equal
+        key = (function, *[(type(arg), arg) for arg in args])
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+            except TypeError:
+                return function(*args)
+            else:
+                self.hits += 1
+                return result
+
+        result = function(*args)
+        if not isinstance(result, IMMUTABLE_TYPES) or self.max_entries == 0:
+            return result
+        with self._lock:
+            if self.max_entries is not None and len(self._results) >= self.max_entries:
+                del self._results[next(iter(self._results))]
+            self._results[key] = result
+        return result
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> MemoInfo:
+        """
+        Return the table statistics.
+
+        Returns
+        -------
+        MemoInfo
+            Hits, misses, current size and limit.
+        """
+        return MemoInfo(hits=self.hits, misses=self.misses, entries=len(self._results), max_entries=self.max_entries)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # results are per-process: worker processes start with an empty table
+        return MemoTable, (self.max_entries,)
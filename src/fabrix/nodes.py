@@ -0,0 +1,505 @@
+"""
+Typed syntax tree for compiled Fabric/ADF expressions.
+
+Nodes are built once by the parser and can be evaluated any number of times
+against different contexts.
+"""
+
+from typing import Any, Callable
+
+from fabrix.frame import UNSET, EvaluationFrame
+from fabrix.lazyjson import LazyArray, LazyJson, LazyObject
+from fabrix.registry import Thunk
+
+
+class Node:
+    """
+    Base class for all expression nodes.
+
+    Attributes
+    ----------
+    text : str
+        The source text the node was parsed from (used for traces).
+    span : tuple[int, int] | None
+        The (start, end) offsets of the node in the full expression.
+    """
+
+    __slots__ = ("text", "span")
+
+    def __init__(self, text: str, span: tuple[int, int] | None = None) -> None:
+        self.text = text
+        self.span = span
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        """
+        Evaluate the node in an evaluation frame.
+
+        Parameters
+        ----------
+        frame : EvaluationFrame
+            The state of the current evaluation (context and trace).
+
+        Returns
+        -------
+        Any
+            The evaluated value.
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.text!r})"
+
+
+class Literal(Node):
+    """A constant value: string, number, boolean or null."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any, text: str, span: tuple[int, int] | None = None) -> None:
+        super().__init__(text, span)
+        self.value = value
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        frame.trace.add_literal_node(self.text, self.span)
+        return self.value
+
+
+class Constant(Literal):
+    """A constant sub-expression, pre-evaluated at compile time (see `fabrix.optimizer`)."""
+
+    __slots__ = ()
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        if frame.trace.enabled:
+            frame.trace.add_literal_node(f"{self.text} ➜ {self.value!r}", self.span)
+        return self.value
+
+
+class Parameter(Node):
+    """
+    A pipeline parameter lookup: `pipeline().parameters.<name><path>`.
+
+    Attributes
+    ----------
+    name : str
+        The parameter name.
+    segments : tuple[str | Node, ...]
+        Path segments into the parameter value. Strings are `.field` accesses, nodes are `[index]` expressions.
+    """
+
+    __slots__ = ("name", "segments")
+
+    def __init__(
+        self, name: str, segments: tuple[str | Node, ...], text: str, span: tuple[int, int] | None = None
+    ) -> None:
+        super().__init__(text, span)
+        self.name = name
+        self.segments = segments
+
+    @property
+    def path(self) -> str:
+        """Return the unresolved path as written in the expression."""
+        return _path_text(self.segments)
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        trace = frame.trace
+        trace.add_parse_node(self.text, self.span)
+        result = frame.context.get_parameter(self.name)
+        if self.segments:
+            result = _resolve_path(result, self.segments, frame, f"pipeline().parameters.{self.name}", None)
+        trace.add_parameter_node(self.name + self.path, result=result)
+        trace.pop()
+        return result
+
+
+class ScopeVariable(Node):
+    """
+    A pipeline scope variable lookup: `pipeline().<name><path>`.
+
+    Attributes
+    ----------
+    name : str
+        The scope variable name.
+    segments : tuple[str | Node, ...]
+        Path segments into the value. Strings are `.field` accesses, nodes are `[index]` expressions.
+    """
+
+    __slots__ = ("name", "segments")
+
+    def __init__(
+        self, name: str, segments: tuple[str | Node, ...], text: str, span: tuple[int, int] | None = None
+    ) -> None:
+        super().__init__(text, span)
+        self.name = name
+        self.segments = segments
+
+    @property
+    def path(self) -> str:
+        """Return the unresolved path as written in the expression."""
+        return _path_text(self.segments)
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        trace = frame.trace
+        trace.add_parse_node(self.text, self.span)
+        result = frame.context.get_pipeline_scope_variable(self.name)
+        if self.segments:
+            result = _resolve_path(result, self.segments, frame, f"pipeline().{self.name}", None)
+        trace.add_scope_node(self.name + self.path, result=result)
+        trace.pop()
+        return result
+
+
+class Variable(Node):
+    """A variable lookup: `variables('<name>')`."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, text: str, span: tuple[int, int] | None = None) -> None:
+        super().__init__(text, span)
+        self.name = name
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        trace = frame.trace
+        trace.add_parse_node(self.text, self.span)
+        result = frame.context.get_variable(self.name)
+        trace.add_variable_node(self.name, result=result)
+        trace.pop()
+        return result
+
+
+class ActivityPath(Node):
+    """
+    An activity output lookup: `activity('<name>').output<path>`.
+
+    Attributes
+    ----------
+    activity : str
+        The activity name.
+    segments : tuple[str | Node, ...]
+        Path segments. Strings are `.field` accesses, nodes are `[index]` expressions.
+    accessor : tuple[tuple[Any, int | None], ...] | None
+        The path precompiled into (key, list index) steps, if all segments are constant.
+    """
+
+    __slots__ = ("activity", "segments", "accessor")
+
+    def __init__(
+        self, activity: str, segments: tuple[str | Node, ...], text: str, span: tuple[int, int] | None = None
+    ) -> None:
+        super().__init__(text, span)
+        self.activity = activity
+        self.segments = segments
+        self.accessor = _compile_accessor(segments)
+
+    @property
+    def path(self) -> str:
+        """Return the unresolved path as written in the expression."""
+        return _path_text(self.segments)
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        trace = frame.trace
+        if self.accessor is not None and not trace.enabled:
+            output = _access(frame.context.get_activity_output(self.activity), self.accessor)
+            if output is not _MISSING:
+                return output
+
+        trace.add_parse_node(self.text, self.span)
+        output = frame.context.get_activity_output(self.activity)
+
+        # the resolved path is only needed for the trace label
+        path_segments: list[str] | None = None
+        node = None
+        if trace.enabled:
+            path_segments = []
+            node = trace.add_activity_node(self.activity, path=self.path)
+
+        output = _resolve_path(output, self.segments, frame, f"activity('{self.activity}').output", path_segments)
+
+        if path_segments is not None:
+            activity_path = f".{'.'.join(path_segments)}"
+            trace.add_activity_node(self.activity, path=activity_path, result=output, node=node)
+        trace.pop()
+        return output
+
+
+class Item(Node):
+    """
+    The current ForEach item: `item()<path>`.
+
+    Attributes
+    ----------
+    segments : tuple[str | Node, ...]
+        Path segments. Strings are `.field` accesses, nodes are `[index]` expressions.
+    accessor : tuple[tuple[Any, int | None], ...] | None
+        The path precompiled into (key, list index) steps, if all segments are constant.
+    """
+
+    __slots__ = ("segments", "accessor")
+
+    def __init__(self, segments: tuple[str | Node, ...], text: str, span: tuple[int, int] | None = None) -> None:
+        super().__init__(text, span)
+        self.segments = segments
+        self.accessor = _compile_accessor(segments)
+
+    @property
+    def path(self) -> str:
+        """Return the unresolved path as written in the expression."""
+        return _path_text(self.segments)
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        trace = frame.trace
+        if self.accessor is not None and not trace.enabled:
+            value = _access(frame.context.get_item(), self.accessor)
+            if value is not _MISSING:
+                return value
+
+        trace.add_parse_node(self.text, self.span)
+        value = frame.context.get_item()
+
+        path_segments: list[str] | None = None
+        node = None
+        if trace.enabled:
+            path_segments = []
+            node = trace.add_item_node(self.path)
+
+        value = _resolve_path(value, self.segments, frame, "item()", path_segments)
+
+        if path_segments is not None:
+            item_path = f".{'.'.join(path_segments)}" if path_segments else ""
+            trace.add_item_node(item_path, result=value, node=node)
+        trace.pop()
+        return value
+
+
+def _path_text(segments: tuple[str | Node, ...]) -> str:
+    """Return path segments as written in an expression, e.g. `.rows[add(1, 1)]`."""
+    return "".join(f".{segment}" if isinstance(segment, str) else f"[{segment.text}]" for segment in segments)
+
+
+# Returned by `_access` if the fast path cannot resolve a path
+_MISSING = object()
+
+
+def _compile_accessor(segments: tuple[str | Node, ...]) -> tuple[tuple[Any, int | None], ...] | None:
+    """
+    Precompile a path of constant segments into (key, list index) steps.
+
+    Parameters
+    ----------
+    segments : tuple[str | Node, ...]
+        Path segments. Strings are `.field` accesses, nodes are `[index]` expressions.
+
+    Returns
+    -------
+    tuple[tuple[Any, int | None], ...] | None
+        The steps, or None if an index is not a constant. Fields cannot index lists,
+        so their list index is None.
+    """
+    steps: list[tuple[Any, int | None]] = []
+    for segment in segments:
+        if isinstance(segment, str):
+            steps.append((segment, None))
+        elif isinstance(segment, Literal):
+            try:
+                index = int(segment.value)
+            except (TypeError, ValueError):
+                index = None
+            steps.append((segment.value, index))
+        else:
+            return None
+    return tuple(steps)
+
+
+def _access(value: Any, accessor: tuple[tuple[Any, int | None], ...]) -> Any:
+    """
+    Resolve a precompiled path over plain dicts and lists (or their lazy JSON views).
+
+    Returns `_MISSING` for anything else (objects, missing keys, None values),
+    so the caller falls back to `_resolve_path` for attribute access and errors.
+    """
+    for key, index in accessor:
+        cls = value.__class__
+        if cls is dict or cls is LazyObject:
+            value = value.get(key)
+        elif index is not None and (cls is list or cls is tuple or cls is LazyArray):
+            try:
+                value = value[index]
+            except IndexError:
+                return _MISSING
+        else:
+            return _MISSING
+        if value is None:
+            return _MISSING
+    if isinstance(value, LazyJson):
+        return value.materialize()
+    return value
+
+
+def _resolve_path(
+    value: Any,
+    segments: tuple[str | Node, ...],
+    frame: EvaluationFrame,
+    origin: str,
+    path_segments: list[str] | None,
+) -> Any:
+    """
+    Walk `.field` and `[index]` segments into a value.
+
+    Parameters
+    ----------
+    value : Any
+        The value to start from (activity output or item).
+    segments : tuple[str | Node, ...]
+        Path segments. Strings are `.field` accesses, nodes are `[index]` expressions.
+    frame : EvaluationFrame
+        The state of the current evaluation, for index expressions.
+    origin : str
+        The path origin used in error messages (e.g. `item()`).
+    path_segments : list[str] | None
+        If given, the resolved segments are appended for the trace label.
+
+    Returns
+    -------
+    Any
+        The value at the end of the path. Lazy JSON views are materialized.
+
+    Raises
+    ------
+    KeyError
+        If a field or index is missing.
+    """
+    for segment in segments:
+        if isinstance(segment, str):
+            try:
+                if isinstance(value, (dict, LazyObject)):
+                    value = value.get(segment)
+                else:
+                    value = getattr(value, segment)
+            except Exception:
+                value = None
+            if value is None:
+                raise KeyError(f"Missing field '{segment}' on {origin} path.")
+            if path_segments is not None:
+                path_segments.append(segment)
+        else:
+            field = segment.evaluate(frame)
+            try:
+                if isinstance(value, (list, tuple, LazyArray)):
+                    value = value[int(field)]
+                elif isinstance(value, (dict, LazyObject)):
+                    value = value.get(field)
+            except Exception:
+                value = None
+            if value is None:
+                raise KeyError(f"Invalid index/field [{field!r}] on {origin} path.")
+            if path_segments is not None:
+                path_segments.append(f"[{field}]")
+    if isinstance(value, LazyJson):
+        return value.materialize()
+    return value
+
+
+class FunctionCall(Node):
+    """
+    A call of a registered function: `<name>(<args>)`.
+
+    Attributes
+    ----------
+    name : str
+        The function name as written in the expression.
+    args : tuple[Node, ...]
+        The argument nodes.
+    function : Callable
+        The registered function, resolved at compile time.
+    lazy : bool
+        Whether the arguments are passed as `Thunk`s (short-circuit functions).
+    pure : bool
+        Whether the function is pure, so its results may be memoized.
+    """
+
+    __slots__ = ("name", "args", "function", "lazy", "pure")
+
+    def __init__(
+        self,
+        name: str,
+        args: tuple[Node, ...],
+        function: Callable[..., Any],
+        text: str,
+        span: tuple[int, int] | None = None,
+        lazy: bool = False,
+        pure: bool = False,
+    ) -> None:
+        super().__init__(text, span)
+        self.name = name
+        self.args = args
+        self.function = function
+        self.lazy = lazy
+        self.pure = pure
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        trace = frame.trace
+        trace.add_parse_node(self.text, self.span)
+        node = trace.add_function_node(self.name)
+
+        if self.lazy:
+            result = self.function(*[Thunk(arg.evaluate, frame) for arg in self.args])
+        else:
+            resolved_args = [arg.evaluate(frame) for arg in self.args]
+            if self.pure and frame.memo is not None:
+                result = frame.memo.call(self.function, resolved_args)
+            else:
+                result = self.function(*resolved_args)
+
+        trace.add_function_node(self.name, result=result, node=node)
+        if result is None:
+            trace.pop()
+        trace.pop()
+        return result
+
+
+class Shared(Node):
+    """
+    A common sub-expression, evaluated at most once per evaluation (see `fabrix.optimizer`).
+
+    Attributes
+    ----------
+    node : Node
+        The shared sub-expression.
+    slot : int
+        Index of the value in `EvaluationFrame.slots`.
+    """
+
+    __slots__ = ("node", "slot")
+
+    def __init__(self, node: Node, slot: int) -> None:
+        super().__init__(node.text, node.span)
+        self.node = node
+        self.slot = slot
+
+    def evaluate(self, frame: EvaluationFrame) -> Any:
+        value = frame.slots[self.slot]
+        if value is UNSET:
+            value = frame.slots[self.slot] = self.node.evaluate(frame)
+        elif frame.trace.enabled:
+            frame.trace.add_literal_node(f"{self.text} ➜ {value!r}", self.span)
+        return value
+
+
+class Template(Node):
+    """
+    A string interpolation: `text @{expression} text`.
+
+    Attributes
+    ----------
+    parts : tuple[str | Node, ...]
+        Raw text parts and interpolated expression nodes, in order.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, parts: tuple[str | Node, ...], text: str, span: tuple[int, int] | None = None) -> None:
+        super().__init__(text, span)
+        self.parts = parts
+
+    def evaluate(self, frame: EvaluationFrame) -> str:
+        return "".join(part if isinstance(part, str) else str(part.evaluate(frame)) for part in self.parts)
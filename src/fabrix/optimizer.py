@@ -0,0 +1,183 @@
+"""
+Optimization passes over compiled syntax trees.
+
+Constant folding pre-evaluates calls of pure functions whose arguments are
+all constants, e.g. `add(1, mul(4, 5))` or `toUpper('abc')`, so they cost
+nothing at evaluation time. Volatile functions (`utcNow`, `guid`, ...) and
+context lookups are left alone.
+
+Common sub-expression elimination evaluates structurally identical sub-trees
+(pure function calls and context lookups) only once per evaluation.
+"""
+
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+from fabrix.memo import IMMUTABLE_TYPES
+from fabrix.nodes import (
+    ActivityPath,
+    Constant,
+    FunctionCall,
+    Item,
+    Literal,
+    Node,
+    Parameter,
+    ScopeVariable,
+    Shared,
+    Template,
+    Variable,
+)
+
+
+def fold_constants(node: Node) -> Node:
+    """
+    Replace constant sub-expressions by their value.
+
+    A function call is folded if the function is pure, all its arguments are
+    constants, it does not raise and its result is immutable. Calls that raise
+    are kept, so the error is reported (and traced) at evaluation time.
+
+    Parameters
+    ----------
+    node : Node
+        The root of the syntax tree.
+
+    Returns
+    -------
+    Node
+        The optimized tree. Unchanged sub-trees are reused.
+    """
+    node = _map_children(node, fold_constants)
+
+    if isinstance(node, FunctionCall) and node.pure and all(isinstance(arg, Literal) for arg in node.args):
+        return _fold_call(node) or node
+
+    if isinstance(node, Template) and all(isinstance(part, (str, Literal)) for part in node.parts):
+        value = "".join(str(part.value) if isinstance(part, Literal) else str(part) for part in node.parts)
+        return Constant(value, node.text, node.span)
+
+    return node
+
+
+def _fold_call(node: FunctionCall) -> Constant | None:
+    try:
+        value: Any = node.function(*(arg.value for arg in node.args if isinstance(arg, Literal)))
+    except Exception:
+        return None
+    # only immutable results are folded, so evaluations never share mutable state
+    if not isinstance(value, IMMUTABLE_TYPES):
+        return None
+    return Constant(value, node.text, node.span)
+
+
+def eliminate_common_subexpressions(node: Node) -> tuple[Node, int]:
+    """
+    Share structurally identical sub-trees, so they are evaluated once per evaluation.
+
+    Only pure function calls and context lookups (variables, parameters, activity
+    outputs, items) are shared; they cannot change within one evaluation. Every
+    shared sub-tree gets a slot in `EvaluationFrame.slots`.
+
+    Parameters
+    ----------
+    node : Node
+        The root of the syntax tree.
+
+    Returns
+    -------
+    tuple[Node, int]
+        The optimized tree and the number of slots it uses.
+    """
+    counts: dict[Hashable, int] = {}
+    keys: dict[int, Hashable] = {}
+
+    def count(node: Node) -> None:
+        key = _structural_key(node, keys)
+        if key is not None and not isinstance(node, Literal):
+            counts[key] = counts.get(key, 0) + 1
+            if counts[key] > 1:
+                # children of a repeated sub-tree were already counted at its first occurrence
+                return
+        for child in _children(node):
+            count(child)
+
+    count(node)
+
+    slots: dict[Hashable, int] = {}
+
+    def share(node: Node) -> Node:
+        key = keys.get(id(node))
+        node = _map_children(node, share)
+        if key is None or counts.get(key, 0) < 2:
+            return node
+        slot = slots.setdefault(key, len(slots))
+        return Shared(node, slot)
+
+    return share(node), len(slots)
+
+
+def _structural_key(node: Node, keys: dict[int, Hashable]) -> Hashable | None:
+    """Return a hashable key that is equal for identical sub-trees, or None if the node must not be shared."""
+    if id(node) in keys:
+        return keys[id(node)]
+
+    key: Hashable | None = None
+    if isinstance(node, Literal):
+        key = ("literal", type(node.value), node.value)
+    elif isinstance(node, Variable):
+        key = ("variable", node.name)
+    elif isinstance(node, (ActivityPath, Item, Parameter, ScopeVariable)):
+        segments = tuple(
+            segment if isinstance(segment, str) else _structural_key(segment, keys) for segment in node.segments
+        )
+        if None not in segments:
+            origin: str | None = None
+            if isinstance(node, ActivityPath):
+                origin = node.activity
+            elif isinstance(node, (Parameter, ScopeVariable)):
+                origin = node.name
+            key = (type(node).__name__, origin, segments)
+    elif isinstance(node, FunctionCall) and node.pure:
+        args = tuple(_structural_key(arg, keys) for arg in node.args)
+        if None not in args:
+            key = ("call", node.function, args)
+
+    keys[id(node)] = key
+    return key
+
+
+def _children(node: Node) -> Iterator[Node]:
+    """Iterate over the direct child nodes."""
+    if isinstance(node, FunctionCall):
+        yield from node.args
+    elif isinstance(node, Template):
+        yield from (part for part in node.parts if not isinstance(part, str))
+    elif isinstance(node, (ActivityPath, Item, Parameter, ScopeVariable)):
+        yield from (segment for segment in node.segments if not isinstance(segment, str))
+
+
+def _map_children(node: Node, transform: Callable[[Node], Node]) -> Node:
+    """Apply `transform` to the child nodes, rebuilding the node only if a child changed."""
+    if isinstance(node, FunctionCall):
+        args = tuple(transform(arg) for arg in node.args)
+        if all(new is old for new, old in zip(args, node.args)):
+            return node
+        return FunctionCall(node.name, args, node.function, node.text, node.span, lazy=node.lazy, pure=node.pure)
+
+    if isinstance(node, Template):
+        parts = tuple(part if isinstance(part, str) else transform(part) for part in node.parts)
+        if all(new is old for new, old in zip(parts, node.parts)):
+            return node
+        return Template(parts, node.text, node.span)
+
+    if isinstance(node, (ActivityPath, Item, Parameter, ScopeVariable)):
+        segments = tuple(segment if isinstance(segment, str) else transform(segment) for segment in node.segments)
+        if all(new is old for new, old in zip(segments, node.segments)):
+            return node
+        if isinstance(node, ActivityPath):
+            return ActivityPath(node.activity, segments, node.text, node.span)
+        if isinstance(node, Item):
+            return Item(segments, node.text, node.span)
+        return type(node)(node.name, segments, node.text, node.span)
+
+    return node
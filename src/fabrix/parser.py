@@ -0,0 +1,270 @@
+"""
+Parser turning expression strings into a typed syntax tree (see `fabrix.nodes`).
+
+The parser is a recursive descent over the token stream of `fabrix.lexer`,
+so every character of the expression is looked at exactly once. Text that is
+not a valid expression (e.g. a bare word) is kept as a raw string literal.
+"""
+
+from fabrix.exceptions import ExpressionSyntaxError
+from fabrix.functions import *  # noqa: F403
+from fabrix.lexer import Token, TokenKind, tokenize
+from fabrix.nodes import (
+    ActivityPath,
+    FunctionCall,
+    Item,
+    Literal,
+    Node,
+    Parameter,
+    ScopeVariable,
+    Template,
+    Variable,
+)
+from fabrix.registry import registry
+from fabrix.validations import validate_arity, validate_function
+
+_CONSTANTS = {"true": True, "false": False, "null": None}
+
+
+def parse(expression: str) -> Node:
+    """
+    Parse a full expression (including the leading '@' or '@{...}' interpolations).
+
+    Parameters
+    ----------
+    expression : str
+        The expression to parse.
+
+    Returns
+    -------
+    Node
+        The root node of the syntax tree.
+
+    Raises
+    ------
+    ExpressionSyntaxError
+        If the expression is not valid.
+    FunctionNotFoundError
+        If the expression calls a function that is not registered.
+    """
+    return Parser(expression).parse()
+
+
+class Parser:
+    """
+    Recursive descent parser for a single expression.
+
+    Parameters
+    ----------
+    source : str
+        The full expression text.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.tokens = tokenize(source)
+        self.position = 0
+
+    def parse(self) -> Node:
+        """
+        Parse the whole token stream.
+
+        Returns
+        -------
+        Node
+            The root node of the syntax tree.
+        """
+        if self._peek().kind is TokenKind.AT:
+            self._advance()
+            node = self._expression()
+            self._expect(TokenKind.END)
+            return node
+        return self._template()
+
+    def _peek(self) -> Token:
+        return self.tokens[self.position]
+
+    def _advance(self) -> Token:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _expect(self, kind: TokenKind, description: str | None = None) -> Token:
+        token = self._peek()
+        if token.kind is not kind:
+            expected = description or (f"'{kind}'" if len(kind) == 1 else kind.replace("_", " "))
+            raise self._error(token, f"Expected {expected}")
+        return self._advance()
+
+    def _error(self, token: Token, message: str) -> ExpressionSyntaxError:
+        if token.kind is TokenKind.END:
+            return ExpressionSyntaxError(f"{message}, got end of expression.", span=(token.start, token.end))
+        found = self.source[token.start : token.end]
+        return ExpressionSyntaxError(
+            f"{message}, got {found!r} at position {token.start}.",
+            span=(token.start, token.end),
+        )
+
+    def _text(self, start: int) -> tuple[str, tuple[int, int]]:
+        end = self.tokens[self.position - 1].end
+        return self.source[start:end], (start, end)
+
+    def _template(self) -> Node:
+        parts: list[str | Node] = []
+        while True:
+            token = self._advance()
+            if token.kind is TokenKind.END:
+                break
+            if token.kind is TokenKind.TEXT:
+                if parts and isinstance(parts[-1], str):
+                    parts[-1] += token.value
+                else:
+                    parts.append(token.value)
+            elif token.kind is TokenKind.INTERPOLATION_START:
+                parts.append(self._expression())
+                self._expect(TokenKind.INTERPOLATION_END, "'}'")
+            else:
+                raise self._error(token, "Unexpected token")
+
+        span = (0, len(self.source))
+        if all(isinstance(part, str) for part in parts):
+            return Literal("".join(parts), self.source, span)  # type: ignore[arg-type]
+        return Template(tuple(parts), self.source, span)
+
+    def _expression(self) -> Node:
+        token = self._advance()
+
+        if token.kind is TokenKind.STRING:
+            return Literal(token.value, self.source[token.start : token.end], (token.start, token.end))
+
+        if token.kind is TokenKind.NUMBER:
+            text = token.value
+            # if it contains '.' or 'e/E', prefer float
+            value: int | float = float(text) if any(c in text for c in (".", "e", "E")) else int(text)
+            return Literal(value, text, (token.start, token.end))
+
+        if token.kind is TokenKind.IDENTIFIER:
+            name = token.value.lower()
+            if name in _CONSTANTS and self._peek().kind is not TokenKind.LPAREN:
+                return Literal(_CONSTANTS[name], token.value, (token.start, token.end))
+            if name == "pipeline":
+                return self._pipeline(token)
+            if name == "variables":
+                return self._variable(token)
+            if name == "activity":
+                return self._activity(token)
+            if name == "item" and self._peek().kind is TokenKind.LPAREN:
+                return self._item(token)
+            if self._peek().kind is TokenKind.LPAREN:
+                return self._function(token)
+            return self._raw(token)
+
+        if token.kind is TokenKind.RAW:
+            return self._raw(token)
+
+        raise self._error(token, "Expected an expression")
+
+    def _raw(self, start: Token) -> Node:
+        """Consume unrecognized tokens up to the end of the argument and keep them as text."""
+        self.position -= 1
+        depth = 0
+        parts: list[str] = []
+        while True:
+            token = self._peek()
+            if token.kind in (TokenKind.LPAREN, TokenKind.LBRACKET):
+                depth += 1
+            elif token.kind in (TokenKind.RPAREN, TokenKind.RBRACKET):
+                if depth == 0:
+                    break
+                depth -= 1
+            elif token.kind in (TokenKind.END, TokenKind.INTERPOLATION_END) or (
+                token.kind is TokenKind.COMMA and depth == 0
+            ):
+                break
+            parts.append(self.source[token.start : token.end])
+            self._advance()
+
+        text = "".join(parts)
+        return Literal(text, text, (start.start, self.tokens[self.position - 1].end))
+
+    def _member(self) -> Token:
+        """Consume a `.name` (or `?.name`) member access and return the name token."""
+        if self._peek().kind is TokenKind.QUESTION:
+            self._advance()
+        self._expect(TokenKind.DOT)
+        return self._expect(TokenKind.IDENTIFIER, "a property name")
+
+    def _string_argument(self) -> str:
+        self._expect(TokenKind.LPAREN)
+        value = self._expect(TokenKind.STRING, "a string literal").value
+        self._expect(TokenKind.RPAREN)
+        return value
+
+    def _pipeline(self, start: Token) -> Node:
+        self._expect(TokenKind.LPAREN)
+        self._expect(TokenKind.RPAREN)
+        member = self._member()
+        if member.value == "parameters":
+            name = self._member().value
+            segments = self._path()
+            text, span = self._text(start.start)
+            return Parameter(name, segments, text, span)
+        segments = self._path()
+        text, span = self._text(start.start)
+        return ScopeVariable(member.value, segments, text, span)
+
+    def _variable(self, start: Token) -> Node:
+        name = self._string_argument()
+        text, span = self._text(start.start)
+        return Variable(name, text, span)
+
+    def _activity(self, start: Token) -> Node:
+        activity = self._string_argument()
+        member = self._member()
+        if member.value.lower() != "output":
+            raise self._error(member, "Expected 'output'")
+
+        segments = self._path()
+        text, span = self._text(start.start)
+        return ActivityPath(activity, segments, text, span)
+
+    def _item(self, start: Token) -> Node:
+        self._expect(TokenKind.LPAREN)
+        self._expect(TokenKind.RPAREN)
+        segments = self._path()
+        text, span = self._text(start.start)
+        return Item(segments, text, span)
+
+    def _path(self) -> tuple[str | Node, ...]:
+        """Consume trailing `.field` and `[index]` accessors."""
+        segments: list[str | Node] = []
+        while True:
+            kind = self._peek().kind
+            if kind in (TokenKind.DOT, TokenKind.QUESTION):
+                segments.append(self._member().value)
+            elif kind is TokenKind.LBRACKET:
+                self._advance()
+                segments.append(self._expression())
+                self._expect(TokenKind.RBRACKET)
+            else:
+                break
+        return tuple(segments)
+
+    def _function(self, start: Token) -> Node:
+        name = start.value
+        validate_function(name, span=(start.start, start.end))
+
+        self._expect(TokenKind.LPAREN)
+        args: list[Node] = []
+        if self._peek().kind is not TokenKind.RPAREN:
+            while True:
+                args.append(self._expression())
+                if self._peek().kind is not TokenKind.COMMA:
+                    break
+                self._advance()
+        self._expect(TokenKind.RPAREN, "',' or ')'")
+
+        text, span = self._text(start.start)
+        validate_arity(name, len(args), span=span)
+        spec = registry.spec(name)
+        return FunctionCall(name, tuple(args), spec.function, text, span, lazy=spec.lazy, pure=spec.pure)
@@ -0,0 +1,229 @@
+"""
+Profile where time goes inside an expression.
+
+The expression is evaluated with a timed trace (see `ExpressionTraceback`),
+and the timings of all evaluated sub-expressions are aggregated per name
+(function, activity, variable, parameter or scope lookup).
+"""
+
+import time
+
+from rich.table import Table
+
+from fabrix.compiler import CompiledExpression, compile_expression
+from fabrix.context import Context, ExpressionTraceback, FrozenContext, TraceNodeKind
+from fabrix.frame import EvaluationFrame
+
+
+class ProfileStats:
+    """
+    Aggregated timings of one name (e.g. a function).
+
+    Attributes
+    ----------
+    calls : int
+        Number of evaluations.
+    cumulative_ns : int
+        Total time including nested sub-expressions.
+    self_ns : int
+        Total time excluding nested sub-expressions.
+    """
+
+    __slots__ = ("calls", "cumulative_ns", "self_ns")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cumulative_ns = 0
+        self.self_ns = 0
+
+    def __repr__(self) -> str:
+        return f"ProfileStats(calls={self.calls}, cumulative_ns={self.cumulative_ns}, self_ns={self.self_ns})"
+
+
+class ProfileReport:
+    """
+    Result of `profile`.
+
+    Attributes
+    ----------
+    expression : str
+        The profiled expression.
+    repeat : int
+        Number of evaluations.
+    total_ns : int
+        Wall time of all evaluations (including tracing overhead).
+    stats : dict[str, ProfileStats]
+        Timings per name.
+    expressions : dict[str, ProfileStats]
+        Timings per sub-expression text.
+    stacks : dict[str, int]
+        Self time per collapsed stack (`outer;inner;name`).
+    """
+
+    def __init__(self, expression: str, repeat: int) -> None:
+        self.expression = expression
+        self.repeat = repeat
+        self.total_ns = 0
+        self.stats: dict[str, ProfileStats] = {}
+        self.expressions: dict[str, ProfileStats] = {}
+        self.stacks: dict[str, int] = {}
+
+    def add_trace(self, trace: ExpressionTraceback) -> None:
+        """
+        Aggregate the timings of a timed trace into the report.
+
+        Every parse node stands for one evaluated sub-expression. It is named
+        after its first child (the function, activity or lookup it resolves).
+
+        Parameters
+        ----------
+        trace : ExpressionTraceback
+            A trace recorded with `timed=True`.
+        """
+        kinds, labels, parents = trace.kinds, trace.labels, trace.parents
+
+        names: dict[int, str] = {}
+        for index in range(1, len(kinds)):
+            parent = parents[index]
+            if kinds[parent] is TraceNodeKind.PARSE and parent not in names:
+                names[parent] = _node_name(kinds[index], labels[index])
+
+        stacks: dict[int, str] = {}
+        nested_ns: dict[int, int] = {}
+        for index, kind in enumerate(kinds):
+            if kind is not TraceNodeKind.PARSE:
+                continue
+            names.setdefault(index, labels[index])
+
+            parent = parents[index]
+            while parent > 0 and kinds[parent] is not TraceNodeKind.PARSE:
+                parent = parents[parent]
+            stacks[index] = f"{stacks[parent]};{names[index]}" if parent > 0 else names[index]
+            if parent > 0:
+                nested_ns[parent] = nested_ns.get(parent, 0) + trace.duration(index)
+
+        for index, stack in stacks.items():
+            duration = trace.duration(index)
+            self_ns = duration - nested_ns.get(index, 0)
+
+            stats = self.stats.setdefault(names[index], ProfileStats())
+            stats.calls += 1
+            stats.cumulative_ns += duration
+            stats.self_ns += self_ns
+
+            expression = self.expressions.setdefault(labels[index], ProfileStats())
+            expression.calls += 1
+            expression.cumulative_ns += duration
+            expression.self_ns += self_ns
+
+            self.stacks[stack] = self.stacks.get(stack, 0) + self_ns
+
+    def slowest(self, limit: int = 10) -> list[tuple[str, float]]:
+        """
+        Return the slowest sub-expressions by mean cumulative time.
+
+        Parameters
+        ----------
+        limit : int, default 10
+            Maximum number of sub-expressions.
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            Pairs of sub-expression text and mean time in nanoseconds, slowest first.
+        """
+        means = [(text, stats.cumulative_ns / stats.calls) for text, stats in self.expressions.items()]
+        return sorted(means, key=lambda item: item[1], reverse=True)[:limit]
+
+    def collapsed(self) -> str:
+        """
+        Return the self times as collapsed stacks (one `stack value` line each).
+
+        The format is understood by flamegraph tools such as `flamegraph.pl`
+        or speedscope. Values are in nanoseconds.
+
+        Returns
+        -------
+        str
+            The collapsed stacks.
+        """
+        return "\n".join(f"{stack} {max(value, 0)}" for stack, value in self.stacks.items())
+
+    def render(self) -> Table:
+        """
+        Build a Rich table of the timings per name, sorted by self time.
+
+        Returns
+        -------
+        Table
+            The rendered table.
+        """
+        table = Table(
+            title=f"Profile: {self.expression} ({self.repeat}x, {self.total_ns / 1e6:.3f} ms)",
+            title_style="bold magenta",
+            header_style="bold",
+            expand=True,
+            box=None,
+        )
+        table.add_column("Name", style="cyan")
+        table.add_column("Calls", style="yellow", justify="right")
+        table.add_column("Self (ms)", style="green", justify="right")
+        table.add_column("Cumulative (ms)", style="green", justify="right")
+
+        for name, stats in sorted(self.stats.items(), key=lambda item: item[1].self_ns, reverse=True):
+            table.add_row(name, str(stats.calls), f"{stats.self_ns / 1e6:.3f}", f"{stats.cumulative_ns / 1e6:.3f}")
+        return table
+
+
+def _node_name(kind: TraceNodeKind, label: str) -> str:
+    if kind is TraceNodeKind.FUNCTION:
+        return label
+    if kind is TraceNodeKind.ACTIVITY:
+        return f"activity('{label}')"
+    if kind is TraceNodeKind.ITEM:
+        return "item()"
+    if kind is TraceNodeKind.VARIABLE:
+        return f"variables('{label}')"
+    if kind is TraceNodeKind.PARAMETER:
+        return f"pipeline().parameters.{label}"
+    if kind is TraceNodeKind.SCOPE:
+        return f"pipeline().{label}"
+    return label
+
+
+def profile(
+    expression: str | CompiledExpression,
+    context: Context | FrozenContext | None = None,
+    repeat: int = 1,
+) -> ProfileReport:
+    """
+    Evaluate an expression `repeat` times with timing and aggregate the results.
+
+    The traces used for timing are not stored in the context.
+
+    Parameters
+    ----------
+    expression : str | CompiledExpression
+        The expression to profile.
+    context : Context | FrozenContext, optional
+        The context for evaluation. If omitted, a fresh `Context()` is created.
+    repeat : int, default 1
+        Number of evaluations.
+
+    Returns
+    -------
+    ProfileReport
+        The aggregated timings.
+    """
+    compiled = expression if isinstance(expression, CompiledExpression) else compile_expression(expression)
+    context = context or Context()
+    report = ProfileReport(compiled.expression, repeat)
+
+    for _ in range(repeat):
+        trace = ExpressionTraceback(compiled.expression, timed=True)
+        start = time.perf_counter_ns()
+        compiled.root.evaluate(EvaluationFrame(context, trace, slot_count=compiled.slot_count))
+        report.total_ns += time.perf_counter_ns() - start
+        report.add_trace(trace)
+
+    return report
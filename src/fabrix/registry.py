@@ -4,7 +4,145 @@ Function registry for the fabric_expression_builder package.
 Handles registration and lookup of expression functions by name.
 """
 
-from typing import Any, Callable, Dict, Optional
+import inspect
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class Thunk:
+    """
+    A lazily evaluated function argument.
+
+    Functions registered with `lazy=True` receive their arguments as thunks
+    and only evaluate the ones they need (e.g. the taken branch of `if`).
+    The value is computed at most once.
+
+    Parameters
+    ----------
+    function : Callable
+        Computes the value.
+    *args : Any
+        Arguments passed to `function`.
+    """
+
+    __slots__ = ("_function", "_args", "_value", "_done")
+
+    def __init__(self, function: Callable[..., Any], *args: Any) -> None:
+        self._function = function
+        self._args = args
+        self._value: Any = None
+        self._done = False
+
+    def __call__(self) -> Any:
+        if not self._done:
+            self._value = self._function(*self._args)
+            self._done = True
+            self._function = self._args = None  # type: ignore[assignment]
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"Thunk({self._value!r})" if self._done else "Thunk(<pending>)"
+
+
+def force(value: Any) -> Any:
+    """
+    Return the value of a lazy argument, or the value itself if it is not lazy.
+
+    Lazy functions use this on every argument, so they can also be called
+    directly from Python with plain values.
+
+    Parameters
+    ----------
+    value : Any
+        A `Thunk` or a plain value.
+
+    Returns
+    -------
+    Any
+        The evaluated value.
+
+    Examples
+    --------
+    >>> force(Thunk(lambda: 1 + 1))
+    2
+    >>> force(3)
+    3
+    """
+    return value() if isinstance(value, Thunk) else value
+
+
+class FunctionSpec(NamedTuple):
+    """
+    A registered function and its metadata.
+
+    Attributes
+    ----------
+    name : str
+        The function name as registered (e.g. `toUpper`).
+    function : Callable
+        The implementation.
+    pure : bool
+        Whether the function is deterministic and free of side effects. Optimizers
+        (constant folding, memoization, common-subexpression elimination) only
+        touch pure functions.
+    lazy : bool
+        Whether the function receives its arguments as `Thunk`s.
+    min_args : int
+        Minimum number of arguments.
+    max_args : int | None
+        Maximum number of arguments. None means variadic.
+    arg_kinds : tuple[Any, ...]
+        Expected kind (type annotation) of each positional argument. For variadic
+        functions the last kind applies to all remaining arguments.
+    vectorized : Callable | None
+        Optional variant taking sequences of arguments and returning a sequence of
+        results, used for batch evaluation.
+    """
+
+    name: str
+    function: Callable[..., Any]
+    pure: bool = False
+    lazy: bool = False
+    min_args: int = 0
+    max_args: int | None = None
+    arg_kinds: tuple[Any, ...] = ()
+    vectorized: Callable[..., Any] | None = None
+
+    def accepts(self, count: int) -> bool:
+        """
+        Check whether the function can be called with `count` arguments.
+
+        Parameters
+        ----------
+        count : int
+            The number of arguments.
+
+        Returns
+        -------
+        bool
+            True if `count` is within the arity range.
+        """
+        return self.min_args <= count and (self.max_args is None or count <= self.max_args)
+
+
+def _signature(fn: Callable[..., Any]) -> tuple[int, int | None, tuple[Any, ...]]:
+    """Derive the arity range and argument kinds from a function signature."""
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return 0, None, ()
+
+    min_args, max_args, kinds = 0, 0, []
+    for parameter in parameters:
+        annotation = Any if parameter.annotation is inspect.Parameter.empty else parameter.annotation
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            kinds.append(annotation)
+            return min_args, None, tuple(kinds)
+        if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            kinds.append(annotation)
+            max_args += 1
+            if parameter.default is inspect.Parameter.empty:
+                min_args += 1
+    return min_args, max_args, tuple(kinds)
 
 
 class FunctionRegistry:
@@ -12,12 +150,27 @@ class FunctionRegistry:
     Registry for available functions in the expression builder.
 
     Functions can be registered and retrieved by name. Case-insensitive.
+    Every registration carries a `FunctionSpec` with its metadata.
+
+    Attributes
+    ----------
+    version : int
+        Incremented on every registration, so caches of compiled expressions
+        (which bind functions at compile time) can detect changes.
     """
 
     def __init__(self) -> None:
-        self._functions: Dict[str, Callable[..., Any]] = {}
+        self._specs: Dict[str, FunctionSpec] = {}
+        self.version = 0
 
-    def register(self, name: Optional[str] = None) -> Callable:
+    def register(
+        self,
+        name: Optional[str] = None,
+        lazy: bool = False,
+        pure: bool = False,
+        arity: tuple[int, int | None] | None = None,
+        arg_kinds: tuple[Any, ...] | None = None,
+    ) -> Callable:
         """
         Decorator to register a function with the registry.
 
@@ -25,6 +178,19 @@ class FunctionRegistry:
         ----------
         name : str, optional
             The function name for expressions. If None, uses the decorated function's name.
+        lazy : bool, default False
+            If True, the function receives its arguments as `Thunk`s and evaluates
+            them on demand with `force` (short-circuit evaluation).
+        pure : bool, default False
+            Whether the function is deterministic and free of side effects. Calls of
+            pure functions with constant arguments are pre-evaluated at compile time
+            and memoized. Only mark functions pure that return the same result for the
+            same arguments (unlike e.g. `utcNow` or `guid`).
+        arity : tuple[int, int | None], optional
+            Minimum and maximum number of arguments (None for variadic).
+            Derived from the function signature if omitted.
+        arg_kinds : tuple[Any, ...], optional
+            Expected kind of each argument. Derived from the annotations if omitted.
 
         Returns
         -------
@@ -33,13 +199,20 @@ class FunctionRegistry:
         """
 
         def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
-            key = (name or fn.__name__).lower()
-            self._functions[key] = fn
+            self.add(name or fn.__name__, fn, lazy=lazy, pure=pure, arity=arity, arg_kinds=arg_kinds)
             return fn
 
         return decorator
 
-    def add(self, name: str, fn: Callable[..., Any]) -> None:
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        lazy: bool = False,
+        pure: bool = False,
+        arity: tuple[int, int | None] | None = None,
+        arg_kinds: tuple[Any, ...] | None = None,
+    ) -> None:
         """
         Register a function explicitly.
 
@@ -49,8 +222,84 @@ class FunctionRegistry:
             The function name.
         fn : Callable
             The function to register.
+        lazy : bool, default False
+            If True, the function receives its arguments as `Thunk`s.
+        pure : bool, default False
+            Whether the function is deterministic and free of side effects.
+        arity : tuple[int, int | None], optional
+            Minimum and maximum number of arguments. Derived from the signature if omitted.
+        arg_kinds : tuple[Any, ...], optional
+            Expected kind of each argument. Derived from the annotations if omitted.
+        """
+        min_args, max_args, kinds = _signature(fn)
+        if arity is not None:
+            min_args, max_args = arity
+
+        self._specs[name.lower()] = FunctionSpec(
+            name=name,
+            function=fn,
+            pure=pure,
+            lazy=lazy,
+            min_args=min_args,
+            max_args=max_args,
+            arg_kinds=kinds if arg_kinds is None else arg_kinds,
+        )
+        self.version += 1
+
+    def vectorize(self, name: str) -> Callable:
+        """
+        Decorator to register the vectorized variant of a registered function.
+
+        The variant takes one sequence per argument (scalars are broadcast) and
+        returns a sequence of results.
+
+        Parameters
+        ----------
+        name : str
+            The name of the registered function.
+
+        Returns
+        -------
+        Callable
+            The decorator for use on functions.
+
+        Raises
+        ------
+        KeyError
+            If no function with the given name exists.
+        """
+
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            key = name.lower()
+            self._specs[key] = self.spec(name)._replace(vectorized=fn)
+            self.version += 1
+            return fn
+
+        return decorator
+
+    def spec(self, name: str) -> FunctionSpec:
+        """
+        Retrieve the specification of a function by name.
+
+        Parameters
+        ----------
+        name : str
+            The function name.
+
+        Returns
+        -------
+        FunctionSpec
+            The function and its metadata.
+
+        Raises
+        ------
+        KeyError
+            If no function with the given name exists.
         """
-        self._functions[name.lower()] = fn
+        spec = self._specs.get(name.lower())
+        if spec is None:
+            raise KeyError(f"Function '{name}' is not registered in the registry.")
+        return spec
 
     def get(self, name: str) -> Callable[..., Any]:
         """
@@ -71,10 +320,7 @@ class FunctionRegistry:
         KeyError
             If no function with the given name exists.
         """
-        key = name.lower()
-        if key not in self._functions:
-            raise KeyError(f"Function '{name}' is not registered in the registry.")
-        return self._functions[key]
+        return self.spec(name).function
 
     def contains(self, name: str) -> bool:
         """
@@ -90,7 +336,41 @@ class FunctionRegistry:
         bool
             True if registered, else False.
         """
-        return name.lower() in self._functions
+        return name.lower() in self._specs
+
+    def is_lazy(self, name: str) -> bool:
+        """
+        Check if a function receives its arguments lazily.
+
+        Parameters
+        ----------
+        name : str
+            The function name.
+
+        Returns
+        -------
+        bool
+            True if the function was registered with `lazy=True`, else False.
+        """
+        spec = self._specs.get(name.lower())
+        return spec is not None and spec.lazy
+
+    def is_pure(self, name: str) -> bool:
+        """
+        Check if a function is deterministic and free of side effects.
+
+        Parameters
+        ----------
+        name : str
+            The function name.
+
+        Returns
+        -------
+        bool
+            True if the function is registered and pure, else False.
+        """
+        spec = self._specs.get(name.lower())
+        return spec is not None and spec.pure
 
     def all_functions(self) -> Dict[str, Callable[..., Any]]:
         """
@@ -101,7 +381,18 @@ class FunctionRegistry:
         dict[str, Callable]
             A mapping of function names to callables.
         """
-        return dict(self._functions)
+        return {key: spec.function for key, spec in self._specs.items()}
+
+    def all_specs(self) -> Dict[str, FunctionSpec]:
+        """
+        Get the specifications of all registered functions.
+
+        Returns
+        -------
+        dict[str, FunctionSpec]
+            A mapping of function names to specifications.
+        """
+        return dict(self._specs)
 
 
 # Singleton registry instance (used by function groups and evaluator)
@@ -5,9 +5,10 @@ Conversion utilities for robust type casting in fabric_expression_builder (feb).
 import datetime
 import json
 import re
+from functools import lru_cache
 from typing import Any, Literal
 
-import pytz
+from fabrix.timezones import get_timezone
 
 
 def as_int(value: Any) -> int:
@@ -162,17 +163,48 @@ def as_datetime(
     timezone: str = "UTC",
     format: str | None = None,
 ) -> datetime.datetime:
+    """
+    Convert a value to a timezone-aware datetime.
+
+    Strings are parsed as ISO 8601 first (including fractional seconds, offsets,
+    `Z` and date-only values); parsed strings are cached. Naive values are
+    localized to `timezone`.
+
+    Parameters
+    ----------
+    value : str | int | float | datetime.datetime
+        A timestamp string, a POSIX timestamp or a datetime (returned as is).
+    timezone : str, default "UTC"
+        Timezone of naive values.
+    format : str, optional
+        A strptime format to parse strings with, instead of ISO 8601.
+
+    Returns
+    -------
+    datetime.datetime
+        The parsed datetime.
+
+    Raises
+    ------
+    ValueError
+        If the value cannot be parsed.
+    """
     if isinstance(value, datetime.datetime):
         return value
     if isinstance(value, (int, float)):
         date = datetime.datetime.fromtimestamp(value)
-        return pytz.timezone(timezone).localize(date)
+        return get_timezone(timezone).localize(date)  # type: ignore[attr-defined]
+    if format is None:
+        try:
+            return _parse_iso(str(value), timezone)
+        except ValueError:
+            pass
 
     format = format or "%Y-%m-%dT%H:%M:%S"
     for format in (format, "%Y-%m-%dT%H:%M:%S+%H:%M", "%Y-%m-%dT%H:%M:%S%z"):
         try:
             date = datetime.datetime.strptime(str(value), format)
-            return pytz.timezone(timezone).localize(date)
+            return get_timezone(timezone).localize(date)  # type: ignore[attr-defined]
         except ValueError as exc:
             if "Not naive datetime (tzinfo is already set)" in exc.args:
                 return datetime.datetime.strptime(str(value), format)
@@ -182,6 +214,15 @@ def as_datetime(
     raise ValueError(f"Cannot parse datetime: {value!r} with format: {format!r}")
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str, timezone: str) -> datetime.datetime:
+    # datetimes are immutable, so cached results can be shared by all callers
+    date = datetime.datetime.fromisoformat(value)
+    if date.tzinfo is None:
+        return get_timezone(timezone).localize(date)  # type: ignore[attr-defined]
+    return date
+
+
 def validate_timestamp_unit(unit: Literal["years", "months", "days", "hours", "minutes", "seconds"] | str):
     unit = unit.lower()
     if not unit.endswith("s"):
@@ -64,7 +64,22 @@ def validate_syntax(expression: str) -> None:
     _check_quotes(expression)
 
 
-def validate_function(func_name: str) -> None:
+def validate_function(func_name: str, span: tuple[int, int] | None = None) -> None:
+    """
+    Ensure a function is registered, suggesting the closest match otherwise.
+
+    Parameters
+    ----------
+    func_name : str
+        The function name.
+    span : tuple[int, int], optional
+        The (start, end) offsets of the name in the expression. Defaults to the name itself.
+
+    Raises
+    ------
+    FunctionNotFoundError
+        If no function with the given name is registered.
+    """
     if registry.contains(func_name):
         return
 
@@ -76,9 +91,41 @@ def validate_function(func_name: str) -> None:
         cutoff=0.6,
     )
     suggestion = suggestions[0] if suggestions else None
-    error_span = (0, len(func_name))
+    error_span = span or (0, len(func_name))
 
     suggestion = f" Did you mean '{suggestion}'?" if suggestion else ""
     message = f"Function '{func_name}' not found.{suggestion}"
 
     raise FunctionNotFoundError(message, span=error_span)
+
+
+def validate_arity(func_name: str, count: int, span: tuple[int, int] | None = None) -> None:
+    """
+    Ensure a function is called with a supported number of arguments.
+
+    Parameters
+    ----------
+    func_name : str
+        The function name.
+    count : int
+        The number of arguments of the call.
+    span : tuple[int, int], optional
+        The (start, end) offsets of the call in the expression.
+
+    Raises
+    ------
+    ExpressionSyntaxError
+        If the function does not accept `count` arguments.
+    """
+    spec = registry.spec(func_name)
+    if spec.accepts(count):
+        return
+
+    if spec.max_args is None:
+        expected = f"at least {spec.min_args}"
+    elif spec.min_args == spec.max_args:
+        expected = f"{spec.min_args}"
+    else:
+        expected = f"{spec.min_args} to {spec.max_args}"
+    noun = "argument" if expected == "1" else "arguments"
+    raise ExpressionSyntaxError(f"Function '{func_name}' expects {expected} {noun}, got {count}.", span=span)
@@ -0,0 +1,173 @@
+"""
+Column-wise evaluation of compiled expressions over batches of rows.
+
+Functions can register a vectorized variant (see `FunctionRegistry.vectorize`)
+that computes the results for a whole column of arguments at once with NumPy.
+If the outermost call of an expression has such a variant, `evaluate_many`
+evaluates blocks of rows column-wise: arguments that are not vectorized calls
+themselves (context lookups, other functions) are evaluated once per row, the
+vectorized calls once per block. Timestamps are passed between vectorized
+calls as `datetime64` arrays and returned as ISO strings, like the scalar
+date functions return them.
+
+NumPy is an optional extra (`pip install fabrix[numpy]`). Without it, no
+vectorized variants are registered and batches are evaluated row by row.
+"""
+
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from fabrix.compiler import CompiledExpression
+from fabrix.context import NULL_TRACE, Context, FrozenContext
+from fabrix.frame import EvaluationFrame
+from fabrix.nodes import FunctionCall, Literal, Node, Shared
+from fabrix.registry import registry
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None  # type: ignore[assignment]
+
+
+class _Column(NamedTuple):
+    """An argument evaluated once per row, at `position` in `VectorPlan.columns`."""
+
+    position: int
+
+
+class _Call(NamedTuple):
+    """A call of a vectorized variant."""
+
+    function: Any
+    args: tuple[Any, ...]
+
+
+class VectorPlan:
+    """
+    A compiled expression prepared for column-wise evaluation (see `vector_plan`).
+
+    Attributes
+    ----------
+    root : Any
+        The outermost vectorized call.
+    columns : tuple[Node, ...]
+        The argument nodes evaluated once per row.
+    slot_count : int
+        Number of common sub-expressions of the compiled expression.
+    """
+
+    __slots__ = ("root", "columns", "slot_count")
+
+    def __init__(self, root: Any, columns: tuple[Node, ...], slot_count: int = 0) -> None:
+        self.root = root
+        self.columns = columns
+        self.slot_count = slot_count
+
+    def evaluate(self, contexts: Iterable[Context | FrozenContext]) -> list[Any]:
+        """
+        Evaluate the expression for many contexts at once, without tracing.
+
+        Each context is only used while it is the current element of `contexts`,
+        so the caller may yield one context, mutated for every row.
+
+        Parameters
+        ----------
+        contexts : Iterable[Context | FrozenContext]
+            One context per row.
+
+        Returns
+        -------
+        list[Any]
+            One result per context, in order.
+
+        Raises
+        ------
+        Exception
+            Whatever an argument or a vectorized variant raises, for any of the rows.
+        """
+        columns: list[list[Any]] = [[] for _ in self.columns]
+        count = 0
+        for context in contexts:
+            frame = EvaluationFrame(context, NULL_TRACE, None, self.slot_count)
+            for column, node in zip(columns, self.columns):
+                column.append(node.evaluate(frame))
+            count += 1
+        if not count:
+            return []
+        return to_python(np.broadcast_to(np.asarray(_call(self.root, columns)), (count,)))
+
+
+def vector_plan(compiled: CompiledExpression) -> VectorPlan | None:
+    """
+    Prepare a compiled expression for column-wise evaluation.
+
+    Parameters
+    ----------
+    compiled : CompiledExpression
+        The compiled expression.
+
+    Returns
+    -------
+    VectorPlan | None
+        The plan, or None if NumPy is not installed or the outermost call of the
+        expression has no vectorized variant.
+    """
+    if np is None or _vectorized(compiled.root) is None:
+        return None
+    columns: list[Node] = []
+    root = _plan(compiled.root, columns)
+    return VectorPlan(root, tuple(columns), compiled.slot_count)
+
+
+def to_python(values: Any) -> list[Any]:
+    """
+    Convert an array of results to the values the scalar functions return.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The results; `datetime64` values are taken as UTC.
+
+    Returns
+    -------
+    list[Any]
+        Python values, with timestamps as ISO strings (e.g. `'2024-01-01T00:00:00+00:00'`).
+    """
+    if values.dtype.kind != "M":
+        return values.tolist()  # type: ignore[no-any-return]
+    text = np.datetime_as_string(values.astype("datetime64[us]"), unit="us").tolist()
+    # like `datetime.isoformat`, microseconds are only written if not zero
+    return [(value[:-7] if value.endswith(".000000") else value) + "+00:00" for value in text]
+
+
+def _vectorized(node: Node) -> Any:
+    """Return the vectorized variant of a call node, or None."""
+    if isinstance(node, Shared):
+        node = node.node
+    if not isinstance(node, FunctionCall) or node.lazy:
+        return None
+    try:
+        spec = registry.spec(node.name)
+    except KeyError:
+        return None
+    # the node binds the function registered at compile time
+    return spec.vectorized if spec.function is node.function else None
+
+
+def _plan(node: Node, columns: list[Node]) -> Any:
+    if isinstance(node, Literal):
+        return node
+    vectorized = _vectorized(node)
+    if vectorized is None:
+        columns.append(node)
+        return _Column(len(columns) - 1)
+    call = node.node if isinstance(node, Shared) else node
+    return _Call(vectorized, tuple(_plan(arg, columns) for arg in call.args))  # type: ignore[attr-defined]
+
+
+def _call(step: Any, columns: list[list[Any]]) -> Any:
+    if isinstance(step, _Call):
+        return step.function(*[_call(arg, columns) for arg in step.args])
+    if isinstance(step, _Column):
+        return columns[step.position]
+    return step.value
@@ -89,6 +89,7 @@ def test_base64_to_string(ctx: Context, expr: str, expected: str) -> None:
         ("@coalesce(null, true, false)", True),
         ("@coalesce(null, 'hello', 'world')", "hello"),
         ("@coalesce(null, null, null)", None),
+        ("@coalesce('first', variables('missing'))", "first"),
     ],
 )
 def test_coalesce(ctx: Context, expr: str, expected: str) -> None:
@@ -7,6 +7,7 @@ import pytz
 
 from fabrix.context import Context
 from fabrix.evaluate import evaluate
+from fabrix.functions.dates import shift_timestamps
 
 
 @pytest.fixture
@@ -95,6 +96,9 @@ def test_day_of_month(ctx: Context, expr: str, expected: int) -> None:
         ("@formatDateTime('2024-02-29T23:59:59', '%Y-%m-%d')", "2024-02-29"),
         ("@formatDateTime('2024-01-01T12:00:00', '%H:%M')", "12:00"),
         ("@formatDateTime('2024-12-31T23:59:59', '%d/%m/%Y')", "31/12/2024"),
+        ("@formatDateTime('2024-12-31T23:59:59.5', 'yyyy-MM-ddTHH:mm:ss.fffK')", "2024-12-31T23:59:59.500Z"),
+        ("@formatDateTime('2024-12-31T23:59:59', 'dd.MM.yyyy')", "31.12.2024"),
+        ("@formatDateTime('2024-12-31T23:59:59', 'o')", "2024-12-31T23:59:59.0000000Z"),
     ],
 )
 def test_format_datetime(ctx: Context, expr: str, expected: str) -> None:
@@ -200,6 +204,10 @@ def test_add_to_time(ctx: Context, expr: str, expected: str) -> None:
             "@convertFromUtc('2024-01-01T00:00:00', 'America/New_York')",
             "2023-12-31T19:00:00-05:00",
         ),
+        (
+            "@convertFromUtc('2024-01-01T00:00:00', 'Eastern Standard Time')",
+            "2023-12-31T19:00:00-05:00",
+        ),
     ],
 )
 def test_convert_from_utc(ctx: Context, expr: str, expected: str) -> None:
@@ -221,6 +229,10 @@ def test_convert_from_utc(ctx: Context, expr: str, expected: str) -> None:
             "@convertTimeZone('2024-01-01T12:00:00', 'UTC', 'America/New_York')",
             "2024-01-01T07:00:00-05:00",
         ),
+        (
+            "@convertTimeZone('2024-01-01T12:00:00', 'W. Europe Standard Time', 'Tokyo Standard Time')",
+            "2024-01-01T20:00:00+09:00",
+        ),
     ],
 )
 def test_convert_time_zone(ctx: Context, expr: str, expected: str) -> None:
@@ -242,6 +254,10 @@ def test_convert_time_zone(ctx: Context, expr: str, expected: str) -> None:
             "@convertToUtc('2024-01-01T12:00:00', 'UTC')",
             "2024-01-01T12:00:00+00:00",
         ),
+        (
+            "@convertToUtc('2024-07-01T12:00:00', 'India Standard Time')",
+            "2024-07-01T06:30:00+00:00",
+        ),
     ],
 )
 def test_convert_to_utc(ctx: Context, expr: str, expected: str) -> None:
@@ -328,3 +344,39 @@ def test_ticks(ctx: Context, expr: str, expected: int) -> None:
 )
 def test_utc_now(ctx: Context, expr: str, expected: str) -> None:
     assert evaluate(expr, ctx) == expected
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        ("@startOfDay(pipeline().TriggerTime)", "2024-05-06T00:00:00+00:00"),
+        ("@addHours(pipeline().TriggerTime, 1)", "2024-05-06T08:08:09.123456+00:00"),
+        ("@dayOfMonth('2024-05-06')", 6),
+    ],
+)
+def test_iso_timestamps_with_fractions(expr: str, expected: str | int) -> None:
+    context = Context(pipeline_scope_variables={"TriggerTime": "2024-05-06T07:08:09.123456Z"})
+    assert evaluate(expr, context) == expected
+
+
+@pytest.mark.parametrize(
+    "timestamps,interval,unit,expected",
+    [
+        (
+            ["2024-01-01T00:00:00", "2024-01-01T23:00:00"],
+            2,
+            "hours",
+            ["2024-01-01T02:00:00+00:00", "2024-01-02T01:00:00+00:00"],
+        ),
+        (["2024-03-31T00:00:00"], -1, "month", ["2024-02-29T00:00:00+00:00"]),
+        ([datetime.datetime(2024, 1, 1, tzinfo=pytz.UTC)], 90, "seconds", ["2024-01-01T00:01:30+00:00"]),
+        ([], 1, "days", []),
+    ],
+)
+def test_shift_timestamps(timestamps: list[Any], interval: int, unit: str, expected: list[str]) -> None:
+    assert shift_timestamps(timestamps, interval, unit) == expected
+
+
+def test_shift_timestamps_invalid_unit() -> None:
+    with pytest.raises(ValueError, match="Invalid unit"):
+        shift_timestamps(["2024-01-01T00:00:00"], 1, "weeks")
@@ -1,7 +1,10 @@
+from typing import Any
+
 import pytest
 
 from fabrix.context import Context
 from fabrix.evaluate import evaluate
+from fabrix.functions.logical import and_func, if_func, or_func
 
 
 @pytest.fixture
@@ -115,3 +118,35 @@ def test_greater_or_equals(ctx: Context, expr: str, expected: bool) -> None:
 )
 def test_less_or_equals(ctx: Context, expr: str, expected: bool) -> None:
     assert evaluate(expr, ctx) == expected
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        ("@if(true, 'yes', activity('Missing').output.value)", "yes"),
+        ("@if(false, variables('missing'), 'no')", "no"),
+        ("@and(false, activity('Missing').output.value)", False),
+        ("@or(true, variables('missing'))", True),
+    ],
+)
+def test_logical_short_circuit(ctx: Context, expr: str, expected: Any) -> None:
+    assert evaluate(expr, ctx) == expected
+
+
+def test_logical_short_circuit_evaluates_taken_branch(ctx: Context) -> None:
+    with pytest.raises(KeyError, match="No variable with name missing"):
+        evaluate("@and(true, variables('missing'))", ctx)
+
+
+def test_logical_short_circuit_trace(ctx: Context) -> None:
+    ctx.variables["a"] = "a"
+    evaluate("@if(true, toUpper(variables('a')), toLower(variables('a')))", ctx, trace=True)
+    labels = ctx.active_trace.labels
+    assert "toUpper" in labels
+    assert "toLower" not in labels
+
+
+def test_lazy_functions_called_directly() -> None:
+    assert if_func(True, "a", "b") == "a"
+    assert and_func(True, False) is False
+    assert or_func(False, True) is True
@@ -0,0 +1,79 @@
+from typing import Any
+
+import pytest
+
+from fabrix.functions import dates
+from fabrix.registry import registry
+
+np = pytest.importorskip("numpy")
+
+from fabrix.functions import vectorized  # noqa: E402
+
+TIMESTAMPS = [
+    "2024-01-31T10:30:00Z",
+    "2024-02-29T23:59:59.5Z",
+    "2023-12-31T00:00:00",
+    "1999-03-31T12:00:00.000001+00:00",
+]
+
+
+@pytest.mark.parametrize(
+    "name,scalar,args",
+    [
+        ("addDays", dates.add_days, (3,)),
+        ("addDays", dates.add_days, ("-40",)),
+        ("addToTime", dates.add_to_time, (1, "month")),
+        ("addToTime", dates.add_to_time, (-13, "months")),
+        ("addToTime", dates.add_to_time, (1, "year")),
+        ("addToTime", dates.add_to_time, (90, "minutes")),
+        ("startOfDay", dates.start_of_day, ()),
+        ("startOfMonth", dates.start_of_month, ()),
+        ("dayOfWeek", dates.day_of_week, ()),
+        ("ticks", dates.ticks, ()),
+        ("formatDateTime", dates.format_date_time, ()),
+        ("formatDateTime", dates.format_date_time, ("yyyy-MM-dd",)),
+        ("formatDateTime", dates.format_date_time, ("o",)),
+        ("formatDateTime", dates.format_date_time, ("ddd, dd MMM yyyy hh:mm:ss.fff tt K",)),
+        ("formatDateTime", dates.format_date_time, ("%d.%m.%Y %H:%M %Z",)),
+    ],
+)
+def test_vectorized_matches_scalar(name: str, scalar: Any, args: tuple[Any, ...]) -> None:
+    from fabrix.vectorize import to_python
+
+    spec = registry.spec(name)
+    assert spec.function is scalar
+    result = to_python(np.asarray(spec.vectorized(TIMESTAMPS, *args)))
+    assert result == [scalar(timestamp, *args) for timestamp in TIMESTAMPS]
+
+
+def test_datetime64_arrays() -> None:
+    timestamps = np.array(["2024-01-31T10:00", "2024-03-31T00:00"], dtype="datetime64[m]")
+    assert vectorized.add_to_time(timestamps, 1, "months").tolist() == [
+        np.datetime64("2024-02-29T10:00", "us").item(),
+        np.datetime64("2024-04-30T00:00", "us").item(),
+    ]
+    assert vectorized.day_of_week(timestamps).tolist() == [2, 6]
+    assert vectorized.add_days(timestamps, np.array([1, -1])).astype("datetime64[D]").tolist() == [
+        np.datetime64("2024-02-01").item(),
+        np.datetime64("2024-03-30").item(),
+    ]
+
+
+def test_as_datetime64() -> None:
+    result = vectorized.as_datetime64(["2024-01-01T00:00:00Z", "2024-01-01"])
+    assert result.dtype == np.dtype("datetime64[us]")
+    assert (result == np.datetime64("2024-01-01T00:00:00")).all()
+
+
+@pytest.mark.parametrize(
+    "call,error",
+    [
+        (lambda: vectorized.as_datetime64(["2024-01-01T00:00:00+02:00"]), ValueError),
+        (lambda: vectorized.add_to_time(TIMESTAMPS, 1, ["days", "days", "hours", "days"]), ValueError),
+        (lambda: vectorized.add_to_time(TIMESTAMPS, 1.5, "days"), TypeError),
+        (lambda: vectorized.format_date_time(TIMESTAMPS, ["o", "s", "o", "o"]), ValueError),
+    ],
+)
+def test_unsupported_arguments(call: Any, error: type[Exception]) -> None:
+    with pytest.raises(error):
+        call()
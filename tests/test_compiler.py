@@ -0,0 +1,303 @@
+import pickle
+
+import pytest
+
+import fabrix
+from fabrix.compiler import CompiledExpression, compile_expression
+from fabrix.context import NULL_TRACE, Context, Scope
+from fabrix.exceptions import ExpressionSyntaxError, FunctionNotFoundError
+from fabrix.frame import EvaluationFrame
+from fabrix.memo import MemoTable
+from fabrix.nodes import (
+    ActivityPath,
+    Constant,
+    FunctionCall,
+    Item,
+    Literal,
+    Parameter,
+    ScopeVariable,
+    Shared,
+    Template,
+    Variable,
+)
+from fabrix.registry import registry
+
+
+@pytest.mark.parametrize(
+    "expression,node_type",
+    [
+        ("@'abc'", Literal),
+        ("@42", Literal),
+        ("@pipeline().parameters.myString", Parameter),
+        ("@pipeline().RunId", ScopeVariable),
+        ("@variables('foo')", Variable),
+        ("@activity('CopyData').output.rows[0].value", ActivityPath),
+        ("@concat('a', variables('foo'))", FunctionCall),
+        ("@concat('a', 'b')", Constant),
+        ("Answer is: @{pipeline().parameters.myNumber}", Template),
+    ],
+)
+def test_compile_node_types(expression: str, node_type: type) -> None:
+    compiled = compile_expression(expression)
+    assert isinstance(compiled, CompiledExpression)
+    assert isinstance(compiled.root, node_type)
+
+
+def test_compile_function_arguments() -> None:
+    compiled = fabrix.compile("@add(1, mul(variables('foo'), 2))")
+    root = compiled.root
+    assert isinstance(root, FunctionCall)
+    assert root.name == "add"
+    assert isinstance(root.args[0], Literal)
+    assert isinstance(root.args[1], FunctionCall)
+    assert isinstance(root.args[1].args[0], Variable)
+
+
+def test_compiled_expression_reused_across_contexts() -> None:
+    compiled = fabrix.compile("@concat(variables('name'), '-', string(pipeline().parameters.idx))")
+    first = Context(variables={"name": "a"}, pipeline_parameters={"idx": 1})
+    second = Context(variables={"name": "b"}, pipeline_parameters={"idx": 2})
+
+    assert compiled.evaluate(first) == "a-1"
+    assert compiled.evaluate(second) == "b-2"
+    assert compiled.evaluate(first) == "a-1"
+    assert len(first._traces_) == 2
+
+
+def test_compiled_expression_matches_evaluate(ctx: Context) -> None:
+    expression = "@activity('CopyData').output.rows[add(1,1)].value"
+    assert fabrix.compile(expression).evaluate(ctx) == fabrix.evaluate(expression, ctx)
+
+
+@pytest.mark.parametrize(
+    "expression,exception",
+    [
+        ("@addd(1, 2)", FunctionNotFoundError),
+        ("@concat('a'", ExpressionSyntaxError),
+    ],
+)
+def test_compile_errors_raised_at_compile_time(expression: str, exception: type[Exception]) -> None:
+    with pytest.raises(exception):
+        fabrix.compile(expression)
+
+
+@pytest.mark.parametrize(
+    "expression,error,span",
+    [
+        ("@concat('a' 'b')", r"Expected ',' or '\)', got \"'b'\" at position 12\.", (12, 15)),
+        ("@pipeline().parameters", r"Expected '\.', got end of expression\.", (22, 22)),
+        ("@activity('CopyData').status", r"Expected 'output', got 'status' at position 22\.", (22, 28)),
+    ],
+)
+def test_compile_syntax_error_spans(expression: str, error: str, span: tuple[int, int]) -> None:
+    with pytest.raises(ExpressionSyntaxError, match=error) as exc_info:
+        fabrix.compile(expression)
+    assert exc_info.value.span == span
+
+
+@pytest.mark.parametrize(
+    "expression,error,span",
+    [
+        ("@toUpper('a', 'b')", r"Function 'toUpper' expects 1 argument, got 2\.", (1, 18)),
+        ("@if(true, 'a')", r"Function 'if' expects 3 arguments, got 2\.", (1, 14)),
+        ("@split()", r"Function 'split' expects 1 to 2 arguments, got 0\.", (1, 8)),
+        ("@concat('x', replace('a'))", r"Function 'replace' expects 3 arguments, got 1\.", (13, 25)),
+    ],
+)
+def test_compile_arity_errors(expression: str, error: str, span: tuple[int, int]) -> None:
+    with pytest.raises(ExpressionSyntaxError, match=error) as exc_info:
+        fabrix.compile(expression)
+    assert exc_info.value.span == span
+
+
+def test_compile_function_not_found_span() -> None:
+    with pytest.raises(FunctionNotFoundError) as exc_info:
+        fabrix.compile("@concat('a', toupperr('b'))")
+    assert exc_info.value.span == (13, 21)
+
+
+def test_compile_node_spans() -> None:
+    source = "@concat('a', variables( 'x' ))"
+    root = fabrix.compile(source).root
+    assert isinstance(root, FunctionCall)
+    variable = root.args[1]
+    assert variable.span is not None
+    assert source[variable.span[0] : variable.span[1]] == "variables( 'x' )"
+
+
+def test_compile_deeply_nested_expression() -> None:
+    depth = 200
+    expression = "@" + "concat('a', " * depth + "'b'" + ")" * depth
+    assert fabrix.compile(expression).evaluate() == "a" * depth + "b"
+
+
+def test_compiled_expression_pickles_as_text() -> None:
+    compiled = fabrix.compile("@concat('a', toUpper('b'))")
+    payload = pickle.dumps(compiled)
+    assert b"FunctionCall" not in payload
+    restored = pickle.loads(payload)
+    assert isinstance(restored, CompiledExpression)
+    assert restored.evaluate() == "aB"
+
+
+@pytest.mark.parametrize(
+    "expression,value",
+    [
+        ("@add(1, mul(4, 5))", 21),
+        ("@toUpper(concat('a', 'b'))", "AB"),
+        ("@if(equals(1, 1), 'yes', 'no')", "yes"),
+        ("Answer: @{toUpper('yes')}", "Answer: YES"),
+    ],
+)
+def test_constant_folding(expression: str, value: object) -> None:
+    root = fabrix.compile(expression).root
+    assert isinstance(root, Constant)
+    assert root.value == value
+    assert root.evaluate(EvaluationFrame(Context(), NULL_TRACE)) == value
+
+
+def test_constant_folding_keeps_dynamic_parts() -> None:
+    root = fabrix.compile("@concat(toUpper('abc'), variables('name'), utcNow(), guid())").root
+    assert isinstance(root, FunctionCall)
+    assert isinstance(root.args[0], Constant)
+    assert root.args[0].value == "ABC"
+    assert [type(arg) for arg in root.args[1:]] == [Variable, FunctionCall, FunctionCall]
+
+
+def test_unmarked_functions_not_folded_or_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(registry, "_specs", dict(registry._specs))
+    monkeypatch.setattr(registry, "version", registry.version)
+    counter = iter(range(10))
+    registry.add("nextNumber", lambda: next(counter))
+
+    compiled = fabrix.compile("@nextNumber()")
+    assert isinstance(compiled.root, FunctionCall)
+    memo = MemoTable()
+    assert [compiled.evaluate(memo=memo), compiled.evaluate(memo=memo)] == [0, 1]
+    assert len(memo) == 0
+
+
+def test_constant_folding_in_paths(ctx: Context) -> None:
+    compiled = fabrix.compile("@activity('CopyData').output.rows[add(1, 1)].value")
+    assert isinstance(compiled.root, ActivityPath)
+    assert isinstance(compiled.root.segments[1], Constant)
+    assert compiled.evaluate(ctx) == 30
+
+
+def test_constant_folding_skips_errors_and_mutable_results() -> None:
+    assert isinstance(fabrix.compile("@div(1, 0)").root, FunctionCall)
+    assert isinstance(fabrix.compile("@createArray(1, 2)").root, FunctionCall)
+
+
+def test_constant_folding_disabled() -> None:
+    assert isinstance(fabrix.compile("@add(1, 2)", optimize=False).root, FunctionCall)
+
+
+def test_constant_folding_trace(ctx: Context) -> None:
+    fabrix.compile("@concat(variables('bar'), toUpper('x'))").evaluate(ctx, trace=True)
+    assert "toUpper('x') ➜ 'X'" in ctx.active_trace.labels
+
+
+class _CountingOutput:
+    """Activity output counting the lookups of its `firstRow` attribute."""
+
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    @property
+    def firstRow(self) -> dict[str, str]:  # noqa: N802
+        self.lookups += 1
+        return {"x": "value", "y": "other"}
+
+
+def test_common_subexpressions_evaluated_once() -> None:
+    output = _CountingOutput()
+    context = Context(activities={"Lookup": {"output": output}})
+    compiled = fabrix.compile(
+        "@concat(activity('Lookup').output.firstRow.x, '/', toUpper(activity('Lookup').output.firstRow.x), '/', "
+        "activity('Lookup').output.firstRow.x, activity('Lookup').output.firstRow.y)"
+    )
+    assert compiled.slot_count == 1
+    assert compiled.evaluate(context) == "value/VALUE/valueother"
+    assert output.lookups == 2
+    assert compiled.evaluate(context) == "value/VALUE/valueother"
+    assert output.lookups == 4
+
+
+def test_common_subexpressions_structure() -> None:
+    root = fabrix.compile("@concat(toUpper(variables('a')), '-', toUpper(variables('a')), variables('a'))").root
+    assert isinstance(root, FunctionCall)
+    first, second, third = root.args[0], root.args[2], root.args[3]
+    assert isinstance(first, Shared) and isinstance(second, Shared)
+    assert first.slot == second.slot
+    # the variable inside the shared call is counted once, so it shares a slot with the bare lookup
+    assert isinstance(third, Shared)
+    assert third.slot != first.slot
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "@concat(guid(), guid())",
+        "@concat(variables('a'), variables('b'))",
+        "@concat(toUpper(variables('a')), toLower(variables('a')))",
+    ],
+)
+def test_common_subexpressions_not_shared(expression: str) -> None:
+    root = fabrix.compile(expression).root
+    assert isinstance(root, FunctionCall)
+    assert not any(isinstance(arg, Shared) for arg in root.args)
+
+
+def test_common_subexpressions_trace() -> None:
+    context = Context(variables={"a": "x"})
+    fabrix.compile("@concat(toUpper(variables('a')), toUpper(variables('a')))").evaluate(context, trace=True)
+    labels = context.active_trace.labels
+    assert labels.count("toUpper") == 1
+    assert "toUpper(variables('a')) ➜ 'X'" in labels
+
+
+@pytest.mark.parametrize(
+    "expression,accessor",
+    [
+        ("@activity('X').output", ()),
+        ("@activity('X').output.value[0].name", (("value", None), (0, 0), ("name", None))),
+        ("@activity('X').output.rows['key']", (("rows", None), ("key", None))),
+        ("@item().ids[add(1, 1)]", (("ids", None), (2.0, 2))),
+        ("@activity('X').output.rows[variables('i')]", None),
+    ],
+)
+def test_path_accessor_compiled(expression: str, accessor: tuple | None) -> None:
+    root = fabrix.compile(expression).root
+    assert isinstance(root, (ActivityPath, Item))
+    assert root.accessor == accessor
+
+
+@pytest.mark.parametrize(
+    "expression,output,expected",
+    [
+        ("@activity('X').output.value[1].name", {"value": [{"name": "a"}, {"name": "b"}]}, "b"),
+        ("@activity('X').output.value[-1]", {"value": (1, 2, 3)}, 3),
+        ("@activity('X').output.pipeline", Scope(Pipeline="P1"), "P1"),
+        ("@activity('X').output.rows['0']", {"rows": {"0": "zero"}}, "zero"),
+        ("@activity('X').output", None, None),
+    ],
+)
+@pytest.mark.parametrize("trace", [True, False])
+def test_path_accessor_matches_traced_path(expression: str, output: object, expected: object, trace: bool) -> None:
+    context = Context(activities={"X": {"output": output}})
+    assert fabrix.compile(expression).evaluate(context, trace=trace) == expected
+
+
+@pytest.mark.parametrize(
+    "expression,error",
+    [
+        ("@activity('X').output.value[5]", r"Invalid index/field \[5\]"),
+        ("@activity('X').output.missing", r"Missing field 'missing'"),
+        ("@activity('X').output.value.name", r"Missing field 'name'"),
+    ],
+)
+def test_path_accessor_errors_without_trace(expression: str, error: str) -> None:
+    context = Context(activities={"X": {"output": {"value": [1, 2]}}})
+    with pytest.raises(KeyError, match=error):
+        fabrix.compile(expression).evaluate(context, trace=False)
@@ -1,8 +1,12 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from rich.text import Text
 from rich.tree import Tree
 
-from fabrix.context import Context, ExpressionTraceback, Scope
+from fabrix.context import NULL_TRACE, Context, ExpressionTraceback, FrozenContext, NullTraceback, Scope, TraceNodeKind
+from fabrix.evaluate import evaluate
 
 
 @pytest.mark.parametrize(
@@ -54,11 +58,32 @@ def test_context_add_trace_and_active_trace() -> None:
     assert "My Trace" in c.active_trace.root.label.plain
 
 
+def test_context_add_trace_disabled() -> None:
+    c = Context(trace=False)
+    c.add_trace("My Trace")
+    assert len(c._traces_) == 0
+    assert c.active_trace is NULL_TRACE
+
+    c.add_trace("Forced", trace=True)
+    assert len(c._traces_) == 1
+    assert c.active_trace.enabled
+
+
+def test_null_trace_records_nothing() -> None:
+    t = NullTraceback("Expr")
+    t.add_parse_node("add(1, 2)")
+    node = t.add_function_node("add", result=3)
+    t.add_error("add(1, 2)", "boom")
+    assert node == 0
+    assert not t.enabled
+    assert len(t) == 1
+    assert t.root.children == []
+
+
 def test_trace_add_parse_and_literal_nodes() -> None:
     t = ExpressionTraceback("Expr")
     # Start parse node
     t.add_parse_node("substring('abc', 1, 2)")
-    parse_node = t._active_node
     # Add literal inside
     t.add_literal_node("'abc'")
     t.add_literal_node("1")
@@ -82,10 +107,10 @@ def test_trace_add_function_and_auto_pop_on_result() -> None:
     node = t.add_function_node("add", result=3)
     # After result, function node should have been popped from stack
     # but still present under the parse node
+    assert t.stack == [0, t.parents[node]]
     root = t.root
     parse_node = root.children[0]
     func_node = parse_node.children[0]
-    assert func_node is node
     assert "Function: add" in func_node.label.plain  # type: ignore
     assert "➜ 3" in func_node.label.plain  # type: ignore
 
@@ -101,13 +126,14 @@ def test_trace_variable_parameter_scope_nodes_and_results() -> None:
     t.add_parameter_node("bar", result="bar")
     t.add_function_node("concat(variables('foo'), pipeline().parameters.bar)", result="bazbar", node=func_node)
 
-    # We expect three children appended in order
-    labels = [str(ch.label) for ch in func_node.children]
+    # We expect the children appended in order below the rendered function node
+    func_tree = t.root.children[0].children[0]
+    labels = [str(ch.label) for ch in func_tree.children]
 
     assert any("variables('foo')" in L for L in labels)
     assert any("pipeline().parameters.bar" in L for L in labels)
     # variable node shows result arrow
-    var_node = next(ch for ch in func_node.children if "variables('foo')" in ch.label.plain)  # type: ignore
+    var_node = next(ch for ch in func_tree.children if "variables('foo')" in ch.label.plain)  # type: ignore
     assert "➜ 'baz'" in var_node.label.plain  # type: ignore
 
 
@@ -124,3 +150,211 @@ def test_trace_add_error_with_span_highlight() -> None:
     # And it has a child node with the message
     err_msg_node = parse_node.children[-1].children[0]
     assert "Function 'concatt' not found" in err_msg_node.label.plain  # type: ignore
+
+
+def test_context_trace_limit_keeps_most_recent() -> None:
+    c = Context(trace_limit=2)
+    for title in ("first", "second", "third"):
+        c.add_trace(title)
+        c.close_trace()
+
+    assert [trace.root.label.plain for trace in c._traces_] == ["second", "third"]  # type: ignore[union-attr]
+
+
+def test_context_trace_retention_errors() -> None:
+    c = Context(trace_retention="errors")
+    c.add_trace("ok")
+    c.close_trace()
+    c.add_trace("failed")
+    c.active_trace.add_error("x", "boom")
+    c.close_trace()
+
+    assert len(c._traces_) == 1
+    assert c._traces_[0].has_error
+
+
+def test_context_trace_retention_errors_on_evaluation(ctx: Context) -> None:
+    ctx.trace_retention = "errors"
+    evaluate("@variables('foo')", ctx)
+    with pytest.raises(KeyError):
+        evaluate("@variables('missing')", ctx)
+
+    assert len(ctx._traces_) == 1
+
+
+def test_context_trace_retention_render(ctx: Context, capsys: pytest.CaptureFixture[str]) -> None:
+    ctx.trace_retention = "render"
+    evaluate("@variables('foo')", ctx, show_output=True)
+
+    assert "variables('foo')" in capsys.readouterr().out
+    assert len(ctx._traces_) == 0
+
+
+def test_trace_records_flat_nodes_and_renders_lazily() -> None:
+    t = ExpressionTraceback("Expr")
+    t.add_parse_node("add(1, 2)", span=(1, 10))
+    node = t.add_function_node("add")
+    t.add_literal_node("1")
+    t.add_function_node("add", result=3, node=node)
+    assert t._rendered is None
+
+    assert t.kinds == [TraceNodeKind.ROOT, TraceNodeKind.PARSE, TraceNodeKind.FUNCTION, TraceNodeKind.LITERAL]
+    assert t.parents == [-1, 0, 1, 2]
+    assert t.results[node] == 3
+    assert t.spans[1] == (1, 10)
+
+    rendered = t.render()
+    assert t.root is rendered
+    t.add_literal_node("2")
+    assert t.root is not rendered
+
+
+def test_trace_to_dict() -> None:
+    t = ExpressionTraceback("Expr")
+    t.add_variable_node("foo", result={"a": 1})
+
+    data = t.to_dict()
+    assert data["title"] == "Expr"
+    assert data["nodes"][1] == {
+        "kind": "variable",
+        "label": "foo",
+        "parent": 0,
+        "result": "{'a': 1}",
+        "span": None,
+        "detail": None,
+    }
+
+
+def test_context_pickle_drops_traces(ctx: Context) -> None:
+    evaluate("@concat('a', 'b')", ctx)
+    ctx.active_trace.render()
+
+    restored = pickle.loads(pickle.dumps(ctx))
+    assert restored.variables == ctx.variables
+    assert restored.activities == ctx.activities
+    assert len(restored._traces_) == 0
+    assert len(ctx._traces_) == 1
+    assert evaluate("@variables('foo')", restored) == 10
+
+
+def test_context_shared_across_threads() -> None:
+    c = Context(variables={f"v{index}": index for index in range(8)}, trace_limit=1000)
+
+    def work(index: int) -> list[int]:
+        expression = f"@add(variables('v{index}'), 1)"
+        return [evaluate(expression, c, trace=True) for _ in range(50)]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(work, range(8)))
+
+    assert results == [[index + 1] * 50 for index in range(8)]
+    assert len(c._traces_) == 400
+    for trace in c._traces_:
+        # every trace holds exactly one complete evaluation
+        assert trace.stack == [0]
+        assert trace.kinds.count(TraceNodeKind.FUNCTION) == 1
+        assert trace.results[2] == int(trace.labels[1][len("add(variables('v") : -len("'), 1)")]) + 1
+
+
+def test_context_add_trace_returns_trace() -> None:
+    c = Context()
+    trace = c.add_trace("Mine")
+    c.add_trace("Other")
+    c.close_trace(trace)
+    assert c._traces_[0] is trace
+    assert c.active_trace is c._traces_[1]
+
+
+def test_iter_activity_output() -> None:
+    context = Context(activities={"Lookup": {"output": {"value": [{"id": 1}, {"id": 2}], "count": 2}}})
+    assert list(context.iter_activity_output("Lookup", "value")) == [{"id": 1}, {"id": 2}]
+    with pytest.raises(TypeError, match=r"activity\('Lookup'\).output\['count'\] is not an array"):
+        context.iter_activity_output("Lookup", "count")
+    with pytest.raises(KeyError, match="Missing field 'rows'"):
+        context.iter_activity_output("Lookup", "rows")
+
+
+def test_context_child_layers_over_parent() -> None:
+    parent = Context(variables={"a": 1, "b": 2}, pipeline_parameters={"p": "x"}, item={"id": 0})
+    child = parent.child(item={"id": 1}, variables={"b": 3})
+
+    assert child.get_variable("a") == 1
+    assert child.get_variable("b") == 3
+    assert child.get_parameter("p") == "x"
+    assert evaluate("@concat(string(item().id), string(variables('b')))", child) == "13"
+
+    child.set_variable("c", 4)
+    assert child.get_variable("c") == 4
+    assert "c" not in parent.variables
+    assert parent.variables == {"a": 1, "b": 2}
+    assert parent.item == {"id": 0}
+    assert parent.child().item == {"id": 0}
+
+
+def test_context_child_sees_parent_updates_and_pickles() -> None:
+    parent = Context(variables={"a": 1})
+    child = parent.child(item=5).child(variables={"b": 2})
+    parent.variables["late"] = True
+
+    assert child.get_variable("late") is True
+    assert child.get_item() == 5
+    restored = pickle.loads(pickle.dumps(child))
+    assert restored.get_variable("b") == 2
+    assert restored.get_variable("a") == 1
+
+
+def test_frozen_context_evaluates_like_context() -> None:
+    context = Context(
+        variables={"a": "x"},
+        pipeline_parameters={"p": 1},
+        activities={"Lookup": {"output": {"firstRow": {"v": "y"}}}},
+        pipeline_scope_variables=Scope(Pipeline="P1", TriggeredByPipelineName=None),
+        item={"id": 7},
+    )
+    frozen = context.freeze()
+    expression = (
+        "@concat(variables('a'), string(pipeline().parameters.p), activity('Lookup').output.firstRow.v, "
+        "pipeline().Pipeline, string(item().id))"
+    )
+    assert isinstance(frozen, FrozenContext)
+    assert frozen.scope["RunId"] == context.pipeline_scope_variables.run_id
+    assert evaluate(expression, frozen) == evaluate(expression, context) == "x1yP17"
+
+
+def test_frozen_context_variables_do_not_reach_source() -> None:
+    context = Context(variables={"a": 1})
+    frozen = context.freeze()
+    frozen.set_variable("b", 2)
+    assert frozen.get_variable("b") == 2
+    assert context.variables == {"a": 1}
+
+
+def test_frozen_context_scope_errors() -> None:
+    frozen = Context().freeze()
+    with pytest.raises(KeyError, match="Alias 'Nope' not found"):
+        frozen.get_pipeline_scope_variable("Nope")
+    with pytest.raises(AttributeError, match="Invalid pipeline scope variable"):
+        frozen.get_pipeline_scope_variable("TriggeredByPipelineName")
+
+
+def test_frozen_context_child_traces_and_thaw() -> None:
+    frozen = Context(variables={"a": 1}).freeze()
+    child = frozen.child(item=2, variables={"b": 3})
+    assert evaluate("@add(item(), variables('b'))", child) == 5
+    assert "b" not in frozen.variables
+    assert len(frozen._traces_) == 1
+    assert frozen.active_trace is NULL_TRACE
+
+    thawed = frozen.thaw()
+    assert isinstance(thawed, Context)
+    assert thawed.variables == {"a": 1}
+    assert thawed.pipeline_scope_variables.run_id == frozen.scope["RunId"]
+
+
+def test_frozen_context_pickles_without_traces() -> None:
+    frozen = Context(variables={"a": 1}).freeze()
+    evaluate("@variables('a')", frozen)
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert restored.get_variable("a") == 1
+    assert restored.scope == frozen.scope
+    assert len(restored._traces_) == 0
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fabrix.datetime_format import compile_format, format_datetime
+
+UTC = datetime(2024, 3, 5, 17, 8, 9, 123400, tzinfo=timezone.utc)
+NAIVE = datetime(2024, 3, 5, 7, 8, 9)
+OFFSET = datetime(2024, 3, 5, 7, 8, 9, tzinfo=timezone(timedelta(hours=-5, minutes=-30)))
+
+
+@pytest.mark.parametrize(
+    "value,fmt,expected",
+    [
+        (UTC, "yyyy-MM-ddTHH:mm:ss.fffZ", "2024-03-05T17:08:09.123Z"),
+        (UTC, "yyyy-MM-dd HH:mm:ss.fffffff", "2024-03-05 17:08:09.1234000"),
+        (UTC, "HH:mm:ss.FFFFFFF", "17:08:09.1234"),
+        (NAIVE, "HH:mm:ss.FFF", "07:08:09"),
+        (UTC, "d/M/yy h:m:s t", "5/3/24 5:8:9 P"),
+        (UTC, "hh:mm tt", "05:08 PM"),
+        (UTC, "ddd, dd MMM yyyy", "Tue, 05 Mar 2024"),
+        (UTC, "dddd MMMM", "Tuesday March"),
+        (UTC, "y yyy yyyyy", "24 2024 02024"),
+        (OFFSET, "z zz zzz K", "-5 -05 -05:30 -05:30"),
+        (NAIVE, "yyyyK", "2024"),
+        (UTC, "'Year' yyyy \\y \"{lit}\"", "Year 2024 y {lit}"),
+        (UTC, "%d", "5"),
+        (UTC, "g", "03/05/2024 17:08"),
+    ],
+)
+def test_custom_formats(value: datetime, fmt: str, expected: str) -> None:
+    assert compile_format(fmt)(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value,fmt,expected",
+    [
+        (UTC, "o", "2024-03-05T17:08:09.1234000Z"),
+        (NAIVE, "o", "2024-03-05T07:08:09.0000000"),
+        (OFFSET, "O", "2024-03-05T07:08:09.0000000-05:30"),
+        (UTC, "s", "2024-03-05T17:08:09"),
+        (OFFSET, "u", "2024-03-05 12:38:09Z"),
+        (OFFSET, "R", "Tue, 05 Mar 2024 12:38:09 GMT"),
+        (UTC, "D", "Tuesday, 05 March 2024"),
+        (UTC, "d", "03/05/2024"),
+        (UTC, "T", "17:08:09"),
+        (UTC, "M", "March 05"),
+        (UTC, "Y", "2024 March"),
+    ],
+)
+def test_standard_formats(value: datetime, fmt: str, expected: str) -> None:
+    assert format_datetime(value, fmt) == expected
+
+
+def test_strftime_patterns_kept() -> None:
+    assert format_datetime(UTC, "%Y/%m/%d %H") == "2024/03/05 17"
+
+
+@pytest.mark.parametrize("fmt,expected", [("%d", "05"), ("%m", "03"), ("%M", "08"), ("%H", "17")])
+def test_single_percent_specifier_is_strftime(fmt: str, expected: str) -> None:
+    # a lone "%x" is a strftime pattern too, not a .NET single custom specifier
+    assert format_datetime(UTC, fmt) == expected
+
+
+def test_formats_compiled_once() -> None:
+    assert compile_format("yyyy-MM-dd") is compile_format("yyyy-MM-dd")
+
+
+@pytest.mark.parametrize(
+    "fmt,error",
+    [
+        ("Q", "Invalid standard date and time format string"),
+        ("ss.ffffffff", "Too many fraction specifiers"),
+        ("yyyy 'open", "Unterminated quoted string"),
+        ("yyyy\\", "Invalid escape"),
+    ],
+)
+def test_invalid_formats(fmt: str, error: str) -> None:
+    with pytest.raises(ValueError, match=error):
+        compile_format(fmt)
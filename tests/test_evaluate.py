@@ -1,10 +1,13 @@
+import json
 from contextlib import contextmanager
 
 import pytest
 
+import fabrix
 from fabrix.context import Context
-from fabrix.evaluate import evaluate
+from fabrix.evaluate import ExpressionCache, RowResult, evaluate, evaluate_many, expression_cache
 from fabrix.exceptions import ExpressionSyntaxError, FunctionNotFoundError
+from fabrix.registry import registry
 
 
 @pytest.mark.parametrize(
@@ -70,6 +73,28 @@ def test_activity_expressions_errors(ctx: Context, expr: str, error_pattern: str
         evaluate(expr, ctx)
 
 
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        ("@pipeline().parameters.config.name", "etl"),
+        ("@pipeline().parameters.config.tables[1].id", 2),
+        ("@{pipeline().parameters.config['tables'][0].id}", "1"),
+        ("@pipeline().parameters.config.tables[pipeline().parameters.idx].id", 2),
+        ("@toUpper(pipeline().parameters.config.name)", "ETL"),
+    ],
+)
+def test_nested_parameter_expressions(expr: str, expected: object) -> None:
+    context = Context(pipeline_parameters={"config": {"name": "etl", "tables": [{"id": 1}, {"id": 2}]}, "idx": 1})
+    assert evaluate(expr, context) == expected
+    assert evaluate(expr, context, trace=False) == expected
+
+
+def test_nested_parameter_expressions_errors() -> None:
+    context = Context(pipeline_parameters={"config": {"name": "etl"}})
+    with pytest.raises(KeyError, match=r"Missing field 'missing' on pipeline\(\)\.parameters\.config path\."):
+        evaluate("@pipeline().parameters.config.missing", context)
+
+
 @pytest.mark.parametrize(
     "expr,exception,error",
     [
@@ -98,3 +123,211 @@ def test_activity_expressions_errors(ctx: Context, expr: str, error_pattern: str
 def test_expressions_validation(ctx: Context, expr: str, exception: type[Exception], error: str) -> None:
     with pytest.raises(exception, match=error):
         evaluate(expr, ctx)
+
+
+def test_expression_cache_hits_and_misses(ctx: Context) -> None:
+    cache = ExpressionCache()
+    first = cache.get("@variables('foo')")
+    second = cache.get("@variables('foo')")
+
+    assert first is second
+    assert first.evaluate(ctx) == 10
+    info = cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+
+def test_expression_cache_evicts_least_recently_used() -> None:
+    cache = ExpressionCache(max_entries=2)
+    cache.get("@'a'")
+    cache.get("@'b'")
+    cache.get("@'a'")
+    cache.get("@'c'")
+
+    assert cache.info().evictions == 1
+    cache.get("@'a'")
+    cache.get("@'b'")
+    assert cache.info().misses == 4
+
+
+def test_expression_cache_max_bytes() -> None:
+    cache = ExpressionCache(max_entries=None, max_bytes=10)
+    cache.get("@'abc'")
+    cache.get("@'defgh'")
+
+    info = cache.info()
+    assert info.entries == 1
+    assert info.bytes == len("@'defgh'")
+
+
+def test_expression_cache_invalidated_on_registration(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the registration is undone after the test, so it does not leak into other tests
+    monkeypatch.setattr(registry, "_specs", dict(registry._specs))
+    monkeypatch.setattr(registry, "version", registry.version)
+    cache = ExpressionCache()
+    cache.get("@'a'")
+    registry.add("cacheProbe", lambda: "probe")
+
+    assert cache.get("@cacheProbe()").evaluate() == "probe"
+    cache.get("@'a'")
+    assert cache.info().misses == 3
+
+
+def test_evaluate_uses_process_cache(ctx: Context) -> None:
+    expression_cache.clear()
+    evaluate("@variables('bar')", ctx)
+    evaluate("@variables('bar')", ctx)
+
+    assert expression_cache.info().hits == 1
+
+
+def test_evaluate_without_trace(ctx: Context) -> None:
+    result = evaluate("@activity('CopyData').output.rows[add(1,1)].value", ctx, trace=False)
+    assert result == 30
+    assert len(ctx._traces_) == 0
+
+
+def test_run_without_trace(ctx: Context) -> None:
+    assert fabrix.run("@add(1, 2)", "@toUpper('x')", context=ctx, trace=False) == "X"
+    assert len(ctx._traces_) == 0
+
+
+@pytest.mark.parametrize(
+    "expr,item,expected",
+    [
+        ("@item()", "abc", "abc"),
+        ("@item().name", {"name": "a"}, "a"),
+        ("@item().ids[1]", {"ids": [1, 2]}, 2),
+        ("@concat(item().name, '-', string(item()?.n))", {"name": "a", "n": 1}, "a-1"),
+        ("Row @{item().name}", {"name": "a"}, "Row a"),
+    ],
+)
+def test_item_expressions(expr: str, item: object, expected: object) -> None:
+    assert evaluate(expr, Context(item=item)) == expected
+
+
+@pytest.mark.parametrize(
+    "expr,item,error_pattern",
+    [
+        ("@item()", None, r"No item\(\) available outside of a ForEach iteration\."),
+        ("@item().missing", {"name": "a"}, r"Missing field 'missing' on item\(\) path\."),
+        ("@item()[5]", [1, 2], r"Invalid index/field \[5\] on item\(\) path\."),
+    ],
+)
+def test_item_expressions_errors(expr: str, item: object, error_pattern: str) -> None:
+    with pytest.raises(KeyError, match=error_pattern):
+        evaluate(expr, Context(item=item))
+
+
+def test_evaluate_many_rows_bound_as_item(ctx: Context) -> None:
+    rows = [{"name": "a"}, {"name": "b"}]
+    results = evaluate_many("@concat(item().name, string(variables('foo')))", rows, ctx)
+    assert results == [RowResult(0, "a10"), RowResult(1, "b10")]
+    assert ctx.item is None
+    assert len(ctx._traces_) == 0
+
+
+def test_evaluate_many_rows_bound_as_variables(ctx: Context) -> None:
+    rows = [{"foo": 1}, {"foo": 2, "bar": "x"}]
+    results = evaluate_many("@concat(string(variables('foo')), variables('bar'))", rows, ctx, bind="variables")
+    assert [result.value for result in results] == ["1baz", "2x"]
+    assert ctx.variables["foo"] == 10
+
+
+def test_evaluate_many_contexts() -> None:
+    contexts = [Context(variables={"x": index}) for index in range(3)]
+    results = evaluate_many("@mul(variables('x'), 2)", contexts)
+    assert [result.value for result in results] == [0, 2, 4]
+
+
+def test_evaluate_many_captures_errors_per_row() -> None:
+    results = evaluate_many("@item().name", [{"name": "a"}, {}, {"name": "c"}])
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, KeyError)
+    assert results[1].value is None
+    assert results[2] == RowResult(2, "c")
+
+
+def test_evaluate_many_raise_errors() -> None:
+    with pytest.raises(KeyError, match="Missing field 'name'"):
+        evaluate_many("@item().name", [{"name": "a"}, {}], raise_errors=True)
+
+
+def test_evaluate_many_lazy() -> None:
+    results = evaluate_many("@item()", iter(range(3)), lazy=True)
+    assert not isinstance(results, list)
+    assert [result.value for result in results] == [0, 1, 2]
+
+
+def test_evaluate_many_compile_error_raised_before_rows() -> None:
+    with pytest.raises(FunctionNotFoundError):
+        evaluate_many("@nope(item())", [1], lazy=True)
+
+
+def test_evaluate_many_accepts_compiled_expression() -> None:
+    compiled = fabrix.compile("@add(item(), 1)")
+    assert [result.value for result in fabrix.evaluate_many(compiled, [1, 2])] == [2, 3]
+
+
+def test_evaluate_many_with_trace_stores_traces(ctx: Context) -> None:
+    evaluate_many("@item()", [1, 2], ctx, trace=True)
+    assert len(ctx._traces_) == 2
+    assert ctx._traces_[0].details[2] == ""
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_evaluate_many_parallel_preserves_order_and_errors(ctx: Context, executor: str) -> None:
+    rows = [{"n": index} if index % 7 else {} for index in range(50)]
+    serial = evaluate_many("@add(item().n, variables('foo'))", rows, ctx)
+    parallel = evaluate_many("@add(item().n, variables('foo'))", rows, ctx, workers=2, executor=executor, chunksize=8)
+    assert [(result.position, result.value, result.ok) for result in parallel] == [
+        (result.position, result.value, result.ok) for result in serial
+    ]
+    assert [result.position for result in parallel if not result.ok] == list(range(0, 50, 7))
+
+
+def test_evaluate_many_parallel_raise_errors() -> None:
+    with pytest.raises(KeyError, match="Missing field 'n'"):
+        evaluate_many("@item().n", [{"n": 1}, {}], workers=2, executor="thread", raise_errors=True)
+
+
+def test_evaluate_many_parallel_lazy_unsized_input() -> None:
+    results = evaluate_many("@mul(item(), 2)", iter(range(5)), workers=2, executor="thread", lazy=True)
+    assert [result.value for result in results] == [0, 2, 4, 6, 8]
+
+
+def test_evaluate_many_parallel_reads_rows_as_consumed() -> None:
+    consumed = []
+
+    def rows():
+        for row in range(1000):
+            consumed.append(row)
+            yield row
+
+    results = evaluate_many("@item()", rows(), workers=2, executor="thread", chunksize=10, lazy=True)
+    assert next(results).value == 0
+    assert len(consumed) <= 50
+    assert [result.value for result in results] == list(range(1, 1000))
+
+
+def test_evaluate_many_streams_activity_output(tmp_path) -> None:
+    path = tmp_path / "lookup.json"
+    path.write_text(json.dumps({"value": [{"name": f"n{i}"} for i in range(100)]}))
+    context = Context()
+    context.set_activity_output_from_file("Lookup", path)
+
+    results = evaluate_many(
+        "@toUpper(item().name)", context.iter_activity_output("Lookup", "value"), context, lazy=True
+    )
+    assert [result.value for result in results] == [f"N{i}" for i in range(100)]
+
+
+def test_evaluate_many_unknown_executor() -> None:
+    with pytest.raises(ValueError, match="Unknown executor 'gpu'"):
+        evaluate_many("@item()", [1], workers=2, executor="gpu")  # type: ignore[arg-type]
+
+
+def test_evaluate_many_frozen_context(ctx: Context) -> None:
+    frozen = ctx.freeze()
+    results = evaluate_many("@concat(variables('bar'), item())", ["a", "b"], frozen)
+    assert [result.value for result in results] == ["baza", "bazb"]
+    assert frozen.item is None
@@ -0,0 +1,174 @@
+import json
+import pickle
+import time
+from pathlib import Path
+
+import pytest
+
+import fabrix
+from fabrix import lazyjson
+from fabrix.context import Context
+from fabrix.lazyjson import LazyArray, LazyObject
+
+PAYLOAD = {
+    "count": 3,
+    "value": [
+        {"id": 1, "name": "a", "tags": ["x", "y"]},
+        {"id": 2, "name": 'b "quoted" ]}', "tags": []},
+        {"id": 3, "name": "ü\\n", "nested": {"deep": [1.5, None, True]}},
+    ],
+    "empty": {},
+    "flag": False,
+}
+
+
+@pytest.fixture
+def payload_file(tmp_path: Path) -> Path:
+    path = tmp_path / "output.json"
+    path.write_text(json.dumps(PAYLOAD, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_load_views(payload_file: Path) -> None:
+    root = lazyjson.load(payload_file)
+    assert isinstance(root, LazyObject)
+    assert list(root) == ["count", "value", "empty", "flag"]
+    assert root["count"] == 3
+    assert root["flag"] is False
+    assert root.get("missing") is None
+
+    rows = root["value"]
+    assert isinstance(rows, LazyArray)
+    assert root["value"] is rows
+    assert rows[0]["id"] == 1
+    assert len(rows._starts) == 1
+    assert len(rows) == 3
+    assert rows[1]["name"] == 'b "quoted" ]}'
+    assert rows[-1]["nested"]["deep"].materialize() == [1.5, None, True]
+    assert root["empty"].materialize() == {}
+
+
+def test_iteration_streams_elements(payload_file: Path) -> None:
+    rows = lazyjson.load(payload_file)["value"]
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert rows._starts == []
+
+
+def test_stream_parses_plain_elements(payload_file: Path) -> None:
+    rows = lazyjson.load(payload_file)["value"]
+    assert list(rows.stream()) == PAYLOAD["value"]
+    assert rows._starts == []
+
+
+def test_materialize_matches_json(payload_file: Path) -> None:
+    root = lazyjson.load(payload_file)
+    assert root.materialize() == PAYLOAD
+    assert lazyjson.materialize(root["value"]) == PAYLOAD["value"]
+    assert lazyjson.materialize(5) == 5
+
+
+def test_scalar_and_array_roots(tmp_path: Path) -> None:
+    scalar = tmp_path / "scalar.json"
+    scalar.write_text(' "text" ')
+    assert lazyjson.load(scalar) == "text"
+
+    array = tmp_path / "array.json"
+    array.write_text("[ ]")
+    assert list(lazyjson.load(array)) == []
+
+
+@pytest.mark.parametrize("text", ['{"a" 1}', '{"a": 1 "b": 2}', '{"a": [1, 2'])
+def test_invalid_json(tmp_path: Path, text: str) -> None:
+    path = tmp_path / "invalid.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        dict(lazyjson.load(path))
+
+
+@pytest.mark.parametrize("text", ['{"a": 1', '{"a": 1, ', '{"a"', '{"a": ', "[1, 2", '["a', "  \n"])
+def test_truncated_json(tmp_path: Path, text: str) -> None:
+    path = tmp_path / "truncated.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        lazyjson.materialize(lazyjson.load(path))
+    with pytest.raises(ValueError):
+        root = lazyjson.load(path)
+        list(root.items() if isinstance(root, LazyObject) else root)
+
+
+def test_truncated_container_fails_fast(tmp_path: Path) -> None:
+    # an unterminated container used to backtrack exponentially in the structure scan
+    path = tmp_path / "truncated.json"
+    path.write_text('{"a": [' + "1, " * 10_000)
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match="Unterminated JSON container"):
+        lazyjson.load(path)["a"].end
+    assert time.perf_counter() - started < 1
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.json"
+    path.write_text("")
+    with pytest.raises(ValueError, match="is empty"):
+        lazyjson.load(path)
+
+
+def test_views_pickle_by_path(payload_file: Path) -> None:
+    rows = lazyjson.load(payload_file)["value"]
+    restored = pickle.loads(pickle.dumps(rows))
+    assert restored.materialize() == PAYLOAD["value"]
+
+
+@pytest.mark.parametrize("trace", [True, False])
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("@activity('Lookup').output.count", 3),
+        ("@activity('Lookup').output.value[1].name", 'b "quoted" ]}'),
+        ("@activity('Lookup').output.value[add(1, 1)].nested.deep[0]", 1.5),
+        ("@activity('Lookup').output.value[variables('i')].tags", ["x", "y"]),
+        ("@length(activity('Lookup').output.value)", 3),
+        ("@activity('Lookup').output.empty", {}),
+    ],
+)
+def test_activity_output_from_file(payload_file: Path, expression: str, expected: object, trace: bool) -> None:
+    context = Context(variables={"i": 0})
+    context.set_activity_output_from_file("Lookup", payload_file)
+    assert fabrix.evaluate(expression, context, trace=trace) == expected
+
+
+def test_activity_output_from_file_missing_field(payload_file: Path) -> None:
+    context = Context()
+    context.set_activity_output_from_file("Lookup", payload_file)
+    with pytest.raises(KeyError, match="Missing field 'missing'"):
+        fabrix.compile("@activity('Lookup').output.value[0].missing").evaluate(context)
+
+
+def test_object_values_parsed_on_access(payload_file: Path) -> None:
+    root = lazyjson.load(payload_file)
+    assert root["count"] == 3
+    assert list(root._starts) == ["count", "value", "empty", "flag"]
+    assert list(root._values) == ["count"]
+    assert root["empty"].materialize() == {}
+    assert list(root._values) == ["count", "empty"]
+
+
+def test_array_elements_parsed_once(payload_file: Path) -> None:
+    rows = lazyjson.load(payload_file)["value"]
+    first = rows[0]
+    assert rows[0] is first
+    assert rows[-3] is first
+    assert rows[0]["name"] == "a"
+    assert rows[0]["name"] == "a"
+    assert list(first._values) == ["name"]
+    assert rows[-1]["nested"] is rows[2]["nested"]
+
+
+def test_duplicate_keys_keep_last(tmp_path: Path) -> None:
+    path = tmp_path / "duplicates.json"
+    path.write_text('{"a": 1, "b": {"a": 2, "a": 3}, "a": 4}')
+    root = lazyjson.load(path)
+    assert root["a"] == 4
+    assert root["b"]["a"] == 3
+    assert dict(root["b"]) == {"a": 3}
+    assert root.materialize() == json.loads(path.read_text())
@@ -0,0 +1,68 @@
+import pytest
+
+from fabrix.exceptions import ExpressionSyntaxError
+from fabrix.lexer import TokenKind, tokenize
+
+
+def test_tokenize_expression_with_spans() -> None:
+    source = "@concat('it''s', variables('x'))"
+    tokens = tokenize(source)
+
+    assert [token.kind for token in tokens] == [
+        TokenKind.AT,
+        TokenKind.IDENTIFIER,
+        TokenKind.LPAREN,
+        TokenKind.STRING,
+        TokenKind.COMMA,
+        TokenKind.IDENTIFIER,
+        TokenKind.LPAREN,
+        TokenKind.STRING,
+        TokenKind.RPAREN,
+        TokenKind.RPAREN,
+        TokenKind.END,
+    ]
+    string = tokens[3]
+    assert string.value == "it's"
+    assert source[string.start : string.end] == "'it''s'"
+
+
+def test_tokenize_skips_whitespace_and_encoded_linebreaks() -> None:
+    tokens = tokenize("@add(\\n 1,\n\t2 )")
+    assert [token.value for token in tokens if token.kind is TokenKind.NUMBER] == ["1", "2"]
+
+
+@pytest.mark.parametrize(
+    "source,kinds",
+    [
+        ("plain text", [TokenKind.TEXT]),
+        ("mail@@home", [TokenKind.TEXT, TokenKind.TEXT, TokenKind.TEXT]),
+        (
+            "a @{pipeline().RunId} b",
+            [
+                TokenKind.TEXT,
+                TokenKind.INTERPOLATION_START,
+                TokenKind.IDENTIFIER,
+                TokenKind.LPAREN,
+                TokenKind.RPAREN,
+                TokenKind.DOT,
+                TokenKind.IDENTIFIER,
+                TokenKind.INTERPOLATION_END,
+                TokenKind.TEXT,
+            ],
+        ),
+    ],
+)
+def test_tokenize_templates(source: str, kinds: list[TokenKind]) -> None:
+    assert [token.kind for token in tokenize(source)] == [*kinds, TokenKind.END]
+
+
+@pytest.mark.parametrize(
+    "source,error",
+    [
+        ("@concat('abc", r"Unterminated string literal at position 8\."),
+        ("value: @{variables('x')", r"Interpolation '@\{' not closed"),
+    ],
+)
+def test_tokenize_errors(source: str, error: str) -> None:
+    with pytest.raises(ExpressionSyntaxError, match=error):
+        tokenize(source)
@@ -0,0 +1,107 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import fabrix
+from fabrix.context import Context
+from fabrix.evaluate import evaluate, evaluate_many
+from fabrix.memo import MemoInfo, MemoTable
+
+
+def test_memo_table_hits_and_misses() -> None:
+    calls: list[str] = []
+
+    def upper(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    memo = MemoTable()
+    assert memo.call(upper, ["a"]) == "A"
+    assert memo.call(upper, ["a"]) == "A"
+    assert memo.call(upper, ["b"]) == "B"
+    assert calls == ["a", "b"]
+    assert memo.info() == MemoInfo(hits=1, misses=2, entries=2, max_entries=1024)
+
+    memo.clear()
+    assert len(memo) == 0
+    assert memo.info().hits == 0
+
+
+def test_memo_table_distinguishes_equal_values_of_other_types() -> None:
+    memo = MemoTable()
+    assert memo.call(str, [1]) == "1"
+    assert memo.call(str, [True]) == "True"
+    assert memo.call(str, [1.0]) == "1.0"
+
+
+def test_memo_table_skips_unhashable_arguments() -> None:
+    memo = MemoTable()
+    assert memo.call(len, [[1, 2]]) == 2
+    assert len(memo) == 0
+    assert memo.info().misses == 0
+
+
+def test_memo_table_skips_mutable_results() -> None:
+    memo = MemoTable()
+    first = memo.call(str.split, ["a b"])
+    first.append("c")
+    assert memo.call(str.split, ["a b"]) == ["a", "b"]
+    assert len(memo) == 0
+
+
+def test_memo_table_shared_between_threads() -> None:
+    memo = MemoTable(max_entries=8)
+    values = [str(value % 20) for value in range(2000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda value: memo.call(str.zfill, [value, 3]), values))
+    assert results == [value.zfill(3) for value in values]
+    assert len(memo) <= 8
+    assert memo.info().hits + memo.info().misses == len(values)
+
+
+def test_memo_table_pickled_empty() -> None:
+    memo = MemoTable(max_entries=16)
+    memo.call(str.upper, ["a"])
+    restored = pickle.loads(pickle.dumps(memo))
+    assert restored.info() == MemoInfo(hits=0, misses=0, entries=0, max_entries=16)
+
+
+@pytest.mark.parametrize("max_entries,expected", [(2, 2), (0, 0), (None, 3)])
+def test_memo_table_size_limit(max_entries: int | None, expected: int) -> None:
+    memo = MemoTable(max_entries=max_entries)
+    for value in ("a", "b", "c"):
+        memo.call(str.upper, [value])
+    assert len(memo) == expected
+
+
+def test_evaluate_with_memo(ctx: Context) -> None:
+    expression = "@concat(" + ", ".join(["toUpper(variables('bar'))"] * 5) + ")"
+    assert evaluate(expression, ctx, memo=True) == "BAZ" * 5
+    assert evaluate(expression, ctx) == "BAZ" * 5
+
+
+def test_shared_memo_across_evaluations(ctx: Context) -> None:
+    memo = MemoTable()
+    compiled = fabrix.compile("@concat(toUpper(variables('bar')), toUpper(variables('bar')))", optimize=False)
+    compiled.evaluate(ctx, memo=memo)
+    compiled.evaluate(ctx, memo=memo)
+    # the outer concat has the same arguments in both evaluations as well
+    assert memo.info().hits == 4
+    assert memo.info().misses == 2
+
+
+def test_memo_skips_volatile_functions() -> None:
+    memo = MemoTable()
+    first = fabrix.compile("@guid()").evaluate(memo=memo)
+    second = fabrix.compile("@guid()").evaluate(memo=memo)
+    assert first != second
+    assert len(memo) == 0
+
+
+def test_evaluate_many_with_batch_memo() -> None:
+    memo = MemoTable()
+    rows = [{"day": "2024-01-01T00:00:00"}] * 4
+    results = evaluate_many("@dayOfYear(addDays(item().day, 3))", rows, memo=memo)
+    assert [result.value for result in results] == [4] * 4
+    assert memo.info().hits == 6
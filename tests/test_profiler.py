@@ -0,0 +1,56 @@
+import fabrix
+from fabrix.context import Context, ExpressionTraceback
+from fabrix.profiler import ProfileReport
+
+
+def test_timed_trace_records_durations() -> None:
+    t = ExpressionTraceback("Expr", timed=True)
+    t.add_parse_node("add(1, 2)")
+    t.add_function_node("add", result=3)
+    t.pop()
+
+    assert len(t.starts) == len(t.ends) == len(t)
+    assert t.duration(1) >= t.duration(2) >= 0
+    assert "duration_ns" in t.to_dict()["nodes"][1]
+
+
+def test_untimed_trace_has_no_durations() -> None:
+    t = ExpressionTraceback("Expr")
+    t.add_parse_node("add(1, 2)")
+    assert t.starts == []
+    assert t.duration(1) == 0
+
+
+def test_profile_aggregates_per_name(ctx: Context) -> None:
+    report = fabrix.profile(
+        "@concat(toUpper(variables('bar')), string(activity('CopyData').output.rows[0].value))",
+        ctx,
+        repeat=3,
+    )
+
+    assert isinstance(report, ProfileReport)
+    assert report.repeat == 3
+    assert len(ctx._traces_) == 0
+    assert set(report.stats) == {"concat", "toUpper", "string", "variables('bar')", "activity('CopyData')"}
+    assert all(stats.calls == 3 for stats in report.stats.values())
+
+    concat = report.stats["concat"]
+    assert concat.cumulative_ns >= concat.self_ns
+    assert concat.cumulative_ns >= report.stats["toUpper"].cumulative_ns
+
+
+def test_profile_slowest_and_collapsed_stacks(ctx: Context) -> None:
+    report = fabrix.profile("@concat(toUpper(variables('bar')), 'x')", ctx, repeat=2)
+
+    slowest = report.slowest(1)
+    assert slowest[0][0] == "concat(toUpper(variables('bar')), 'x')"
+
+    lines = report.collapsed().splitlines()
+    stacks = {line.rsplit(" ", 1)[0] for line in lines}
+    assert stacks == {"concat", "concat;toUpper", "concat;toUpper;variables('bar')"}
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in lines)
+
+
+def test_profile_render(ctx: Context) -> None:
+    table = fabrix.profile("@add(variables('foo'), 2)", ctx).render()
+    assert table.row_count == 2
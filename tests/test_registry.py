@@ -0,0 +1,100 @@
+import pytest
+
+import fabrix.functions  # noqa: F401  (registers the built-in functions)
+from fabrix.registry import FunctionRegistry, Thunk, force, registry
+
+
+def test_register_and_get() -> None:
+    functions = FunctionRegistry()
+
+    @functions.register("myFunc")
+    def my_func(value: int) -> int:
+        return value + 1
+
+    assert functions.contains("MYFUNC")
+    assert functions.get("myfunc") is my_func
+    assert not functions.is_lazy("myFunc")
+    assert functions.version == 1
+
+
+def test_get_unknown_raises() -> None:
+    with pytest.raises(KeyError, match="Function 'nope' is not registered"):
+        FunctionRegistry().get("nope")
+
+
+def test_register_lazy() -> None:
+    functions = FunctionRegistry()
+    functions.add("first", lambda *args: force(args[0]), lazy=True)
+    assert functions.is_lazy("FIRST")
+
+    functions.add("first", lambda *args: args[0])
+    assert not functions.is_lazy("first")
+
+
+def test_thunk_evaluates_once() -> None:
+    calls: list[int] = []
+
+    def compute(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    thunk = Thunk(compute, 21)
+    assert repr(thunk) == "Thunk(<pending>)"
+    assert thunk() == 42
+    assert force(thunk) == 42
+    assert calls == [21]
+    assert repr(thunk) == "Thunk(42)"
+
+
+def test_spec_derived_from_signature() -> None:
+    functions = FunctionRegistry()
+
+    @functions.register("pad")
+    def pad(value: str, width: int, fill: str = " ") -> str:
+        return value.rjust(width, fill)
+
+    spec = functions.spec("PAD")
+    assert spec.name == "pad"
+    assert spec.function is pad
+    assert (spec.min_args, spec.max_args) == (2, 3)
+    assert spec.arg_kinds == (str, int, str)
+    assert not spec.pure and not spec.lazy
+    assert spec.vectorized is None
+    assert spec.accepts(2) and spec.accepts(3)
+    assert not spec.accepts(1) and not spec.accepts(4)
+
+
+def test_spec_variadic_and_explicit_metadata() -> None:
+    functions = FunctionRegistry()
+    functions.add("sum", lambda *values: sum(values), pure=True)
+    functions.add("now", lambda *args: 0, pure=False, arity=(0, 1), arg_kinds=(str,))
+
+    assert (functions.spec("sum").min_args, functions.spec("sum").max_args) == (0, None)
+    now = functions.spec("now")
+    assert (now.min_args, now.max_args, now.arg_kinds) == (0, 1, (str,))
+    assert functions.is_pure("sum")
+    assert not functions.is_pure("now")
+    assert not functions.is_pure("unknown")
+
+
+def test_vectorize() -> None:
+    functions = FunctionRegistry()
+    functions.add("double", lambda value: value * 2)
+
+    @functions.vectorize("double")
+    def double_many(values: list[int]) -> list[int]:
+        return [value * 2 for value in values]
+
+    assert functions.spec("double").vectorized is double_many
+    assert functions.version == 2
+
+    with pytest.raises(KeyError):
+        functions.vectorize("missing")(double_many)
+
+
+@pytest.mark.parametrize(
+    "name,pure",
+    [("toUpper", True), ("concat", True), ("utcNow", False), ("guid", False), ("getFutureTime", False)],
+)
+def test_builtin_purity(name: str, pure: bool) -> None:
+    assert registry.is_pure(name) is pure
@@ -0,0 +1,30 @@
+import pytest
+import pytz
+
+from fabrix.timezones import WINDOWS_TIMEZONES, get_timezone
+
+
+@pytest.mark.parametrize(
+    "name,zone",
+    [
+        ("W. Europe Standard Time", "Europe/Berlin"),
+        ("Pacific Standard Time", "America/Los_Angeles"),
+        ("UTC", "UTC"),
+        ("Europe/Paris", "Europe/Paris"),
+    ],
+)
+def test_get_timezone(name: str, zone: str) -> None:
+    assert get_timezone(name).zone == zone  # type: ignore[attr-defined]
+
+
+def test_get_timezone_cached() -> None:
+    assert get_timezone("GMT Standard Time") is get_timezone("GMT Standard Time")
+
+
+def test_get_timezone_unknown() -> None:
+    with pytest.raises(pytz.UnknownTimeZoneError):
+        get_timezone("Nowhere Standard Time")
+
+
+def test_windows_timezones_map_to_known_zones() -> None:
+    assert set(WINDOWS_TIMEZONES.values()) <= pytz.all_timezones_set
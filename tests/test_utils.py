@@ -5,7 +5,15 @@ from typing import Any
 import pytest
 import pytz
 
-from fabrix.utils import as_bool, as_datetime, as_float, as_int, as_string, validate_timestamp_unit
+from fabrix.utils import (
+    _parse_iso,
+    as_bool,
+    as_datetime,
+    as_float,
+    as_int,
+    as_string,
+    validate_timestamp_unit,
+)
 
 
 @pytest.mark.parametrize(
@@ -114,6 +122,38 @@ def test_as_datetime_invalid() -> None:
         as_datetime("notadatetime")
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2024-01-01T10:20:30.123456+00:00", datetime.datetime(2024, 1, 1, 10, 20, 30, 123456, tzinfo=pytz.UTC)),
+        ("2024-01-01T10:20:30.5Z", datetime.datetime(2024, 1, 1, 10, 20, 30, 500000, tzinfo=pytz.UTC)),
+        ("2024-01-01", datetime.datetime(2024, 1, 1, tzinfo=pytz.UTC)),
+        (
+            "2024-01-01T10:20:30+02:00",
+            datetime.datetime(2024, 1, 1, 10, 20, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+        ),
+    ],
+)
+def test_as_datetime_iso_formats(value: str, expected: datetime.datetime) -> None:
+    assert as_datetime(value) == expected
+
+
+def test_as_datetime_localizes_naive_strings() -> None:
+    dt = as_datetime("2024-07-01T12:00:00", "Europe/Berlin")
+    assert dt.utcoffset() == datetime.timedelta(hours=2)
+
+
+def test_as_datetime_custom_format() -> None:
+    assert as_datetime("01.02.2024", format="%d.%m.%Y") == datetime.datetime(2024, 2, 1, tzinfo=pytz.UTC)
+
+
+def test_as_datetime_caches_parsed_strings() -> None:
+    _parse_iso.cache_clear()
+    first = as_datetime("2024-03-04T05:06:07")
+    assert as_datetime("2024-03-04T05:06:07") is first
+    assert _parse_iso.cache_info().hits == 1
+
+
 # --- validate_timestamp_unit ---
 @pytest.mark.parametrize(
     "value,expected",
@@ -0,0 +1,122 @@
+from typing import Any
+
+import pytest
+
+import fabrix
+from fabrix.context import Context
+from fabrix.evaluate import evaluate_many
+
+np = pytest.importorskip("numpy")
+
+from fabrix.vectorize import VectorPlan, to_python, vector_plan  # noqa: E402
+
+ROWS = ["2024-01-31T10:30:00Z", "2024-02-29T23:59:59.5Z", "2023-12-31T00:00:00"]
+
+
+@pytest.mark.parametrize(
+    "expression,vectorized",
+    [
+        ("@formatDateTime(addDays(item(), 1), 'yyyy-MM-dd')", True),
+        ("@ticks(startOfMonth(item()))", True),
+        ("@addToTime(pipeline().parameters.start, item(), 'hours')", True),
+        ("@toUpper(formatDateTime(item()))", False),
+        ("@item()", False),
+    ],
+)
+def test_vector_plan(expression: str, vectorized: bool) -> None:
+    plan = vector_plan(fabrix.compile(expression))
+    assert isinstance(plan, VectorPlan) is vectorized
+
+
+def test_vector_plan_columns() -> None:
+    plan = vector_plan(fabrix.compile("@formatDateTime(addDays(item(), variables('n')), 'yyyy-MM-dd')"))
+    assert plan is not None
+    assert [node.text for node in plan.columns] == ["item()", "variables('n')"]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "@formatDateTime(addDays(item(), 1), 'yyyy-MM-dd')",
+        "@addToTime(startOfDay(item()), -1, 'month')",
+        "@dayOfWeek(item())",
+        "@ticks(item())",
+        "@formatDateTime(item(), concat('yyyy', '-MM'))",
+        "@formatDateTime(item(), '%d')",
+        "@formatDateTime(item(), '%m')",
+        "@formatDateTime(item(), '%Y/%m/%d')",
+    ],
+)
+def test_evaluate_many_vectorized_matches_row_by_row(expression: str) -> None:
+    vectorized = evaluate_many(expression, ROWS)
+    assert vectorized == evaluate_many(expression, ROWS, vectorize=False)
+    assert [result.position for result in vectorized] == [0, 1, 2]
+
+
+def test_evaluate_many_vectorized_calls_once_per_block(mocker: Any) -> None:
+    spy = mocker.spy(fabrix.functions.vectorized, "as_datetime64")
+    rows = ROWS * 3000
+    results = evaluate_many("@dayOfWeek(item())", rows, lazy=True)
+    assert next(results).value == 2
+    assert spy.call_count == 1
+    assert [result.value for result in results][-3:] == [2, 3, 6]
+    assert spy.call_count == 3
+
+
+def test_evaluate_many_datetime64_rows() -> None:
+    rows = np.arange("2024-01-01T00", "2024-01-01T03", dtype="datetime64[h]")
+    results = evaluate_many("@addToTime(item(), 30, 'minutes')", rows)
+    assert [result.value for result in results] == [
+        "2024-01-01T00:30:00+00:00",
+        "2024-01-01T01:30:00+00:00",
+        "2024-01-01T02:30:00+00:00",
+    ]
+
+
+def test_evaluate_many_bound_variables() -> None:
+    context = Context(variables={"unit": "days"})
+    rows = [{"start": "2024-01-01", "n": 1}, {"start": "2024-02-28", "n": 2}]
+    results = evaluate_many(
+        "@addToTime(variables('start'), variables('n'), variables('unit'))", rows, context, bind="variables"
+    )
+    assert [result.value for result in results] == ["2024-01-02T00:00:00+00:00", "2024-03-01T00:00:00+00:00"]
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        ["2024-01-01T00:00:00+02:00", "2024-01-01T00:00:00Z"],
+        ["2024-01-01T00:00:00Z", "invalid"],
+    ],
+)
+def test_evaluate_many_falls_back_row_by_row(rows: list[str]) -> None:
+    results = evaluate_many("@addDays(item(), 1)", rows)
+    expected = evaluate_many("@addDays(item(), 1)", rows, vectorize=False)
+    assert [(result.value, type(result.error)) for result in results] == [
+        (result.value, type(result.error)) for result in expected
+    ]
+    assert results[0].ok
+
+
+def test_evaluate_many_fallback_raises_errors() -> None:
+    with pytest.raises(ValueError, match="Cannot parse datetime"):
+        evaluate_many("@addDays(item(), 1)", ["2024-01-01", "invalid"], raise_errors=True)
+
+
+def test_evaluate_many_traced_rows_not_vectorized() -> None:
+    context = Context()
+    results = evaluate_many("@startOfDay(item())", ROWS, context, trace=True)
+    assert results[0].value == "2024-01-31T00:00:00+00:00"
+    assert len(context._traces_) == 3
+
+
+def test_evaluate_many_vectorized_workers() -> None:
+    expression = "@formatDateTime(addDays(item(), 1), 'yyyy-MM-dd')"
+    results = evaluate_many(expression, ROWS * 10, workers=2, executor="thread", chunksize=7)
+    assert results == evaluate_many(expression, ROWS * 10, vectorize=False)
+
+
+def test_to_python() -> None:
+    values = np.array(["2024-01-01T00:00:00", "2024-01-01T00:00:00.25"], dtype="datetime64[us]")
+    assert to_python(values) == ["2024-01-01T00:00:00+00:00", "2024-01-01T00:00:00.250000+00:00"]
+    assert to_python(np.array([1, 2])) == [1, 2]